@@ -1,42 +1,106 @@
-"""Pinergy API client — reverse-engineered from the official Android app."""
-
-from pinergy_client.client import PinergyClient
-from pinergy_client.exceptions import PinergyAPIError, PinergyAuthError
-from pinergy_client.models import (
-    BaseResponse,
-    LoginResponse,
-    BalanceResponse,
-    TopUpResponse,
-    UsagesResponse,
-    CompareResponse,
-    ConfigInfoResponse,
-    DefaultInfoResponse,
-    GetPrefsResponse,
-    NotificationSettingsResponse,
-    ActiveTopUpsResponse,
-    TopUpHistoryResponse,
-    LandLordCheckResponse,
-    CredoraxHPPLinkReturn,
-    LevelPayUsage,
-)
-
-__all__ = [
-    "PinergyClient",
-    "PinergyAPIError",
-    "PinergyAuthError",
-    "BaseResponse",
-    "LoginResponse",
-    "BalanceResponse",
-    "TopUpResponse",
-    "UsagesResponse",
-    "CompareResponse",
-    "ConfigInfoResponse",
-    "DefaultInfoResponse",
-    "GetPrefsResponse",
-    "NotificationSettingsResponse",
-    "ActiveTopUpsResponse",
-    "TopUpHistoryResponse",
-    "LandLordCheckResponse",
-    "CredoraxHPPLinkReturn",
-    "LevelPayUsage",
-]
+"""Pinergy API client — reverse-engineered from the official Android app.
+
+Public names are imported on first access (PEP 562), so ``import pinergy_client`` (and the
+CLI) does not pull in requests, asyncio or the models until they are actually used.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pinergy_client.async_client import AsyncPinergyClient
+    from pinergy_client.cache import ResponseCache
+    from pinergy_client.client import PinergyClient
+    from pinergy_client.fleet import PinergyFleet
+    from pinergy_client.pool import PinergyClientPool
+    from pinergy_client.watch import BalanceWatcher
+    from pinergy_client.breaker import BreakerPolicy
+    from pinergy_client.exceptions import (
+        PinergyAPIError,
+        PinergyAuthError,
+        PinergyCassetteError,
+        PinergyCircuitOpenError,
+        PinergyDeadlineExceeded,
+        PinergyRateLimitError,
+    )
+    from pinergy_client.ratelimit import RateLimiter
+    from pinergy_client.hedge import HedgePolicy
+    from pinergy_client.metrics import EndpointMetrics, RequestEvent
+    from pinergy_client.debuglog import DebugLog
+    from pinergy_client.cassette import Cassette
+    from pinergy_client.transport import RetryPolicy
+    from pinergy_client.models import (
+        BaseResponse,
+        LoginResponse,
+        BalanceResponse,
+        TopUpResponse,
+        UsagesResponse,
+        CompareResponse,
+        ConfigInfoResponse,
+        DefaultInfoResponse,
+        GetPrefsResponse,
+        NotificationSettingsResponse,
+        ActiveTopUpsResponse,
+        TopUpHistoryResponse,
+        LandLordCheckResponse,
+        CredoraxHPPLinkReturn,
+        LevelPayUsage,
+    )
+
+_MODELS = "pinergy_client.models"
+
+# public name -> defining module
+_LAZY = {
+    "PinergyClient": "pinergy_client.client",
+    "AsyncPinergyClient": "pinergy_client.async_client",
+    "PinergyFleet": "pinergy_client.fleet",
+    "PinergyClientPool": "pinergy_client.pool",
+    "BalanceWatcher": "pinergy_client.watch",
+    "RetryPolicy": "pinergy_client.transport",
+    "HedgePolicy": "pinergy_client.hedge",
+    "BreakerPolicy": "pinergy_client.breaker",
+    "RateLimiter": "pinergy_client.ratelimit",
+    "ResponseCache": "pinergy_client.cache",
+    "RequestEvent": "pinergy_client.metrics",
+    "EndpointMetrics": "pinergy_client.metrics",
+    "DebugLog": "pinergy_client.debuglog",
+    "Cassette": "pinergy_client.cassette",
+    "PinergyAPIError": "pinergy_client.exceptions",
+    "PinergyAuthError": "pinergy_client.exceptions",
+    "PinergyDeadlineExceeded": "pinergy_client.exceptions",
+    "PinergyCircuitOpenError": "pinergy_client.exceptions",
+    "PinergyRateLimitError": "pinergy_client.exceptions",
+    "PinergyCassetteError": "pinergy_client.exceptions",
+    "BaseResponse": _MODELS,
+    "LoginResponse": _MODELS,
+    "BalanceResponse": _MODELS,
+    "TopUpResponse": _MODELS,
+    "UsagesResponse": _MODELS,
+    "CompareResponse": _MODELS,
+    "ConfigInfoResponse": _MODELS,
+    "DefaultInfoResponse": _MODELS,
+    "GetPrefsResponse": _MODELS,
+    "NotificationSettingsResponse": _MODELS,
+    "ActiveTopUpsResponse": _MODELS,
+    "TopUpHistoryResponse": _MODELS,
+    "LandLordCheckResponse": _MODELS,
+    "CredoraxHPPLinkReturn": _MODELS,
+    "LevelPayUsage": _MODELS,
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,61 @@
+"""Level Pay analytics over the columnar LevelPayUsage models.
+
+All functions work on the flat ``array("d")`` columns in LevelPayDaily / PlanMatrix and
+reduce them with strided slices and builtin ``sum`` (C loops), instead of walking nested
+dicts per cell.
+"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from typing import Sequence
+
+from pinergy_client.models import LevelPayDaily, PlanMatrix
+
+
+def column_means(values: array, n_columns: int) -> array:
+    """Mean of each column of a row-major rows × n_columns array."""
+    if not n_columns:
+        return array("d")
+    n_rows = len(values) // n_columns
+    if not n_rows:
+        return array("d", [0.0] * n_columns)
+    return array("d", (sum(values[c::n_columns]) / n_rows for c in range(n_columns)))
+
+
+def slot_averages(daily: LevelPayDaily) -> tuple[array, array]:
+    """Average kWh and € per half-hour slot across all days."""
+    return (
+        column_means(daily.half_hourly_kwh, daily.n_slots),
+        column_means(daily.half_hourly_euro, daily.n_slots),
+    )
+
+
+def top_n(values: Sequence[float], n: int = 5) -> list[int]:
+    """Indices of the n largest values, largest first (ties keep index order)."""
+    return heapq.nlargest(n, range(len(values)), key=values.__getitem__)
+
+
+def peak_slots(daily: LevelPayDaily, n: int = 5) -> tuple[list[tuple[str, float]], list[tuple[str, float]]]:
+    """Top-n (slot label, average) pairs by kWh and by €."""
+    avg_kwh, avg_euro = slot_averages(daily)
+    labels = daily.slot_labels
+    return (
+        [(labels[i], avg_kwh[i]) for i in top_n(avg_kwh, n)],
+        [(labels[i], avg_euro[i]) for i in top_n(avg_euro, n)],
+    )
+
+
+def plan_totals(matrix: PlanMatrix) -> dict[str, float]:
+    """Total per plan across all periods."""
+    n = matrix.n_periods
+    return {plan: sum(matrix.values[p * n : (p + 1) * n]) for p, plan in enumerate(matrix.plans)}
+
+
+def period_totals(matrix: PlanMatrix) -> array:
+    """Total per period across all plans."""
+    n = matrix.n_periods
+    if not matrix.plans:
+        return array("d", [0.0] * n)
+    return array("d", (sum(matrix.values[i::n]) for i in range(n)))
@@ -0,0 +1,182 @@
+"""Fixed-width binary archive of half-hourly kWh / € for one meter, read via mmap.
+
+Layout (little-endian)::
+
+    header    64 bytes   magic, version, slots per day, first day (ordinal), day count, premises
+    day index n_days     one byte per day: 1 if the day has readings, 0 if it is a gap
+    padding   0-7        to 8-byte alignment
+    kWh       n_days × n_slots float64, row-major by day
+    €         n_days × n_slots float64, row-major by day
+
+Days are contiguous from the first day, so the byte offset of any (day, slot) is computed
+directly; readers hand out memoryview slices of the mapped file without copying.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pinergy_client.store import UsageStore
+
+MAGIC = b"PNGYHH01"
+VERSION = 1
+HEADER = struct.Struct("<8sHHiI32s12x")
+HEADER_SIZE = HEADER.size  # 64
+DEFAULT_SLOTS = 48
+_NATIVE_LITTLE = sys.byteorder == "little"
+
+
+def _data_offset(n_days: int) -> int:
+    return HEADER_SIZE + (n_days + 7) // 8 * 8
+
+
+def write_archive(
+    path: str | os.PathLike[str],
+    premises: str,
+    start_day: date,
+    kwh: array,
+    euro: array,
+    n_slots: int = DEFAULT_SLOTS,
+    present: bytes | None = None,
+) -> None:
+    """Write (atomically replace) an archive; kwh / euro are days × n_slots float arrays."""
+    if len(kwh) != len(euro) or len(kwh) % n_slots:
+        raise ValueError("kwh and euro must both hold n_days * n_slots values")
+    n_days = len(kwh) // n_slots
+    present = present if present is not None else b"\x01" * n_days
+    if len(present) != n_days:
+        raise ValueError("present must have one byte per day")
+    kwh, euro = array("d", kwh), array("d", euro)
+    if not _NATIVE_LITTLE:  # pragma: no cover - big-endian hosts
+        kwh.byteswap()
+        euro.byteswap()
+    tmp = f"{os.fspath(path)}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(
+            HEADER.pack(
+                MAGIC, VERSION, n_slots, start_day.toordinal(), n_days, premises.encode("utf-8")[:32]
+            )
+        )
+        f.write(present)
+        f.write(b"\0" * (_data_offset(n_days) - HEADER_SIZE - n_days))
+        kwh.tofile(f)
+        euro.tofile(f)
+    os.replace(tmp, path)
+
+
+def archive_from_store(
+    store: UsageStore,
+    premises: str,
+    path: str | os.PathLike[str],
+    start: date | None = None,
+    end: date | None = None,
+    n_slots: int = DEFAULT_SLOTS,
+) -> int:
+    """Write premises' stored readings (optionally limited to [start, end]) as an archive.
+
+    Days without readings become zero-filled gaps in the day index. Returns the day count.
+    """
+    readings = list(store.read(premises, start, end))
+    if not readings:
+        write_archive(path, premises, start or date.today(), array("d"), array("d"), n_slots)
+        return 0
+    first = start or readings[0].day
+    n_days = ((end or readings[-1].day) - first).days + 1
+    kwh = array("d", bytes(8 * n_days * n_slots))
+    euro = array("d", bytes(8 * n_days * n_slots))
+    present = bytearray(n_days)
+    for r in readings:
+        if r.slot >= n_slots:
+            continue
+        d = (r.day - first).days
+        kwh[d * n_slots + r.slot] = r.kwh
+        euro[d * n_slots + r.slot] = r.euro
+        present[d] = 1
+    write_archive(path, premises, first, kwh, euro, n_slots, bytes(present))
+    return n_days
+
+
+class UsageArchive:
+    """Memory-mapped reader for an archive written by write_archive.
+
+    ``kwh()`` / ``euro()`` return zero-copy memoryviews shaped (days, slots). Views that
+    are still alive at ``close()`` keep the mapping open until they are garbage collected.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self._file.close()
+            raise ValueError(f"{os.fspath(path)} is not a Pinergy usage archive") from None
+        magic, version, n_slots, start, n_days, premises = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{os.fspath(path)} is not a Pinergy usage archive (v{VERSION})")
+        self.n_slots: int = n_slots
+        self.n_days: int = n_days
+        self.start_day = date.fromordinal(start)
+        self.premises = premises.rstrip(b"\0").decode("utf-8")
+        self._view = memoryview(self._mmap)
+        self._kwh_offset = _data_offset(n_days)
+        self._euro_offset = self._kwh_offset + 8 * n_days * n_slots
+
+    @property
+    def end_day(self) -> date:
+        """Last day covered (inclusive)."""
+        return self.start_day + timedelta(days=self.n_days - 1)
+
+    def _day_range(self, start: date | None, end: date | None) -> tuple[int, int]:
+        first = 0 if start is None else max(0, (start - self.start_day).days)
+        last = self.n_days if end is None else min(self.n_days, (end - self.start_day).days + 1)
+        return first, max(first, last)
+
+    def _series(self, offset: int, start: date | None, end: date | None, flat: bool) -> memoryview:
+        first, last = self._day_range(start, end)
+        row = 8 * self.n_slots
+        raw = self._view[offset + first * row : offset + last * row]
+        if not _NATIVE_LITTLE:  # pragma: no cover - big-endian hosts get a swapped copy
+            values = array("d", raw.tobytes())
+            values.byteswap()
+            raw = memoryview(values).cast("B")
+        if flat or last == first:  # memoryview cannot represent a (0, n) shape
+            return raw.cast("d")
+        return raw.cast("d", (last - first, self.n_slots))
+
+    def kwh(self, start: date | None = None, end: date | None = None, flat: bool = False) -> memoryview:
+        """Half-hourly kWh for days in [start, end], shaped (days, slots) or flat if ``flat``."""
+        return self._series(self._kwh_offset, start, end, flat)
+
+    def euro(self, start: date | None = None, end: date | None = None, flat: bool = False) -> memoryview:
+        """Half-hourly € for days in [start, end], shaped (days, slots) or flat if ``flat``."""
+        return self._series(self._euro_offset, start, end, flat)
+
+    def present(self, start: date | None = None, end: date | None = None) -> memoryview:
+        """Day index bytes for [start, end]: 1 where the day has readings."""
+        first, last = self._day_range(start, end)
+        return self._view[HEADER_SIZE + first : HEADER_SIZE + last]
+
+    def close(self) -> None:
+        if getattr(self, "_view", None) is not None:
+            self._view.release()
+            self._view = None
+        if not self._mmap.closed:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass  # outstanding views; unmapped when the last one is collected
+        self._file.close()
+
+    def __enter__(self) -> UsageArchive:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
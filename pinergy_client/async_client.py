@@ -0,0 +1,544 @@
+"""Asyncio Pinergy API client using httpx.AsyncClient with auth_token header.
+
+Mirrors PinergyClient method-for-method (same models, same PinergyAPIError /
+PinergyAuthError mapping) so that many accounts can be polled from a single
+event loop. Requires the optional ``httpx`` dependency (``pip install pinergy[async]``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Mapping
+
+from pinergy_client.breaker import BreakerPolicy, breaker_for
+from pinergy_client.cache import request_key
+from pinergy_client.client import (
+    AUTH_HEADER,
+    DEFAULT_BASE_URL,
+    DEFAULT_HEADERS,
+    DEFAULT_TIMEOUT,
+    PinergyClient,
+    _build_login_request,
+    _check_response,
+    _healthy,
+)
+from pinergy_client.debuglog import DebugLog, debug_log
+from pinergy_client.exceptions import PinergyAuthError, PinergyDeadlineExceeded
+from pinergy_client.hedge import AsyncHedger, HedgePolicy, HedgeStats
+from pinergy_client.metrics import EndpointMetrics, Hook, HttpcoreTrace, RequestEvent, emit
+from pinergy_client.models import (
+    ActiveTopUpsResponse,
+    BalanceResponse,
+    BaseResponse,
+    ChangePasswordRequest,
+    CompareResponse,
+    ConfigInfoResponse,
+    DefaultInfoResponse,
+    DeleteCreditCardRequest,
+    EditHouseDetailsRequest,
+    EditProfileRequest,
+    GetPrefsResponse,
+    LandLordCheckResponse,
+    LandlordRequest,
+    LevelPayUsage,
+    LoginResponse,
+    NotificationSettingsRequest,
+    NotificationSettingsResponse,
+    TopUpHistoryResponse,
+    TopUpRequest,
+    TopUpResponse,
+    UpdateDeviceTokenRequest,
+    UsagesResponse,
+)
+from pinergy_client.singleflight import AsyncSingleFlight
+from pinergy_client.transport import IDEMPOTENT_METHODS, RetryPolicy, TimeoutPair, normalize_timeouts
+
+if TYPE_CHECKING:
+    import httpx
+
+    from pinergy_client.ratelimit import RateLimiter
+    from pinergy_client.token_store import TokenStore
+
+# Connection pool bounds: requests beyond max_connections wait for a free
+# connection instead of opening new sockets, so thousands of tasks can share one pool.
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+class AsyncPinergyClient:
+    """Asyncio HTTP client for the Pinergy API with session-based auth.
+
+    ``coalesce=True`` makes concurrent identical GETs from different tasks share one
+    in-flight request and its result or exception. ``credentials`` / ``token_store`` enable
+    self-login and a single shared re-login on 401/403, as in PinergyClient. ``hedge`` (a
+    HedgePolicy) hedges slow GETs as in PinergyClient, cancelling the losing requests, and
+    ``breaker`` shares PinergyClient's per-base-URL circuit breaker. ``rate_limit`` (a
+    RateLimiter) queues requests as in PinergyClient, waiting without blocking the loop.
+    ``hooks`` / ``metrics`` work as in PinergyClient; here RequestEvent also carries the
+    connect time and TTFB reported by httpcore's trace extension. ``debug`` logs traffic
+    as in PinergyClient.
+
+    ``timeouts`` sets per-path (connect, read) timeouts and every method takes ``deadline=``
+    (seconds), as in PinergyClient; here the deadline cancels the call outright once it
+    passes, whatever it is waiting on, and raises PinergyDeadlineExceeded.
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        auth_token: str | None = None,
+        timeout: TimeoutPair = DEFAULT_TIMEOUT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        transport: httpx.AsyncBaseTransport | None = None,
+        retry: RetryPolicy | None = None,
+        coalesce: bool = False,
+        credentials: tuple[str, str] | None = None,
+        token_store: TokenStore | None = None,
+        timeouts: Mapping[str, float | TimeoutPair] | None = None,
+        hedge: HedgePolicy | None = None,
+        breaker: BreakerPolicy | None = None,
+        rate_limit: RateLimiter | None = None,
+        hooks: Iterable[Hook] = (),
+        metrics: EndpointMetrics | None = None,
+        debug: bool | DebugLog = False,
+    ):
+        try:
+            import httpx
+        except ImportError as e:  # pragma: no cover - depends on environment
+            raise ImportError(
+                "AsyncPinergyClient requires httpx; install with `pip install pinergy[async]`."
+            ) from e
+
+        base = (base_url or os.environ.get("PINERGY_BASE_URL") or DEFAULT_BASE_URL).rstrip("/")
+        token = auth_token if auth_token is not None else os.environ.get("PINERGY_AUTH_TOKEN") or None
+        self.base_url = base
+        self._retry = retry
+        self._single_flight = AsyncSingleFlight() if coalesce else None
+        self._hedger = AsyncHedger(hedge) if hedge is not None else None
+        self._breaker = breaker_for(base, breaker) if breaker is not None else None
+        self._rate_limit = rate_limit
+        self.metrics = metrics if metrics is not None else EndpointMetrics()
+        self._hooks: list[Hook] = [self.metrics, *hooks]
+        self._debug_log = debug_log(debug)
+        self._credentials = credentials
+        self._token_store = token_store
+        self._device_token = PinergyClient._generate_fake_fcm_token() if credentials else ""
+        self._auth_lock = asyncio.Lock()
+        connect, read = timeout
+        self._timeouts = {
+            path: httpx.Timeout(r, connect=c, pool=None)
+            for path, (c, r) in normalize_timeouts(timeouts).items()
+        }
+        self._client = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            # pool=None: wait for a pooled connection rather than failing under load
+            timeout=httpx.Timeout(read, connect=connect, pool=None),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            transport=transport,
+        )
+        if token:
+            self._client.headers[AUTH_HEADER] = token
+
+    @property
+    def auth_token(self) -> str | None:
+        return self._client.headers.get(AUTH_HEADER)
+
+    def set_auth_token(self, token: str) -> None:
+        self._client.headers[AUTH_HEADER] = token
+
+    def add_hook(self, hook: Hook) -> None:
+        self._hooks.append(hook)
+
+    @property
+    def hedge_stats(self) -> HedgeStats:
+        return self._hedger.stats if self._hedger is not None else HedgeStats()
+
+    @property
+    def has_credentials(self) -> bool:
+        return self._credentials is not None
+
+    async def authenticate(self) -> str:
+        """Apply a token now using the held credentials (see PinergyClient.authenticate)."""
+        if self._credentials is None:
+            raise PinergyAuthError("No credentials; pass credentials=(email, password).")
+        await self._refresh_auth(None)
+        return self.auth_token or ""
+
+    async def _refresh_auth(self, stale: str | None) -> None:
+        """Log in with the held credentials, unless another task already replaced ``stale``."""
+        async with self._auth_lock:
+            if self.auth_token and self.auth_token != stale:
+                return
+            email, password = self._credentials
+            store = self._token_store
+            if store is not None:
+                entry = store.get(email)
+                if entry and entry.auth_token and entry.auth_token != stale:
+                    self.set_auth_token(entry.auth_token)
+                    return
+            device_token = store.device_token(email) if store is not None else self._device_token
+            resp = await self.login(email=email, password=password, device_token=device_token)
+            if not resp.success or not resp.auth_token:
+                if store is not None:
+                    store.forget(email)
+                raise PinergyAuthError(resp.message or "Login failed", body={"email": email})
+            if store is not None:
+                store.save(email, resp.auth_token, device_token)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        model: type[Any] | None = None,
+        *,
+        json: dict[str, Any] | None = None,
+        params: dict[str, str] | None = None,
+        auth_required: bool = True,
+        deadline: float | None = None,
+    ) -> Any:
+        """Make one API call and return ``model.from_dict(data)`` (see PinergyClient._request)."""
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be positive")
+        event = RequestEvent(method, path)
+        start = time.perf_counter()
+        try:
+            call = self._call(
+                method, path, json=json, params=params, auth_required=auth_required, event=event
+            )
+            if deadline is None:
+                data = await call
+            else:
+                try:
+                    async with asyncio.timeout(deadline) as scope:
+                        data = await call
+                except TimeoutError as e:
+                    if not scope.expired():
+                        raise
+                    raise PinergyDeadlineExceeded(f"Deadline exceeded for {method} {path}") from e
+            if model is None:
+                return data
+            parse_start = time.perf_counter()
+            out = model.from_dict(data)
+            event.parse = time.perf_counter() - parse_start
+            return out
+        except BaseException as e:
+            event.error = e
+            raise
+        finally:
+            event.total = time.perf_counter() - start
+            emit(self._hooks, event)
+
+    async def _call(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None,
+        params: dict[str, str] | None,
+        auth_required: bool,
+        event: RequestEvent,
+    ) -> dict[str, Any]:
+        """Send with a lazy login first and one re-login on 401/403 (as PinergyClient._request)."""
+        url = f"{self.base_url}{path}"
+        if auth_required and not self._client.headers.get(AUTH_HEADER):
+            if self._credentials is None:
+                raise PinergyAuthError("Not authenticated; call login() or set auth_token first.")
+            await self._refresh_auth(None)
+        if not auth_required or self._credentials is None:
+            return await self._dispatch(method, path, url, json=json, params=params, event=event)
+        token = self.auth_token
+        try:
+            return await self._dispatch(method, path, url, json=json, params=params, event=event)
+        except PinergyAuthError as e:
+            if e.status_code not in (401, 403):
+                raise
+            await self._refresh_auth(token)
+            if method.upper() not in IDEMPOTENT_METHODS:
+                raise
+        return await self._dispatch(method, path, url, json=json, params=params, event=event)
+
+    async def _dispatch(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        *,
+        json: dict[str, Any] | None,
+        params: dict[str, str] | None,
+        event: RequestEvent,
+    ) -> dict[str, Any]:
+        timeout = self._timeouts.get(path)
+        hedge_path = path if self._hedger is not None and self._hedger.policy.applies(method, path) else None
+        fetch = functools.partial(
+            self._fetch,
+            method,
+            url,
+            json=json,
+            params=params,
+            timeout=timeout,
+            hedge_path=hedge_path,
+            event=event,
+        )
+        if self._single_flight is not None and method == "GET":
+            return await self._single_flight.do(request_key(self.auth_token, method, path, params), fetch)
+        return await fetch()
+
+    async def _fetch(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: dict[str, Any] | None,
+        params: dict[str, str] | None,
+        timeout: httpx.Timeout | None = None,
+        hedge_path: str | None = None,
+        event: RequestEvent | None = None,
+    ) -> dict[str, Any]:
+        log = self._debug_log if self._debug_log is not None and self._debug_log.sampled() else None
+        if log is not None:
+            log.request(method, url, self._client.headers, params, json)
+        sent = time.perf_counter()
+        resp = await self._send(
+            method, url, json=json, params=params, timeout=timeout, hedge_path=hedge_path, event=event
+        )
+        decode_start = time.perf_counter()
+        try:
+            data = resp.json() if resp.content else {}
+        except Exception:
+            data = {}
+        if event is not None:
+            event.network += decode_start - sent
+            event.decode += time.perf_counter() - decode_start
+            event.status = resp.status_code
+            event.bytes += len(resp.content)
+        if log is not None:
+            log.response(method, url, resp.status_code, decode_start - sent, resp.content)
+        _check_response(method, resp.status_code, resp.reason_phrase, data)
+        return data
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: dict[str, Any] | None,
+        params: dict[str, str] | None,
+        timeout: httpx.Timeout | None = None,
+        hedge_path: str | None = None,
+        event: RequestEvent | None = None,
+    ) -> httpx.Response:
+        """Send one request, retrying per self._retry (if set) on transient failures."""
+        import httpx
+
+        trace = HttpcoreTrace()
+        send = functools.partial(
+            self._client.request,
+            method,
+            url,
+            json=json,
+            params=params,
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+            extensions={"trace": trace},
+        )
+        if self._breaker is not None:
+            send = functools.partial(self._through_breaker, send)
+        if self._rate_limit is not None:
+            send = functools.partial(self._throttled, send)
+        attempt = 0
+        while True:
+            trace.reset()
+            if event is not None:
+                event.attempts += 1
+            try:
+                resp = await (send() if hedge_path is None else self._hedger.do(hedge_path, send))
+            except httpx.TransportError as e:
+                if self._retry is None:
+                    raise
+                delay = self._retry.next_delay(
+                    method,
+                    attempt,
+                    connect_failed=isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)),
+                )
+                if delay is None:
+                    raise
+            else:
+                if event is not None:
+                    event.connect, event.ttfb = trace.connect, trace.ttfb
+                if self._retry is None:
+                    return resp
+                delay = self._retry.next_delay(
+                    method, attempt, status=resp.status_code, headers=resp.headers
+                )
+                if delay is None:
+                    return resp
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _throttled(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        wait = self._rate_limit.reserve(self.auth_token)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return await send()
+
+    async def _through_breaker(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """CircuitBreaker.call for coroutines; a cancelled attempt (hedge loser) is not an outcome."""
+        self._breaker.allow()
+        try:
+            resp = await send()
+        except asyncio.CancelledError:
+            self._breaker.release()
+            raise
+        except BaseException:
+            self._breaker.record(False)
+            raise
+        self._breaker.record(_healthy(resp))
+        return resp
+
+    async def login(
+        self,
+        email: str | None = None,
+        password: str | None = None,
+        device_token: str = "",
+        *,
+        deadline: float | None = None,
+    ) -> LoginResponse:
+        """Authenticate and set auth_token on this client (see PinergyClient.login)."""
+        req = _build_login_request(email, password, device_token)
+        out = await self._request(
+            "POST", "/login", LoginResponse, json=req.to_dict(), auth_required=False, deadline=deadline
+        )
+        if out.auth_token:
+            self.set_auth_token(out.auth_token)
+        return out
+
+    async def logout(self, *, deadline: float | None = None) -> BaseResponse:
+        return await self._request("POST", "/logout", BaseResponse, json={}, deadline=deadline)
+
+    async def forgot_password(self, email: str, *, deadline: float | None = None) -> BaseResponse:
+        return await self._request(
+            "POST",
+            "/forgot",
+            BaseResponse,
+            params={"email": email},
+            json={},
+            auth_required=False,
+            deadline=deadline,
+        )
+
+    async def change_password(self, new_password: str, *, deadline: float | None = None) -> BaseResponse:
+        req = ChangePasswordRequest(new_password=new_password)
+        return await self._request("POST", "/changepass", BaseResponse, json=req.to_dict(), deadline=deadline)
+
+    async def balance(self, *, deadline: float | None = None) -> BalanceResponse:
+        return await self._request("GET", "/balance", BalanceResponse, deadline=deadline)
+
+    async def top_up(self, request: TopUpRequest, *, deadline: float | None = None) -> TopUpResponse:
+        return await self._request("POST", "/topup", TopUpResponse, json=request.to_dict(), deadline=deadline)
+
+    async def schedule_top_up(self, request: TopUpRequest, *, deadline: float | None = None) -> BaseResponse:
+        return await self._request(
+            "POST", "/scheduletopup", BaseResponse, json=request.to_dict(), deadline=deadline
+        )
+
+    async def auto_top_up(self, request: TopUpRequest, *, deadline: float | None = None) -> BaseResponse:
+        return await self._request(
+            "POST", "/autotopup", BaseResponse, json=request.to_dict(), deadline=deadline
+        )
+
+    async def get_active_top_ups(self, *, deadline: float | None = None) -> ActiveTopUpsResponse:
+        return await self._request("GET", "/activetopups", ActiveTopUpsResponse, deadline=deadline)
+
+    async def get_top_up_history(self, *, deadline: float | None = None) -> TopUpHistoryResponse:
+        return await self._request("GET", "/topuphistory", TopUpHistoryResponse, deadline=deadline)
+
+    async def get_usage(self, *, deadline: float | None = None) -> UsagesResponse:
+        return await self._request("GET", "/usage", UsagesResponse, deadline=deadline)
+
+    async def get_level_pay_usage(self, *, deadline: float | None = None) -> LevelPayUsage:
+        return await self._request("GET", "/levelPayUsage", LevelPayUsage, deadline=deadline)
+
+    async def compare(self, *, deadline: float | None = None) -> CompareResponse:
+        return await self._request("GET", "/compare", CompareResponse, deadline=deadline)
+
+    async def edit_profile(
+        self, request: EditProfileRequest, *, deadline: float | None = None
+    ) -> BaseResponse:
+        return await self._request(
+            "POST", "/editprofile", BaseResponse, json=request.to_dict(), deadline=deadline
+        )
+
+    async def update_house(
+        self, request: EditHouseDetailsRequest, *, deadline: float | None = None
+    ) -> BaseResponse:
+        return await self._request(
+            "POST", "/updatehouse", BaseResponse, json=request.to_dict(), deadline=deadline
+        )
+
+    async def get_notification_settings(self, *, deadline: float | None = None) -> GetPrefsResponse:
+        return await self._request("GET", "/getnotif", GetPrefsResponse, deadline=deadline)
+
+    async def update_notification_settings(
+        self, request: NotificationSettingsRequest, *, deadline: float | None = None
+    ) -> NotificationSettingsResponse:
+        return await self._request(
+            "POST", "/updatenotif", NotificationSettingsResponse, json=request.to_dict(), deadline=deadline
+        )
+
+    async def update_device_token(
+        self, request: UpdateDeviceTokenRequest, *, deadline: float | None = None
+    ) -> BaseResponse:
+        return await self._request(
+            "POST", "/updatedevicetoken", BaseResponse, json=request.to_dict(), deadline=deadline
+        )
+
+    async def delete_credit_card(self, cc_token: str, *, deadline: float | None = None) -> BaseResponse:
+        req = DeleteCreditCardRequest(cc_token=cc_token)
+        return await self._request("POST", "/deletecc", BaseResponse, json=req.to_dict(), deadline=deadline)
+
+    async def get_config_info(self, *, deadline: float | None = None) -> ConfigInfoResponse:
+        return await self._request("GET", "/configinfo", ConfigInfoResponse, deadline=deadline)
+
+    async def get_defaults_info(self, *, deadline: float | None = None) -> DefaultInfoResponse:
+        return await self._request(
+            "GET", "/defaultsinfo", DefaultInfoResponse, auth_required=False, deadline=deadline
+        )
+
+    async def landlord_check(
+        self, premises_number: str, *, deadline: float | None = None
+    ) -> LandLordCheckResponse:
+        return await self._request(
+            "GET",
+            "/landlordcheck",
+            LandLordCheckResponse,
+            params={"premises_number": premises_number},
+            auth_required=False,
+            deadline=deadline,
+        )
+
+    async def landlord_verify(
+        self, request: LandlordRequest, *, deadline: float | None = None
+    ) -> BaseResponse:
+        return await self._request(
+            "POST",
+            "/landlordverify",
+            BaseResponse,
+            json=request.to_dict(),
+            auth_required=False,
+            deadline=deadline,
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncPinergyClient:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
@@ -0,0 +1,130 @@
+"""Circuit breaker shared by every client talking to the same base URL."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+from pinergy_client.exceptions import PinergyCircuitOpenError
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class BreakerPolicy:
+    """When the breaker opens and how it recovers.
+
+    The outcomes of the last ``window`` requests are kept; once at least ``min_calls`` have
+    been seen and the share of failures (transport errors, 5xx) reaches ``failure_rate``,
+    the circuit opens and requests fail immediately for ``open_for`` seconds. It then goes
+    half-open: up to ``half_open_calls`` trial requests are let through, and the circuit
+    closes if they succeed or opens again on the first failure.
+    """
+
+    failure_rate: float = 0.5
+    window: int = 20
+    min_calls: int = 10
+    open_for: float = 30.0
+    half_open_calls: int = 1
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker (see BreakerPolicy)."""
+
+    def __init__(self, name: str, policy: BreakerPolicy, clock: Callable[[], float] = time.monotonic) -> None:
+        self.name = name
+        self.policy = policy
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._outcomes: deque[bool] = deque(maxlen=policy.window)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trials = 0  # half-open requests in flight
+        self._trial_successes = 0
+        self.rejected = 0  # requests failed fast while open
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.policy.open_for:
+            self._state = HALF_OPEN
+            self._trials = self._trial_successes = 0
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+
+    def allow(self) -> None:
+        """Admit one request or raise PinergyCircuitOpenError; admitted requests must be recorded."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CLOSED:
+                return
+            if self._state == HALF_OPEN and self._trials < self.policy.half_open_calls:
+                self._trials += 1
+                return
+            self.rejected += 1
+            retry_in = max(0.0, self._opened_at + self.policy.open_for - self._clock())
+        raise PinergyCircuitOpenError(f"Circuit open for {self.name}; failing fast", retry_in=retry_in)
+
+    def record(self, success: bool) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._trials = max(0, self._trials - 1)
+                if not success:
+                    self._open()
+                    return
+                self._trial_successes += 1
+                if self._trial_successes >= self.policy.half_open_calls:
+                    self._state = CLOSED
+                    self._outcomes.clear()
+                return
+            if self._state == OPEN:
+                return  # a request admitted before the circuit opened
+            self._outcomes.append(success)
+            calls, failures = len(self._outcomes), self._outcomes.count(False)
+            if calls >= self.policy.min_calls and failures >= self.policy.failure_rate * calls:
+                self._open()
+
+    def release(self) -> None:
+        """Forget an admitted request without an outcome (e.g. it was cancelled)."""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._trials = max(0, self._trials - 1)
+
+    def call(self, fn: Callable[[], T], ok: Callable[[T], bool]) -> T:
+        """Run fn through the breaker; ``ok`` decides whether its result counts as a success."""
+        self.allow()
+        success = False
+        try:
+            result = fn()
+            success = ok(result)
+            return result
+        finally:
+            self.record(success)
+
+
+_registry: dict[tuple[str, BreakerPolicy], CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def breaker_for(base_url: str, policy: BreakerPolicy) -> CircuitBreaker:
+    """The process-wide breaker for base_url (one per distinct policy), created on first use."""
+    key = (base_url.rstrip("/"), policy)
+    with _registry_lock:
+        breaker = _registry.get(key)
+        if breaker is None:
+            breaker = _registry[key] = CircuitBreaker(key[0], policy)
+        return breaker
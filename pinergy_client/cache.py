@@ -0,0 +1,128 @@
+"""In-process TTL response cache with LRU eviction for GET endpoints."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping
+
+# Seconds a successful GET response stays fresh, per path. Paths not listed are not cached.
+DEFAULT_TTLS: dict[str, float] = {
+    "/configinfo": 24 * 3600,  # top-up amounts / thresholds: effectively static
+    "/defaultsinfo": 24 * 3600,  # house / heating types: effectively static
+    "/compare": 6 * 3600,  # recomputed weekly upstream
+    "/usage": 15 * 60,
+    "/levelPayUsage": 15 * 60,  # half-hourly resolution
+    "/balance": 60,  # moves at most once per meter reading
+}
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+CacheKey = tuple[str, str, str, tuple[tuple[str, str], ...]]
+
+
+def request_key(
+    token: str | None, method: str, path: str, params: Mapping[str, str] | None = None
+) -> CacheKey:
+    """Identity of a request for caching and coalescing: (token, method, path, params)."""
+    return (token or "", method.upper(), path, tuple(sorted((params or {}).items())))
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class ResponseCache:
+    """Thread-safe response cache keyed by (token, method, path, params).
+
+    Entries hold the raw response body and are decoded on every hit, so callers never
+    share (or mutate) cached objects. Least recently used entries are evicted once
+    ``max_entries`` or ``max_bytes`` is exceeded.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    key = staticmethod(request_key)
+
+    def ttl_for(self, path: str) -> float:
+        return self.ttls.get(path, 0)
+
+    def get(self, key: CacheKey) -> Any | None:
+        """Decoded body for key if present and fresh; None otherwise (counts a miss)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            raw = entry[1]
+        return json.loads(raw) if raw else {}
+
+    def set(self, key: CacheKey, body: bytes) -> None:
+        """Store a raw response body under key using the TTL for its path."""
+        ttl = self.ttl_for(key[2])
+        if ttl <= 0 or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (self._clock() + ttl, body)
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, token: str | None = None) -> None:
+        """Drop every entry for token (all entries if token is None)."""
+        with self._lock:
+            if token is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            for key in [k for k in self._entries if k[0] == token]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def _remove(self, key: CacheKey) -> None:
+        _, body = self._entries.pop(key)
+        self._bytes -= len(body)
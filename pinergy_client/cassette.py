@@ -0,0 +1,202 @@
+"""Record API responses to a cassette file and replay them offline.
+
+A cassette holds the responses a client received, keyed by (method, path, params). In
+``record`` mode the client talks to the server as usual and every response is kept; in
+``replay`` mode nothing is sent and each request is answered from the cassette at once.
+Request bodies and headers are never stored, and response values under ``redact`` keys
+(auth token, password, ...) are masked, so cassettes are safe to keep as CI fixtures.
+
+File layout (compact JSON, gzip-compressed when the name ends in ``.gz``)::
+
+    {"version": 1, "interactions": [{"method": "GET", "path": "/api/balance", "params": [],
+      "status": 200, "reason": "OK", "headers": {...}, "body": {...}}, ...]}
+
+Non-JSON bodies are stored as ``"text"`` instead of ``"body"``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import IO, Any, Literal
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from pinergy_client.debuglog import DEFAULT_REDACT, REDACTED
+from pinergy_client.exceptions import PinergyCassetteError
+
+VERSION = 1
+_KEPT_HEADERS = ("Content-Type", "Retry-After")
+
+Key = tuple[str, str, tuple[tuple[str, str], ...]]
+_Replay = tuple[int, str, dict[str, str], bytes]  # status, reason, headers, body
+
+
+def _redact(value: Any, keys: frozenset[str]) -> Any:
+    if isinstance(value, dict):
+        return {k: REDACTED if k.lower() in keys else _redact(v, keys) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_redact(v, keys) for v in value]
+    return value
+
+
+def _open(path: str | Path, mode: str, compress: bool) -> IO[str]:
+    if compress:
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class Cassette:
+    """Responses recorded from (``mode="record"``) or replayed to (``mode="replay"``) a client.
+
+    Pass it to PinergyClient as ``cassette=``. Recording starts from an empty cassette and is
+    written to ``path`` by ``save()``, which ``client.close()`` calls. Replaying serves the
+    responses recorded for each key in order, repeating the last one once they run out, and
+    raises PinergyCassetteError for a request that was never recorded.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        mode: Literal["record", "replay"] = "replay",
+        redact: frozenset[str] = DEFAULT_REDACT,
+    ):
+        if mode not in ("record", "replay"):
+            raise ValueError("mode must be 'record' or 'replay'")
+        self.path = Path(path)
+        self.mode = mode
+        self.redact = frozenset(k.lower() for k in redact)
+        self._lock = threading.Lock()
+        self._recorded: list[dict[str, Any]] = []
+        self._replays: dict[Key, list[_Replay]] = {}
+        self._played: dict[Key, int] = {}
+        if mode == "replay":
+            self._load()
+
+    @property
+    def _compress(self) -> bool:
+        return self.path.suffix == ".gz"
+
+    def key(self, method: str, url: str) -> Key:
+        parts = urlsplit(url)
+        params = sorted(
+            (k, REDACTED if k.lower() in self.redact else v)
+            for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        )
+        return (method.upper(), parts.path, tuple(params))
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self.mode == "record":
+                return len(self._recorded)
+            return sum(len(v) for v in self._replays.values())
+
+    def _load(self) -> None:
+        with _open(self.path, "r", self._compress) as f:
+            data = json.load(f)
+        if data.get("version") != VERSION:
+            raise PinergyCassetteError(f"Unsupported cassette version in {self.path}")
+        for e in data["interactions"]:
+            key = (e["method"], e["path"], tuple((k, v) for k, v in e["params"]))
+            if "body" in e:
+                body = json.dumps(e["body"], separators=(",", ":")).encode("utf-8")
+            else:
+                body = e.get("text", "").encode("utf-8")
+            # Bodies are encoded once here, so replaying costs no serialisation
+            replay = (e["status"], e.get("reason", ""), e.get("headers", {}), body)
+            self._replays.setdefault(key, []).append(replay)
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        method, path, params = self.key(request.method or "GET", request.url or "")
+        entry: dict[str, Any] = {
+            "method": method,
+            "path": path,
+            "params": [list(p) for p in params],
+            "status": response.status_code,
+            "reason": response.reason or "",
+            "headers": {h: response.headers[h] for h in _KEPT_HEADERS if h in response.headers},
+        }
+        if response.content:
+            try:
+                entry["body"] = _redact(json.loads(response.content), self.redact)
+            except ValueError:
+                entry["text"] = response.content.decode("utf-8", "replace")
+        with self._lock:
+            self._recorded.append(entry)
+
+    def play(self, request: requests.PreparedRequest) -> requests.Response:
+        key = self.key(request.method or "GET", request.url or "")
+        with self._lock:
+            replays = self._replays.get(key)
+            if not replays:
+                raise PinergyCassetteError(f"No recorded response for {key[0]} {request.url}")
+            n = self._played.get(key, 0)
+            self._played[key] = n + 1
+            status, reason, headers, body = replays[min(n, len(replays) - 1)]
+        resp = requests.Response()
+        resp.status_code = status
+        resp.reason = reason
+        resp.headers = CaseInsensitiveDict(headers)
+        resp._content = body
+        resp.encoding = "utf-8"
+        resp.url = request.url or ""
+        resp.request = request
+        return resp
+
+    def adapter(self, inner: BaseAdapter) -> BaseAdapter:
+        """Transport adapter that records what inner returns, or replays without inner."""
+        return _RecordingAdapter(self, inner) if self.mode == "record" else _ReplayAdapter(self)
+
+    def save(self) -> None:
+        """Write the recorded interactions to ``path`` atomically (a no-op when replaying)."""
+        if self.mode != "record":
+            return
+        with self._lock:
+            data = {"version": VERSION, "interactions": list(self._recorded)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".cassette-", suffix=".tmp")
+        os.close(fd)
+        try:
+            with _open(tmp, "w", self._compress) as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+
+class _RecordingAdapter(BaseAdapter):
+    def __init__(self, cassette: Cassette, inner: BaseAdapter):
+        super().__init__()
+        self._cassette = cassette
+        self._inner = inner
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        resp = self._inner.send(request, **kwargs)
+        self._cassette.record(request, resp)
+        return resp
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class _ReplayAdapter(BaseAdapter):
+    def __init__(self, cassette: Cassette):
+        super().__init__()
+        self._cassette = cassette
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        return self._cassette.play(request)
+
+    def close(self) -> None:
+        pass
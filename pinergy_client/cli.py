@@ -1,45 +1,142 @@
-"""CLI for Pinergy API client (rich-click)."""
+"""CLI for Pinergy API client (rich-click).
+
+Startup stays cheap: rich, requests (via the client), dotenv and the analytics helpers are
+imported inside the commands that use them, so ``pinergy <cmd>`` only pays for what it runs.
+"""
 
 from __future__ import annotations
 
+import functools
 import json
 import os
+import threading
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, NoReturn
 
 import rich_click as click
-from dotenv import load_dotenv
-from rich.console import Console
-from rich.table import Table
 
-from pinergy_client.client import PinergyClient
-from pinergy_client.models import TopUpRequest
+from pinergy_client.exceptions import PinergyAPIError
 
-load_dotenv()
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
+    from pinergy_client.client import PinergyClient
+    from pinergy_client.models import LevelPayPeriods, LevelPayUsage
 
 click.rich_click.USE_RICH_MARKUP = True
 click.rich_click.USE_MARKDOWN = True
 
 
+@functools.cache
+def _console() -> Console:
+    from rich.console import Console
+
+    return Console()
+
+
+class _Group(click.RichGroup):
+    """Top-level group that loads .env when the CLI runs rather than at import."""
+
+    def main(self, *args: Any, **kwargs: Any) -> Any:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        return super().main(*args, **kwargs)
+
+
+OUTPUT_MODES = ("table", "json", "ndjson")
+
+
+def _machine_output(ctx: click.Context) -> bool:
+    return ctx.obj.get("output", "table") != "table"
+
+
+def _emit(ctx: click.Context, model: Any, stream: bool = False) -> bool:
+    """In json / ndjson mode print model as JSON and return True; in table mode return False.
+
+    Streaming commands pass ``stream=True`` so json mode also prints one compact line per model.
+    """
+    mode = ctx.obj.get("output", "table")
+    if mode == "table":
+        return False
+    from pinergy_client.export import to_jsonable
+
+    if mode == "json" and not stream:
+        click.echo(json.dumps(to_jsonable(model), indent=2, ensure_ascii=False, default=str))
+    else:
+        click.echo(json.dumps(to_jsonable(model), separators=(",", ":"), ensure_ascii=False, default=str))
+    return True
+
+
+def _fail(ctx: click.Context, message: str) -> NoReturn:
+    """Report a failed response (plain stderr in json / ndjson mode) and exit 1."""
+    if _machine_output(ctx):
+        click.echo(message, err=True)
+    else:
+        _console().print(f"[red]{message}[/red]")
+    raise SystemExit(1)
+
+
+TOKEN_HELP = "Auth token (default: cached login for PINERGY_EMAIL / PINERGY_PASSWORD)"
+
+
+def _client(ctx: click.Context, token: str | None) -> PinergyClient:
+    """Client for --token, else one holding PINERGY_EMAIL / PINERGY_PASSWORD with the token cache.
+
+    The latter reuses the cached token and logs in again only if the server rejects it.
+    """
+    from pinergy_client.client import PinergyClient
+    from pinergy_client.token_store import TokenStore
+
+    if token:
+        return PinergyClient(base_url=ctx.obj["base_url"], auth_token=token)
+    email = os.environ.get("PINERGY_EMAIL", "").strip()
+    if not email:
+        raise click.UsageError("Pass --token (or set PINERGY_AUTH_TOKEN), or set PINERGY_EMAIL to use a cached login.")
+    client = PinergyClient(
+        base_url=ctx.obj["base_url"],
+        auth_token="",
+        credentials=(email, os.environ.get("PINERGY_PASSWORD", "")),
+        token_store=TokenStore(),
+    )
+    try:
+        client.authenticate()
+    except PinergyAPIError as e:
+        client.close()
+        raise click.ClickException(f"Login failed: {e}") from e
+    return client
+
+
 def get_client() -> PinergyClient:
+    from pinergy_client.client import PinergyClient
+
     base = os.environ.get("PINERGY_BASE_URL", "https://api.pinergy.ie/api")
     token = os.environ.get("PINERGY_AUTH_TOKEN")
     return PinergyClient(base_url=base, auth_token=token or None)
 
 
-@click.group()
+@click.group(cls=_Group)
 @click.option(
     "--base-url",
     envvar="PINERGY_BASE_URL",
     default="https://api.pinergy.ie/api",
     help="API base URL",
 )
+@click.option(
+    "--output",
+    "output_mode",
+    envvar="PINERGY_OUTPUT",
+    type=click.Choice(OUTPUT_MODES),
+    default="table",
+    show_default=True,
+    help="`table` (rich), or `json` / `ndjson` to print the parsed response models without rich",
+)
 @click.pass_context
-def main(ctx: click.Context, base_url: str) -> None:
+def main(ctx: click.Context, base_url: str, output_mode: str) -> None:
     """Pinergy API client — balance, usage, top-up, and more."""
     ctx.ensure_object(dict)
     ctx.obj["base_url"] = base_url.rstrip("/")
+    ctx.obj["output"] = output_mode
 
 
 @main.command()
@@ -47,30 +144,38 @@ def main(ctx: click.Context, base_url: str) -> None:
 @click.option("--password", envvar="PINERGY_PASSWORD", required=True, help="Account password")
 @click.pass_context
 def login(ctx: click.Context, email: str, password: str) -> None:
-    """Log in and print auth token (set PINERGY_AUTH_TOKEN for other commands)."""
-    client = PinergyClient(base_url=ctx.obj["base_url"])
+    """Log in and cache the auth token; other commands then reuse it without --token."""
+    from pinergy_client.client import PinergyClient
+    from pinergy_client.token_store import TokenStore, cached_login
+
+    client = PinergyClient(base_url=ctx.obj["base_url"], auth_token="")
+    store = TokenStore()
     try:
-        resp = client.login(email=email, password=password)
-        if resp.success and resp.auth_token:
-            console.print("[green]Login successful.[/green]")
-            console.print(f"Auth token: [dim]{resp.auth_token[:20]}...[/dim]")
-        else:
-            console.print(f"[red]Login failed: {resp.message}[/red]")
+        token = cached_login(client, store, email, password, force=True)
+    except PinergyAPIError as e:
+        _fail(ctx, f"Login failed: {e}")
     finally:
         client.close()
+    if _emit(ctx, {"success": True, "email": email, "auth_token_prefix": token[:20], "cache": str(store.path)}):
+        return
+    _console().print("[green]Login successful.[/green]")
+    _console().print(f"Auth token: [dim]{token[:20]}...[/dim] (cached in {store.path})")
 
 
 @main.command()
-@click.option("--token", envvar="PINERGY_AUTH_TOKEN", required=True, help="Auth token")
+@click.option("--token", envvar="PINERGY_AUTH_TOKEN", help=TOKEN_HELP)
 @click.pass_context
 def balance(ctx: click.Context, token: str) -> None:
     """Fetch current balance and status."""
-    client = PinergyClient(base_url=ctx.obj["base_url"], auth_token=token)
+    client = _client(ctx, token)
     try:
         resp = client.balance()
         if not resp.success:
-            console.print(f"[red]{resp.message}[/red]")
-            raise SystemExit(1)
+            _fail(ctx, resp.message)
+        if _emit(ctx, resp):
+            return
+        from rich.table import Table
+
         table = Table(title="Balance")
         table.add_column("Field", style="cyan")
         table.add_column("Value", style="green")
@@ -80,22 +185,25 @@ def balance(ctx: click.Context, token: str) -> None:
         table.add_row("Power off", str(resp.power_off))
         table.add_row("Top up in days", str(resp.top_up_in_days))
         table.add_row("Last top up amount", f"€{resp.last_top_up_amount:.2f}")
-        console.print(table)
+        _console().print(table)
     finally:
         client.close()
 
 
 @main.command()
-@click.option("--token", envvar="PINERGY_AUTH_TOKEN", required=True, help="Auth token")
+@click.option("--token", envvar="PINERGY_AUTH_TOKEN", help=TOKEN_HELP)
 @click.pass_context
 def usage(ctx: click.Context, token: str) -> None:
     """Fetch usage (day / week / month)."""
-    client = PinergyClient(base_url=ctx.obj["base_url"], auth_token=token)
+    client = _client(ctx, token)
     try:
         resp = client.get_usage()
         if not resp.success:
-            console.print(f"[red]{resp.message}[/red]")
-            raise SystemExit(1)
+            _fail(ctx, resp.message)
+        if _emit(ctx, resp):
+            return
+        from rich.table import Table
+
         def fmt_date(ts: int) -> str:
             if ts <= 0:
                 return ""
@@ -118,22 +226,25 @@ def usage(ctx: click.Context, token: str) -> None:
                 table.add_row(fmt_date(u.date), f"{u.kwh:.2f}", f"€{u.amount:.2f}", f"{u.co2:.2f}")
             if len(items) > 15:
                 table.add_row("…", "…", "…", "…")
-            console.print(table)
+            _console().print(table)
     finally:
         client.close()
 
 
 @main.command()
-@click.option("--token", envvar="PINERGY_AUTH_TOKEN", required=True, help="Auth token")
+@click.option("--token", envvar="PINERGY_AUTH_TOKEN", help=TOKEN_HELP)
 @click.pass_context
 def config(ctx: click.Context, token: str) -> None:
     """Fetch config (top-up amounts, thresholds)."""
-    client = PinergyClient(base_url=ctx.obj["base_url"], auth_token=token)
+    client = _client(ctx, token)
     try:
         resp = client.get_config_info()
         if not resp.success:
-            console.print(f"[red]{resp.message}[/red]")
-            raise SystemExit(1)
+            _fail(ctx, resp.message)
+        if _emit(ctx, resp):
+            return
+        from rich.table import Table
+
         table = Table(title="Config")
         table.add_column("Key", style="cyan")
         table.add_column("Value", style="green")
@@ -141,31 +252,51 @@ def config(ctx: click.Context, token: str) -> None:
         table.add_row("auto_up_amounts", str(resp.auto_up_amounts))
         table.add_row("scheduled_top_up_amounts", str(resp.scheduled_top_up_amounts))
         table.add_row("thresholds", str(resp.thresholds))
-        console.print(table)
+        _console().print(table)
     finally:
         client.close()
 
 
-def _plan_keys_from_daily_dict(d: dict) -> list[str]:
-    """Keys from daykWh/dayEuro that are not Total (plan names). Sorted for stable columns."""
-    keys = set(d.keys()) - {"Total"}
-    return sorted(keys)
-
-
-def _plan_labels_from_tariff_list(tariff_list: list[dict]) -> list[str]:
-    """Plan labels from [{ label, usage }, ...] in order."""
-    return [str(u.get("label") or "").strip() for u in tariff_list if (u.get("label") or "").strip()]
+def _print_level_pay_periods(title: str, period_name: str, periods: LevelPayPeriods | None) -> None:
+    """Print one per-period table: Total kWh / € then kWh and € per plan."""
+    from rich.table import Table
+
+    from pinergy_client import analytics
+
+    if periods is None or not periods.labels or not periods.plans:
+        return
+    plans = periods.plans
+    table = Table(title=title)
+    table.add_column(period_name, style="cyan")
+    table.add_column("Total kWh", justify="right", style="green")
+    table.add_column("Total €", justify="right", style="green")
+    for p in plans:
+        table.add_column(f"{p} kWh", justify="right", style="dim")
+    for p in plans:
+        table.add_column(f"{p} €", justify="right", style="dim")
+    total_kwh = analytics.period_totals(periods.kwh)
+    total_euro = analytics.period_totals(periods.euro)
+    for i, label in enumerate(periods.labels):
+        table.add_row(
+            label,
+            f"{total_kwh[i]:.2f}",
+            f"€{total_euro[i]:.2f}",
+            *(f"{periods.kwh.value(p, i):.2f}" for p in range(len(plans))),
+            *(f"€{periods.euro.value(p, i):.2f}" for p in range(len(plans))),
+        )
+    _console().print(table)
+
+
+def _format_level_pay_summary(usage: LevelPayUsage) -> None:
+    """Print compact Level Pay tables (daily, 7 days, weekly, monthly). Plan names (e.g. Standard, Drive) are read from data."""
+    from rich.table import Table
 
+    from pinergy_client import analytics
 
-def _format_level_pay_summary(usage_data: dict) -> None:
-    """Print compact Level Pay tables (daily, 7 days, weekly, monthly). Plan names (e.g. Standard, Drive) are read from data."""
-    # Daily: last N days from daily.values (each has daykWh/dayEuro with Total + plan keys)
-    daily = usage_data.get("daily") or {}
-    daily_values = daily.get("values") or []
-    if daily_values:
-        first_dk = (daily_values[0] or {}).get("daykWh") or {}
-        first_de = (daily_values[0] or {}).get("dayEuro") or {}
-        plan_keys = _plan_keys_from_daily_dict(first_dk) or _plan_keys_from_daily_dict(first_de)
+    daily = usage.daily
+    if daily is not None and daily.n_days:
+        # Daily: last N days with Total + per-plan kWh / €
+        plan_keys = daily.day_kwh.plans or daily.day_euro.plans
         table = Table(title="Level Pay — Daily (recent days)")
         table.add_column("Date", style="cyan")
         table.add_column("Total kWh", justify="right", style="green")
@@ -174,206 +305,72 @@ def _format_level_pay_summary(usage_data: dict) -> None:
             table.add_column(f"{k} kWh", justify="right", style="dim")
         for k in plan_keys:
             table.add_column(f"{k} €", justify="right", style="dim")
-        for v in daily_values[:10]:
-            label = v.get("label") or "—"
-            dk = v.get("daykWh") or {}
-            de = v.get("dayEuro") or {}
-            total_kwh = dk.get("Total") or 0
-            total_euro = de.get("Total") or 0
-            row: list[str] = [
-                label,
-                f"{total_kwh:.2f}",
-                f"€{total_euro:.2f}",
-            ]
-            for k in plan_keys:
-                row.append(f"{dk.get(k) or 0:.2f}")
-            for k in plan_keys:
-                row.append(f"€{de.get(k) or 0:.2f}")
-            table.add_row(*row)
-        console.print(table)
+        kwh_rows = [daily.day_kwh.plans.index(k) if k in daily.day_kwh.plans else None for k in plan_keys]
+        euro_rows = [daily.day_euro.plans.index(k) if k in daily.day_euro.plans else None for k in plan_keys]
+        for d in range(min(10, daily.n_days)):
+            table.add_row(
+                daily.day_labels[d] or "—",
+                f"{daily.total_kwh[d]:.2f}",
+                f"€{daily.total_euro[d]:.2f}",
+                *(f"{daily.day_kwh.value(r, d) if r is not None else 0:.2f}" for r in kwh_rows),
+                *(f"€{daily.day_euro.value(r, d) if r is not None else 0:.2f}" for r in euro_rows),
+            )
+        _console().print(table)
 
     # Top cost and consumption half-hours (average across available days)
-    slot_labels = daily.get("labels") or []
-    n_slots = len(slot_labels)
-    if n_slots and daily_values:
-        avg_kwh: list[float] = [0.0] * n_slots
-        avg_euro: list[float] = [0.0] * n_slots
-        for v in daily_values:
-            h_kwh = v.get("halfHourlykWh") or v.get("half_hourly_kwh") or []
-            h_euro = v.get("halfHourlyEuro") or v.get("half_hourly_euro") or []
-            for i in range(min(n_slots, len(h_kwh))):
-                avg_kwh[i] += float(h_kwh[i] or 0)
-            for i in range(min(n_slots, len(h_euro))):
-                avg_euro[i] += float(h_euro[i] or 0)
-        nd = len(daily_values)
-        if nd > 0:
-            for i in range(n_slots):
-                avg_kwh[i] /= nd
-                avg_euro[i] /= nd
-            by_kwh = sorted(range(n_slots), key=lambda i: avg_kwh[i], reverse=True)
-            by_euro = sorted(range(n_slots), key=lambda i: avg_euro[i], reverse=True)
-            top_n = 5
-            table = Table(title="Level Pay — Peak half-hours (average)")
-            table.add_column("Top consumption", style="cyan")
-            table.add_column("Avg kWh", justify="right", style="green")
-            table.add_column("Top cost", style="cyan")
-            table.add_column("Avg €", justify="right", style="green")
-            for j in range(top_n):
-                i_kwh = by_kwh[j] if j < len(by_kwh) else 0
-                i_euro = by_euro[j] if j < len(by_euro) else 0
-                table.add_row(
-                    slot_labels[i_kwh],
-                    f"{avg_kwh[i_kwh]:.3f}",
-                    slot_labels[i_euro],
-                    f"€{avg_euro[i_euro]:.3f}",
-                )
-            console.print(table)
-
-    # Seven days: labels = day names; daykWh / dayEuro = [{ label, usage }]
-    seven = usage_data.get("sevenDays") or {}
-    seven_labels = seven.get("labels") or []
-    seven_kwh = seven.get("daykWh") or []
-    seven_euro = seven.get("dayEuro") or []
-    if seven_labels and seven_kwh and seven_euro:
-        n7 = len(seven_labels)
-        plan_names = _plan_labels_from_tariff_list(seven_kwh)
-        usage_by_plan_kwh = {str(u.get("label") or "").strip(): (u.get("usage") or []) for u in seven_kwh}
-        usage_by_plan_euro = {str(u.get("label") or "").strip(): (u.get("usage") or []) for u in seven_euro}
-        table = Table(title="Level Pay — Last 7 days")
-        table.add_column("Day", style="cyan")
-        table.add_column("Total kWh", justify="right", style="green")
-        table.add_column("Total €", justify="right", style="green")
-        for p in plan_names:
-            table.add_column(f"{p} kWh", justify="right", style="dim")
-        for p in plan_names:
-            table.add_column(f"{p} €", justify="right", style="dim")
-        for i in range(n7):
-            row: list[str] = [seven_labels[i]]
-            total_kwh = 0.0
-            total_euro = 0.0
-            for p in plan_names:
-                uk = usage_by_plan_kwh.get(p) or []
-                ue = usage_by_plan_euro.get(p) or []
-                vk = float(uk[i]) if i < len(uk) and uk[i] is not None else 0.0
-                ve = float(ue[i]) if i < len(ue) and ue[i] is not None else 0.0
-                total_kwh += vk
-                total_euro += ve
-            row.append(f"{total_kwh:.2f}")
-            row.append(f"€{total_euro:.2f}")
-            for p in plan_names:
-                uk = usage_by_plan_kwh.get(p) or []
-                vk = float(uk[i]) if i < len(uk) and uk[i] is not None else 0.0
-                row.append(f"{vk:.2f}")
-            for p in plan_names:
-                ue = usage_by_plan_euro.get(p) or []
-                ve = float(ue[i]) if i < len(ue) and ue[i] is not None else 0.0
-                row.append(f"€{ve:.2f}")
-            table.add_row(*row)
-        console.print(table)
-
-    # Weekly
-    weekly = usage_data.get("weekly") or {}
-    w_labels = weekly.get("labels") or []
-    w_kwh = weekly.get("weeklykWh") or []
-    w_euro = weekly.get("weeklyEuro") or []
-    if w_labels and w_kwh and w_euro:
-        nw = len(w_labels)
-        plan_names = _plan_labels_from_tariff_list(w_kwh)
-        usage_by_plan_kwh = {str(u.get("label") or "").strip(): (u.get("usage") or []) for u in w_kwh}
-        usage_by_plan_euro = {str(u.get("label") or "").strip(): (u.get("usage") or []) for u in w_euro}
-        table = Table(title="Level Pay — Weekly")
-        table.add_column("Week", style="cyan")
-        table.add_column("Total kWh", justify="right", style="green")
-        table.add_column("Total €", justify="right", style="green")
-        for p in plan_names:
-            table.add_column(f"{p} kWh", justify="right", style="dim")
-        for p in plan_names:
-            table.add_column(f"{p} €", justify="right", style="dim")
-        for i in range(nw):
-            row = [w_labels[i]]
-            total_kwh = sum(float((usage_by_plan_kwh.get(p) or [])[i]) if i < len(usage_by_plan_kwh.get(p) or []) and (usage_by_plan_kwh.get(p) or [])[i] is not None else 0.0 for p in plan_names)
-            total_euro = sum(float((usage_by_plan_euro.get(p) or [])[i]) if i < len(usage_by_plan_euro.get(p) or []) and (usage_by_plan_euro.get(p) or [])[i] is not None else 0.0 for p in plan_names)
-            row.append(f"{total_kwh:.2f}")
-            row.append(f"€{total_euro:.2f}")
-            for p in plan_names:
-                uk = usage_by_plan_kwh.get(p) or []
-                vk = float(uk[i]) if i < len(uk) and uk[i] is not None else 0.0
-                row.append(f"{vk:.2f}")
-            for p in plan_names:
-                ue = usage_by_plan_euro.get(p) or []
-                ve = float(ue[i]) if i < len(ue) and ue[i] is not None else 0.0
-                row.append(f"€{ve:.2f}")
-            table.add_row(*row)
-        console.print(table)
-
-    # Monthly
-    monthly = usage_data.get("monthly") or {}
-    m_labels = monthly.get("labels") or []
-    m_kwh = monthly.get("monthlykWh") or []
-    m_euro = monthly.get("monthlyEuro") or []
-    if m_labels and m_kwh and m_euro:
-        nm = len(m_labels)
-        plan_names = _plan_labels_from_tariff_list(m_kwh)
-        usage_by_plan_kwh = {str(u.get("label") or "").strip(): (u.get("usage") or []) for u in m_kwh}
-        usage_by_plan_euro = {str(u.get("label") or "").strip(): (u.get("usage") or []) for u in m_euro}
-        table = Table(title="Level Pay — Monthly")
-        table.add_column("Month", style="cyan")
-        table.add_column("Total kWh", justify="right", style="green")
-        table.add_column("Total €", justify="right", style="green")
-        for p in plan_names:
-            table.add_column(f"{p} kWh", justify="right", style="dim")
-        for p in plan_names:
-            table.add_column(f"{p} €", justify="right", style="dim")
-        for i in range(nm):
-            row = [m_labels[i]]
-            total_kwh = sum(float((usage_by_plan_kwh.get(p) or [])[i]) if i < len(usage_by_plan_kwh.get(p) or []) and (usage_by_plan_kwh.get(p) or [])[i] is not None else 0.0 for p in plan_names)
-            total_euro = sum(float((usage_by_plan_euro.get(p) or [])[i]) if i < len(usage_by_plan_euro.get(p) or []) and (usage_by_plan_euro.get(p) or [])[i] is not None else 0.0 for p in plan_names)
-            row.append(f"{total_kwh:.2f}")
-            row.append(f"€{total_euro:.2f}")
-            for p in plan_names:
-                uk = usage_by_plan_kwh.get(p) or []
-                vk = float(uk[i]) if i < len(uk) and uk[i] is not None else 0.0
-                row.append(f"{vk:.2f}")
-            for p in plan_names:
-                ue = usage_by_plan_euro.get(p) or []
-                ve = float(ue[i]) if i < len(ue) and ue[i] is not None else 0.0
-                row.append(f"€{ve:.2f}")
-            table.add_row(*row)
-        console.print(table)
+    if daily is not None and daily.n_days and daily.n_slots:
+        by_kwh, by_euro = analytics.peak_slots(daily, n=5)
+        table = Table(title="Level Pay — Peak half-hours (average)")
+        table.add_column("Top consumption", style="cyan")
+        table.add_column("Avg kWh", justify="right", style="green")
+        table.add_column("Top cost", style="cyan")
+        table.add_column("Avg €", justify="right", style="green")
+        for (kwh_label, kwh), (euro_label, euro) in zip(by_kwh, by_euro):
+            table.add_row(kwh_label, f"{kwh:.3f}", euro_label, f"€{euro:.3f}")
+        _console().print(table)
+
+    _print_level_pay_periods("Level Pay — Last 7 days", "Day", usage.seven_days)
+    _print_level_pay_periods("Level Pay — Weekly", "Week", usage.weekly)
+    _print_level_pay_periods("Level Pay — Monthly", "Month", usage.monthly)
 
 
 @main.command()
-@click.option("--token", envvar="PINERGY_AUTH_TOKEN", required=True, help="Auth token")
+@click.option("--token", envvar="PINERGY_AUTH_TOKEN", help=TOKEN_HELP)
 @click.option("--raw", is_flag=True, help="Print full JSON instead of summary tables")
 @click.pass_context
 def level_pay_usage(ctx: click.Context, token: str, raw: bool) -> None:
     """Fetch Level Pay / rebrand usage (half-hourly data; summary tables or --raw JSON)."""
-    client = PinergyClient(base_url=ctx.obj["base_url"], auth_token=token)
+    client = _client(ctx, token)
     try:
         resp = client.get_level_pay_usage()
         if not resp.success and resp.error_code != 0:
-            console.print(f"[red]{resp.message or 'Request failed'}[/red]")
-            raise SystemExit(1)
+            _fail(ctx, resp.message or "Request failed")
+        if _emit(ctx, resp.usage_data if raw else resp):
+            return
         if resp.usage_data:
             if raw:
-                console.print("[bold]Level Pay usage data:[/bold]")
-                console.print(json.dumps(resp.usage_data, indent=2, default=str))
+                _console().print("[bold]Level Pay usage data:[/bold]")
+                _console().print(json.dumps(resp.usage_data, indent=2, default=str))
             else:
-                _format_level_pay_summary(resp.usage_data)
+                _format_level_pay_summary(resp)
         else:
-            console.print("[dim]No usage data.[/dim]")
+            _console().print("[dim]No usage data.[/dim]")
     finally:
         client.close()
 
 
 @main.command()
-@click.option("--token", envvar="PINERGY_AUTH_TOKEN", required=True, help="Auth token")
+@click.option("--token", envvar="PINERGY_AUTH_TOKEN", help=TOKEN_HELP)
 @click.pass_context
 def account(ctx: click.Context, token: str) -> None:
     """Fetch account notification preferences (email, SMS)."""
-    client = PinergyClient(base_url=ctx.obj["base_url"], auth_token=token)
+    client = _client(ctx, token)
     try:
         resp = client.get_notification_settings()
+        if _emit(ctx, resp):
+            return
+        from rich.table import Table
+
         table = Table(title="Account (notification prefs)")
         table.add_column("Field", style="cyan")
         table.add_column("Value", style="green")
@@ -383,22 +380,25 @@ def account(ctx: click.Context, token: str) -> None:
         table.add_row("should_show", str(resp.should_show))
         if resp.should_show_message:
             table.add_row("should_show_message", resp.should_show_message)
-        console.print(table)
+        _console().print(table)
     finally:
         client.close()
 
 
 @main.command()
-@click.option("--token", envvar="PINERGY_AUTH_TOKEN", required=True, help="Auth token")
+@click.option("--token", envvar="PINERGY_AUTH_TOKEN", help=TOKEN_HELP)
 @click.pass_context
 def compare(ctx: click.Context, token: str) -> None:
     """Fetch compare (your usage vs average home)."""
-    client = PinergyClient(base_url=ctx.obj["base_url"], auth_token=token)
+    client = _client(ctx, token)
     try:
         resp = client.compare()
         if not resp.success:
-            console.print(f"[red]{resp.message}[/red]")
-            raise SystemExit(1)
+            _fail(ctx, resp.message)
+        if _emit(ctx, resp):
+            return
+        from rich.table import Table
+
         table = Table(title="Compare")
         table.add_column("Period", style="cyan")
         table.add_column("Type", style="cyan")
@@ -411,22 +411,25 @@ def compare(ctx: click.Context, token: str) -> None:
                 table.add_row(period_name, "kWh", f"{period.kwh.users_home:.2f}", f"{period.kwh.average_home:.2f}")
             if period.co2:
                 table.add_row(period_name, "CO2", f"{period.co2.users_home:.2f}", f"{period.co2.average_home:.2f}")
-        console.print(table)
+        _console().print(table)
     finally:
         client.close()
 
 
 @main.command()
-@click.option("--token", envvar="PINERGY_AUTH_TOKEN", required=True, help="Auth token")
+@click.option("--token", envvar="PINERGY_AUTH_TOKEN", help=TOKEN_HELP)
 @click.pass_context
 def active_topups(ctx: click.Context, token: str) -> None:
     """Fetch active top-ups (auto and scheduled)."""
-    client = PinergyClient(base_url=ctx.obj["base_url"], auth_token=token)
+    client = _client(ctx, token)
     try:
         resp = client.get_active_top_ups()
         if not resp.success:
-            console.print(f"[red]{resp.message}[/red]")
-            raise SystemExit(1)
+            _fail(ctx, resp.message)
+        if _emit(ctx, resp):
+            return
+        from rich.table import Table
+
         table = Table(title="Active top-ups")
         table.add_column("Type", style="cyan")
         table.add_column("Customer", style="green")
@@ -438,24 +441,27 @@ def active_topups(ctx: click.Context, token: str) -> None:
         for u in resp.scheduled:
             table.add_row("scheduled", u.customer, f"€{u.top_up_amount:.2f}", str(u.top_up_day), str(u.top_up_threshold))
         if not resp.auto_top_ups and not resp.scheduled:
-            console.print("[dim]No active top-ups.[/dim]")
+            _console().print("[dim]No active top-ups.[/dim]")
         else:
-            console.print(table)
+            _console().print(table)
     finally:
         client.close()
 
 
 @main.command()
-@click.option("--token", envvar="PINERGY_AUTH_TOKEN", required=True, help="Auth token")
+@click.option("--token", envvar="PINERGY_AUTH_TOKEN", help=TOKEN_HELP)
 @click.pass_context
 def topup_history(ctx: click.Context, token: str) -> None:
     """Fetch top-up history."""
-    client = PinergyClient(base_url=ctx.obj["base_url"], auth_token=token)
+    client = _client(ctx, token)
     try:
         resp = client.get_top_up_history()
         if not resp.success:
-            console.print(f"[red]{resp.message}[/red]")
-            raise SystemExit(1)
+            _fail(ctx, resp.message)
+        if _emit(ctx, resp):
+            return
+        from rich.table import Table
+
         table = Table(title="Top-up history")
         table.add_column("ID", style="cyan")
         table.add_column("Amount", style="green")
@@ -468,9 +474,9 @@ def topup_history(ctx: click.Context, token: str) -> None:
         if len(resp.top_ups) > 30:
             table.add_row("…", "…", "…", "…", "…")
         if not resp.top_ups:
-            console.print("[dim]No top-up history.[/dim]")
+            _console().print("[dim]No top-up history.[/dim]")
         else:
-            console.print(table)
+            _console().print(table)
     finally:
         client.close()
 
@@ -479,12 +485,17 @@ def topup_history(ctx: click.Context, token: str) -> None:
 @click.pass_context
 def defaults(ctx: click.Context) -> None:
     """Fetch defaults (house types, heating types, limits). No auth required."""
+    from pinergy_client.client import PinergyClient
+
     client = PinergyClient(base_url=ctx.obj["base_url"])
     try:
         resp = client.get_defaults_info()
         if not resp.success:
-            console.print(f"[red]{resp.message}[/red]")
-            raise SystemExit(1)
+            _fail(ctx, resp.message)
+        if _emit(ctx, resp):
+            return
+        from rich.table import Table
+
         table = Table(title="Defaults")
         table.add_column("Key", style="cyan")
         table.add_column("Value", style="green")
@@ -494,7 +505,7 @@ def defaults(ctx: click.Context) -> None:
         table.add_row("max_bedrooms", str(resp.max_bedrooms))
         table.add_row("heating_types", str([(f.id, f.name) for f in resp.heating_types]))
         table.add_row("house_types", str([(f.id, f.name) for f in resp.house_types]))
-        console.print(table)
+        _console().print(table)
     finally:
         client.close()
 
@@ -504,16 +515,322 @@ def defaults(ctx: click.Context) -> None:
 @click.pass_context
 def landlord_check(ctx: click.Context, premises: str) -> None:
     """Check if premises is a landlord account. No auth required."""
+    from pinergy_client.client import PinergyClient
+
     client = PinergyClient(base_url=ctx.obj["base_url"])
     try:
         resp = client.landlord_check(premises_number=premises)
+        if _emit(ctx, resp):
+            return
         if resp.is_landlord_account:
-            console.print("[yellow]This is a landlord account.[/yellow]")
+            _console().print("[yellow]This is a landlord account.[/yellow]")
         else:
-            console.print("[green]Not a landlord account.[/green]")
+            _console().print("[green]Not a landlord account.[/green]")
     finally:
         client.close()
 
 
+@main.command()
+@click.option(
+    "--token",
+    "tokens",
+    envvar="PINERGY_AUTH_TOKEN",
+    multiple=True,
+    help="Auth token (repeat to watch several accounts; default: cached login for PINERGY_EMAIL)",
+)
+@click.option("--min-interval", type=float, default=60.0, show_default=True, help="Shortest poll interval (seconds)")
+@click.option("--max-interval", type=float, default=1800.0, show_default=True, help="Longest poll interval (seconds)")
+@click.option("--count", type=int, default=None, help="Stop after this many polls")
+@click.pass_context
+def watch(ctx: click.Context, tokens: tuple[str, ...], min_interval: float, max_interval: float, count: int | None) -> None:
+    """Poll balance continuously, adapting the interval to how often the meter reading changes."""
+    from pinergy_client.fleet import Account
+    from pinergy_client.watch import BalanceWatcher, WatchPolicy
+
+    policy = WatchPolicy(
+        min_interval=min_interval,
+        max_interval=max_interval,
+        initial_interval=min(max(300.0, min_interval), max_interval),
+        urgent_interval=min_interval,
+    )
+    accounts: list[Account | str] = list(tokens)
+    factory = None
+    if not accounts:
+        client = _client(ctx, None)
+        email = os.environ["PINERGY_EMAIL"].strip()
+        accounts = [Account(name=email, auth_token=client.auth_token)]
+        factory = lambda _account: client  # noqa: E731 - reuse the warm, logged-in client
+    with BalanceWatcher(accounts, base_url=ctx.obj["base_url"], policy=policy, client_factory=factory) as watcher:
+        try:
+            for event in watcher.run(max_polls=count):
+                if _machine_output(ctx):
+                    _emit(
+                        ctx,
+                        {
+                            "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                            "account": event.account.name,
+                            "balance": event.balance,
+                            "error": str(event.error) if event.error is not None else None,
+                            "changed": event.changed,
+                            "next_poll_in": event.next_poll_in,
+                        },
+                        stream=True,
+                    )
+                    continue
+                stamp = datetime.now().strftime("%H:%M:%S")
+                name = event.account.name
+                if event.error is not None:
+                    _console().print(f"{stamp} {name} [red]{event.error}[/red] (retry in {event.next_poll_in:.0f}s)")
+                    continue
+                resp = event.balance
+                reading = (
+                    datetime.fromtimestamp(resp.last_reading, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+                    if resp.last_reading
+                    else "—"
+                )
+                parts = [stamp, name, f"[green]€{resp.balance:.2f}[/green]", f"reading {reading}"]
+                if event.changed:
+                    parts.append("(new)")
+                if resp.credit_low:
+                    parts.append("[yellow]credit low[/yellow]")
+                if resp.emergency_credit:
+                    parts.append("[red]emergency credit[/red]")
+                parts.append(f"next in {event.next_poll_in:.0f}s")
+                _console().print(" ".join(parts))
+        except KeyboardInterrupt:
+            pass
+
+
+# `pinergy multi` command name -> PinergyClient method
+_MULTI_COMMANDS = {
+    "balance": "balance",
+    "usage": "get_usage",
+    "level-pay-usage": "get_level_pay_usage",
+    "account": "get_notification_settings",
+    "compare": "compare",
+    "active-topups": "get_active_top_ups",
+    "topup-history": "get_top_up_history",
+    "config": "get_config_info",
+}
+
+
+@main.command()
+@click.argument("command", type=click.Choice(list(_MULTI_COMMANDS)))
+@click.option(
+    "--accounts",
+    "accounts_file",
+    type=click.File("r", encoding="utf-8"),
+    default="-",
+    show_default=True,
+    help="File of accounts, one per line: auth token, `email,password`, or a JSON object (- for stdin)",
+)
+@click.option("--workers", type=click.IntRange(min=1), default=16, show_default=True, help="Concurrent requests")
+@click.pass_context
+def multi(ctx: click.Context, command: str, accounts_file: Any, workers: int) -> None:
+    """Run a read command across many accounts concurrently, one NDJSON line per account.
+
+    Lines are written as each account completes, with `latency_ms` and either `result`
+    (the parsed response) or `error`. Exits 1 if any account failed.
+    """
+    import time
+
+    from pinergy_client.client import PinergyClient
+    from pinergy_client.export import to_jsonable
+    from pinergy_client.fleet import Account, PinergyFleet, load_accounts
+    from pinergy_client.token_store import TokenStore
+
+    try:
+        accounts = load_accounts(accounts_file)
+    except ValueError as e:
+        raise click.UsageError(f"Bad --accounts: {e}") from e
+    if not accounts:
+        raise click.UsageError("No accounts given.")
+    method = _MULTI_COMMANDS[command]
+    store = TokenStore()
+
+    def client_for(account: Account) -> PinergyClient:
+        return PinergyClient(
+            base_url=ctx.obj["base_url"],
+            auth_token=account.auth_token or "",
+            credentials=account.credentials,
+            token_store=store if account.credentials else None,
+        )
+
+    def timed(client: PinergyClient) -> tuple[Any, float]:
+        start = time.perf_counter()
+        try:
+            result = getattr(client, method)()
+        except Exception as e:
+            result = e
+        return result, (time.perf_counter() - start) * 1000
+
+    out = click.get_text_stream("stdout")
+    failed = 0
+    started = time.perf_counter()
+    with PinergyFleet(accounts, max_workers=workers, client_factory=client_for) as fleet:
+        for account, outcome in fleet.map(timed):
+            result, latency = outcome if isinstance(outcome, tuple) else (outcome, None)
+            line: dict[str, Any] = {"account": account.name, "command": command}
+            if latency is not None:
+                line["latency_ms"] = round(latency, 1)
+            if isinstance(result, Exception):
+                failed += 1
+                line.update(ok=False, error=str(result) or type(result).__name__)
+                status = getattr(result, "status_code", None)
+                if status is not None:
+                    line["status_code"] = status
+            else:
+                line.update(ok=True, result=to_jsonable(result))
+            out.write(json.dumps(line, separators=(",", ":"), ensure_ascii=False, default=str) + "\n")
+            out.flush()
+    elapsed = time.perf_counter() - started
+    click.echo(f"{len(accounts) - failed} ok, {failed} failed in {elapsed:.2f}s", err=True)
+    if failed:
+        raise SystemExit(1)
+
+
+_EXPORT_DATASETS = ("usage", "topup-history", "level-pay", "level-pay-periods")
+
+
+@main.command()
+@click.argument("dataset", type=click.Choice(_EXPORT_DATASETS))
+@click.option("--token", envvar="PINERGY_AUTH_TOKEN", help=TOKEN_HELP)
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["csv", "ndjson"]),
+    default="csv",
+    show_default=True,
+    help="Output format",
+)
+@click.option(
+    "--out",
+    "-o",
+    type=click.Path(dir_okay=False, allow_dash=True),
+    default="-",
+    show_default=True,
+    help="File to write (- for stdout)",
+)
+@click.pass_context
+def export(ctx: click.Context, dataset: str, token: str, fmt: str, out: str) -> None:
+    """Stream every record of a dataset as CSV or NDJSON (no tables, no truncation).
+
+    Datasets: `usage` (day/week/month), `topup-history`, `level-pay` (one row per half-hour)
+    and `level-pay-periods` (one row per plan per day/week/month).
+    """
+    from pinergy_client import export as ex
+
+    client = _client(ctx, token)
+    try:
+        if dataset == "usage":
+            resp = client.get_usage()
+            ok, rows, fields = resp.success, ex.usage_rows(resp), ex.USAGE_FIELDS
+        elif dataset == "topup-history":
+            resp = client.get_top_up_history()
+            ok, rows, fields = resp.success, ex.top_up_history_rows(resp), ex.TOP_UP_HISTORY_FIELDS
+        else:
+            resp = client.get_level_pay_usage()
+            ok = resp.success or resp.error_code == 0
+            if dataset == "level-pay":
+                rows, fields = ex.level_pay_rows(resp), ex.LEVEL_PAY_FIELDS
+            else:
+                rows, fields = ex.level_pay_period_rows(resp), ex.LEVEL_PAY_PERIOD_FIELDS
+        if not ok:
+            click.echo(resp.message or "Request failed", err=True)
+            raise SystemExit(1)
+        with click.open_file(out, "w", encoding="utf-8") as f:
+            ex.write_rows(rows, fields, f, fmt)
+    finally:
+        client.close()
+
+
+@main.command()
+@click.option("--token", envvar="PINERGY_AUTH_TOKEN", help=TOKEN_HELP)
+@click.option("--premises", envvar="PINERGY_PREMISES", required=True, help="Premises (card) number to store under")
+@click.option(
+    "--db",
+    type=click.Path(dir_okay=False),
+    default="pinergy_usage.sqlite3",
+    show_default=True,
+    help="SQLite file for half-hourly usage",
+)
+@click.pass_context
+def sync_usage(ctx: click.Context, token: str, premises: str, db: str) -> None:
+    """Merge new Level Pay half-hours into a local SQLite store."""
+    from pinergy_client.store import UsageStore, sync_usage as do_sync
+
+    client = _client(ctx, token)
+    try:
+        with UsageStore(db) as store:
+            result = do_sync(client, store, premises)
+        if _emit(ctx, result):
+            return
+        high_water = (
+            datetime.fromtimestamp(result.high_water_ts, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+            if result.high_water_ts
+            else "—"
+        )
+        _console().print(
+            f"[green]{result.written}[/green] half-hours written, {result.skipped} skipped; "
+            f"stored up to {high_water}."
+        )
+    finally:
+        client.close()
+
+
+@main.command()
+@click.option("--accounts", type=int, default=10, show_default=True, help="Synthetic accounts to generate")
+@click.option("--days", type=int, default=60, show_default=True, help="Days of half-hourly usage per account")
+@click.option("--seed", type=int, default=0, show_default=True, help="Seed for the generated data and faults")
+@click.option("--host", default="127.0.0.1", show_default=True, help="Interface to listen on")
+@click.option("--port", type=int, default=8080, show_default=True, help="Port to listen on (0 picks a free one)")
+@click.option("--latency", type=float, default=0.0, show_default=True, help="Median added latency, seconds")
+@click.option("--latency-sigma", type=float, default=0.0, show_default=True, help="Lognormal spread (0 = fixed)")
+@click.option("--error-rate", type=float, default=0.0, show_default=True, help="Fraction answered 500/502/503")
+@click.option("--throttle-rate", type=float, default=0.0, show_default=True, help="Fraction answered 429")
+@click.option("--reset-rate", type=float, default=0.0, show_default=True, help="Fraction of connections dropped")
+@click.option("--slow-body-rate", type=float, default=0.0, show_default=True, help="Fraction of bodies trickled")
+@click.option("--slow-body-seconds", type=float, default=2.0, show_default=True, help="Time to trickle a slow body")
+@click.option("--verbose", is_flag=True, help="Log every request to stderr")
+def mock_server(
+    accounts: int,
+    days: int,
+    seed: int,
+    host: str,
+    port: int,
+    latency: float,
+    latency_sigma: float,
+    error_rate: float,
+    throttle_rate: float,
+    reset_rate: float,
+    slow_body_rate: float,
+    slow_body_seconds: float,
+    verbose: bool,
+) -> None:
+    """Serve a local stand-in for the Pinergy API with synthetic accounts and injected faults.
+
+    Account i logs in as `user{i}@example.com` / `password{i}`, or use the token `mock-token-{i}`.
+    Point the client at it with `--base-url` or `PINERGY_BASE_URL`.
+    """
+    from pinergy_client.mockserver import Faults, MockPinergyAPI, MockPinergyServer
+
+    faults = Faults(
+        latency=latency,
+        latency_sigma=latency_sigma,
+        error_rate=error_rate,
+        throttle_rate=throttle_rate,
+        reset_rate=reset_rate,
+        slow_body_rate=slow_body_rate,
+        slow_body_seconds=slow_body_seconds,
+    )
+    api = MockPinergyAPI(accounts=accounts, days=days, seed=seed)
+    with MockPinergyServer(api, host=host, port=port, faults=faults, seed=seed, verbose=verbose) as server:
+        click.echo(f"Mock Pinergy API with {accounts} accounts at {server.url} (Ctrl-C to stop)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
 if __name__ == "__main__":
     main()
@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
-import json
 import os
 import secrets
 import string
-import sys
-from typing import Any, IO
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, IO, Iterable, Mapping
 
 import requests
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
 
-from pinergy_client.exceptions import PinergyAPIError, PinergyAuthError
+from pinergy_client.breaker import BreakerPolicy, breaker_for
+from pinergy_client.cache import ResponseCache, request_key
+from pinergy_client.cassette import Cassette
+from pinergy_client.debuglog import DebugLog, debug_log
+from pinergy_client.exceptions import PinergyAPIError, PinergyAuthError, PinergyDeadlineExceeded
 from pinergy_client.models import (
     ActiveTopUpsResponse,
     BalanceResponse,
@@ -37,34 +43,168 @@ from pinergy_client.models import (
     UpdateDeviceTokenRequest,
     UsagesResponse,
 )
+from pinergy_client.hedge import Hedger, HedgePolicy, HedgeStats
+from pinergy_client.metrics import EndpointMetrics, Hook, RequestEvent, emit
+from pinergy_client.singleflight import SingleFlight
+from pinergy_client.transport import (
+    IDEMPOTENT_METHODS,
+    RetryPolicy,
+    TimeoutPair,
+    build_adapter,
+    cap_timeout,
+    deadline_at,
+    mount_adapter,
+    normalize_timeouts,
+    remaining,
+)
+
+if TYPE_CHECKING:
+    from pinergy_client.ratelimit import RateLimiter
+    from pinergy_client.token_store import TokenStore
 
 DEFAULT_BASE_URL = "https://api.pinergy.ie/api"
 AUTH_HEADER = "auth_token"
 DEFAULT_TIMEOUT = (90, 90)  # connect, read in seconds
+DEFAULT_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    # API may reject default python-requests User-Agent; mimic app
+    "User-Agent": "Pinergy/1.0 (Android 14)",
+}
+
+
+def _check_response(method: str, status_code: int, reason: str, data: Any) -> None:
+    """Raise PinergyAPIError for non-2xx responses and failed (success=false) writes.
+
+    401 / 403 raise PinergyAuthError, so callers can tell a rejected token from other failures.
+    """
+    if status_code >= 400:
+        error = PinergyAuthError if status_code in (401, 403) else PinergyAPIError
+        raise error(
+            data.get("message", reason or f"HTTP {status_code}"),
+            status_code=status_code,
+            body=data,
+        )
+    if isinstance(data, dict) and data.get("success") is False and method != "GET":
+        raise PinergyAPIError(
+            data.get("message", "Request failed"),
+            status_code=status_code,
+            body=data,
+        )
+
+
+def _healthy(resp: requests.Response) -> bool:
+    """Whether a response counts as a success for the circuit breaker (anything but 5xx)."""
+    return resp.status_code < 500
+
+
+def _build_login_request(email: str | None, password: str | None, device_token: str) -> LoginRequest:
+    """LoginRequest from explicit or PINERGY_EMAIL / PINERGY_PASSWORD credentials."""
+    email = (email or os.environ.get("PINERGY_EMAIL") or "").strip()
+    raw_password = (password or os.environ.get("PINERGY_PASSWORD") or "").strip()
+    password = hashlib.sha1(raw_password.encode("utf-8")).hexdigest()
+    if not device_token:
+        device_token = PinergyClient._generate_fake_fcm_token()
+    return LoginRequest(
+        email=email,
+        password=password,
+        device_token=(device_token or "").strip(),
+    )
 
 
 class PinergyClient:
-    """HTTP client for the Pinergy API with session-based auth."""
+    """HTTP client for the Pinergy API with session-based auth.
+
+    Transport options: ``pool_connections`` / ``pool_maxsize`` / ``pool_block`` size the
+    urllib3 connection pool, ``keep_alive=False`` closes connections after each request,
+    and ``retry`` (a RetryPolicy) enables backoff retries; without it nothing is retried.
+    ``hooks`` are called with a RequestEvent (method, path, status, bytes, network / TTFB /
+    decode / parse / total times) after every call; ``add_hook()`` registers more later.
+    ``client.metrics`` (an EndpointMetrics, or the one passed as ``metrics``) keeps
+    per-endpoint latency histograms, readable with ``as_dict()`` or ``to_prometheus()``.
+    ``debug`` logs each request and response at DEBUG level: ``True`` prints every call to
+    ``log_stream`` (stdout by default), a DebugLog sends them to the ``pinergy_client.http``
+    logger with sampling, body truncation and redaction, doing no work while DEBUG is off.
+    ``cassette`` (a Cassette) records every response to a file (``mode="record"``, written by
+    ``close()``) or answers requests from one without touching the network (``"replay"``).
+    ``adapter`` reuses an existing HTTPAdapter (and its connection pool) instead of creating
+    one; a shared adapter is left open by ``close()``.
+    ``cache`` (a ResponseCache) serves repeated GETs from memory until their per-endpoint
+    TTL expires; GET methods take ``bypass_cache=True`` to force a fresh request.
+    ``coalesce=True`` makes concurrent identical GETs (same token, path and params) from
+    different threads share one in-flight request and its result or exception.
+    ``hedge`` (a HedgePolicy) re-sends GETs that are slower than the hedge delay and takes
+    whichever response arrives first; ``hedge_stats`` counts how often hedges fire and win.
+    ``breaker`` (a BreakerPolicy) routes requests through the circuit breaker shared by all
+    clients of the same base URL: while it is open calls raise PinergyCircuitOpenError at
+    once instead of waiting out their timeouts. ``rate_limit`` (a RateLimiter, shared by
+    passing the same instance to several clients) queues requests to stay under a rate.
+
+    ``timeout`` is the default (connect, read) timeout and ``timeouts`` overrides it per path,
+    e.g. ``{"/balance": (5, 10), "/levelPayUsage": (10, 120)}``. Every method also takes
+    ``deadline=`` (seconds): an upper bound on the whole call, retries, backoff sleeps and a
+    re-login included. Each attempt's timeouts are shortened to the time left, and
+    PinergyDeadlineExceeded is raised once it runs out. (requests' read timeout bounds the
+    wait between bytes, so a server trickling a body could still overrun slightly.)
+
+    ``credentials=(email, password)`` lets the client log itself in: on first use without a
+    token, and again when the server rejects the token (401/403). Concurrent callers that
+    hit the rejection wait while exactly one of them logs in, then idempotent requests are
+    replayed once with the new token (failed writes are re-raised, not replayed). With a
+    ``token_store`` the token is shared with other processes through the token cache.
+    """
 
     def __init__(
         self,
         base_url: str | None = None,
         auth_token: str | None = None,
-        timeout: tuple[int, int] = DEFAULT_TIMEOUT,
-        debug: bool = False,
+        timeout: TimeoutPair = DEFAULT_TIMEOUT,
+        debug: bool | DebugLog = False,
         log_stream: IO[str] | None = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        keep_alive: bool = True,
+        retry: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = False,
+        credentials: tuple[str, str] | None = None,
+        token_store: TokenStore | None = None,
+        timeouts: Mapping[str, float | TimeoutPair] | None = None,
+        hedge: HedgePolicy | None = None,
+        breaker: BreakerPolicy | None = None,
+        rate_limit: RateLimiter | None = None,
+        adapter: HTTPAdapter | None = None,
+        hooks: Iterable[Hook] = (),
+        metrics: EndpointMetrics | None = None,
+        cassette: Cassette | None = None,
     ):
         base = (base_url or os.environ.get("PINERGY_BASE_URL") or DEFAULT_BASE_URL).rstrip("/")
         token = auth_token if auth_token is not None else os.environ.get("PINERGY_AUTH_TOKEN") or None
         self.base_url = base
         self._timeout = timeout
-        self._debug = debug
-        self._log_stream: IO[str] = log_stream or sys.stdout
+        self._timeouts = normalize_timeouts(timeouts)
+        self._debug_log = debug_log(debug, log_stream)
+        self._retry = retry
+        self.cache = cache
+        self._single_flight = SingleFlight() if coalesce else None
+        self._hedger = Hedger(hedge) if hedge is not None else None
+        self._breaker = breaker_for(base, breaker) if breaker is not None else None
+        self._rate_limit = rate_limit
+        self.metrics = metrics if metrics is not None else EndpointMetrics()
+        self._hooks: list[Hook] = [self.metrics, *hooks]
+        self._credentials = credentials
+        self._token_store = token_store
+        self._device_token = self._generate_fake_fcm_token() if credentials else ""
+        self._auth_lock = threading.Lock()
         self._session = requests.Session()
-        self._session.headers["Content-Type"] = "application/json"
-        self._session.headers["Accept"] = "application/json"
-        # API may reject default python-requests User-Agent; mimic app
-        self._session.headers["User-Agent"] = "Pinergy/1.0 (Android 14)"
+        self._owns_adapter = adapter is None
+        self._cassette = cassette
+        transport = adapter or build_adapter(pool_connections, pool_maxsize, pool_block)
+        mount_adapter(self._session, cassette.adapter(transport) if cassette is not None else transport)
+        self._session.headers.update(DEFAULT_HEADERS)
+        if not keep_alive:
+            self._session.headers["Connection"] = "close"
         if token:
             self._session.headers[AUTH_HEADER] = token
 
@@ -73,9 +213,70 @@ class PinergyClient:
         return self._session.headers.get(AUTH_HEADER)
 
     def set_auth_token(self, token: str) -> None:
-        print(f"Setting auth_token: {token}")
         self._session.headers[AUTH_HEADER] = token
 
+    def add_hook(self, hook: Hook) -> None:
+        """Call ``hook(event)`` with a RequestEvent after every API call."""
+        self._hooks.append(hook)
+
+    @property
+    def hedge_stats(self) -> HedgeStats:
+        return self._hedger.stats if self._hedger is not None else HedgeStats()
+
+    @property
+    def has_credentials(self) -> bool:
+        return self._credentials is not None
+
+    def authenticate(self) -> str:
+        """Apply a token now using the held credentials (cached token first, if a store is set)."""
+        if self._credentials is None:
+            raise PinergyAuthError("No credentials; pass credentials=(email, password).")
+        self._refresh_auth(None)
+        return self.auth_token or ""
+
+    def _refresh_auth(self, stale: str | None, expires: float | None = None) -> None:
+        """Log in with the held credentials, unless another caller already replaced ``stale``.
+
+        With ``expires`` (a monotonic deadline) both the wait for another caller's login and
+        the login request itself are bounded by the time left.
+        """
+        left = self._time_left(expires, "waiting to log in")
+        if not self._auth_lock.acquire(timeout=-1 if left is None else left):
+            raise PinergyDeadlineExceeded("Deadline exceeded waiting to log in")
+        try:
+            if self.auth_token and self.auth_token != stale:
+                return
+            email, password = self._credentials
+            store = self._token_store
+            if store is not None:
+                entry = store.get(email)  # another process may have logged in already
+                if entry and entry.auth_token and entry.auth_token != stale:
+                    self.set_auth_token(entry.auth_token)
+                    return
+            device_token = store.device_token(email) if store is not None else self._device_token
+            resp = self.login(
+                email=email,
+                password=password,
+                device_token=device_token,
+                deadline=self._time_left(expires, "logging in"),
+            )
+            if not resp.success or not resp.auth_token:
+                if store is not None:
+                    store.forget(email)
+                raise PinergyAuthError(resp.message or "Login failed", body={"email": email})
+            if store is not None:
+                store.save(email, resp.auth_token, device_token)
+        finally:
+            self._auth_lock.release()
+
+    @staticmethod
+    def _time_left(expires: float | None, doing: str) -> float | None:
+        """Seconds left before expires (None without a deadline); raises once it has passed."""
+        left = remaining(expires)
+        if left is not None and left <= 0:
+            raise PinergyDeadlineExceeded(f"Deadline exceeded {doing}")
+        return left
+
     # Internal helpers
     @staticmethod
     def _generate_fake_fcm_token(length: int = 152) -> str:
@@ -84,224 +285,443 @@ class PinergyClient:
         body = "".join(secrets.choice(alphabet) for _ in range(length - 5))
         return "APA91" + body
 
-    def _debug_log_request(
-        self,
-        method: str,
-        url: str,
-        *,
-        json_body: dict[str, Any] | None,
-        params: dict[str, str] | None,
-        redact_password: bool = False,
-    ) -> None:
-        if not self._debug:
-            return
-
-        # Build safe headers snapshot
-        headers = dict(self._session.headers)
-        for h in list(headers):
-            if h.lower() in {"auth_token", "authorization"}:
-                headers[h] = "***REDACTED***"
-
-        safe_body: Any = json_body
-        if isinstance(json_body, dict) and redact_password and "password" in json_body:
-            safe_body = {**json_body, "password": "***REDACTED***"}
-
-        print("=== PinergyClient request ===", file=self._log_stream)
-        print(f"{method} {url}", file=self._log_stream)
-        if params:
-            print(f"params={params}", file=self._log_stream)
-        print("headers=", json.dumps(headers, indent=2, sort_keys=True), file=self._log_stream)
-        if safe_body is not None:
-            print("json_body=", json.dumps(safe_body, indent=2, sort_keys=True), file=self._log_stream)
-        else:
-            print("json_body=None", file=self._log_stream)
-
-    def _debug_log_response(self, status_code: int, body: Any) -> None:
-        if not self._debug:
-            return
-        print(f"=== PinergyClient response ({status_code}) ===", file=self._log_stream)
-        try:
-            print(json.dumps(body, indent=2, sort_keys=True), file=self._log_stream)
-        except Exception:
-            print(repr(body), file=self._log_stream)
-
     def _request(
         self,
         method: str,
         path: str,
+        model: type[Any] | None = None,
         *,
         json: dict[str, Any] | None = None,
         params: dict[str, str] | None = None,
         auth_required: bool = True,
+        bypass_cache: bool = False,
+        deadline: float | None = None,
+    ) -> Any:
+        """Make one API call and return ``model.from_dict(data)`` (or the raw dict without a model).
+
+        A RequestEvent describing the call is passed to every hook when it finishes.
+        """
+        event = RequestEvent(method, path)
+        start = time.perf_counter()
+        try:
+            data = self._call(
+                method,
+                path,
+                json=json,
+                params=params,
+                auth_required=auth_required,
+                bypass_cache=bypass_cache,
+                deadline=deadline,
+                event=event,
+            )
+            if model is None:
+                return data
+            parse_start = time.perf_counter()
+            out = model.from_dict(data)
+            event.parse = time.perf_counter() - parse_start
+            return out
+        except BaseException as e:
+            event.error = e
+            raise
+        finally:
+            event.total = time.perf_counter() - start
+            emit(self._hooks, event)
+
+    def _call(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None,
+        params: dict[str, str] | None,
+        auth_required: bool,
+        bypass_cache: bool,
+        deadline: float | None,
+        event: RequestEvent,
     ) -> dict[str, Any]:
+        """Dispatch with a lazy login first and one re-login and replay on 401/403."""
         url = f"{self.base_url}{path}"
-        if auth_required and not self._session.headers.get(AUTH_HEADER):
-            raise PinergyAuthError("Not authenticated; call login() or set auth_token first.")
-        self._debug_log_request(
-            method,
-            url,
-            json_body=json,
-            params=params,
-            redact_password=False,
-        )
-        resp = self._session.request(
+        expires = deadline_at(deadline)
+        timeout = self._timeouts.get(path, self._timeout)
+        # A replayed cassette answers without the token (it never stores one), so needs no login
+        replaying = self._cassette is not None and self._cassette.mode == "replay"
+        if auth_required and not replaying and not self._session.headers.get(AUTH_HEADER):
+            if self._credentials is None:
+                raise PinergyAuthError("Not authenticated; call login() or set auth_token first.")
+            self._refresh_auth(None, expires)
+
+        def dispatch(bypass: bool) -> dict[str, Any]:
+            return self._dispatch(
+                method,
+                path,
+                url,
+                json=json,
+                params=params,
+                auth_required=auth_required,
+                bypass_cache=bypass,
+                timeout=timeout,
+                expires=expires,
+                event=event,
+            )
+
+        if not auth_required or self._credentials is None:
+            return dispatch(bypass_cache)
+        token = self.auth_token
+        try:
+            return dispatch(bypass_cache)
+        except PinergyAuthError as e:
+            if e.status_code not in (401, 403):
+                raise
+            self._refresh_auth(token, expires)
+            if method.upper() not in IDEMPOTENT_METHODS:
+                raise
+        return dispatch(True)  # replay once with the refreshed token
+
+    def _dispatch(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        *,
+        json: dict[str, Any] | None,
+        params: dict[str, str] | None,
+        auth_required: bool,
+        bypass_cache: bool,
+        timeout: TimeoutPair,
+        expires: float | None,
+        event: RequestEvent,
+    ) -> dict[str, Any]:
+        """Serve from cache or fetch, coalescing identical in-flight GETs."""
+        key = request_key(self.auth_token, method, path, params)
+        cache_key = None
+        if self.cache is not None and method == "GET":
+            cache_key = key
+            if not bypass_cache:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    event.cache_hit = True
+                    return cached
+
+        hedged = self._hedger is not None and self._hedger.policy.applies(method, path)
+
+        def fetch() -> dict[str, Any]:
+            return self._fetch(
+                method,
+                url,
+                json=json,
+                params=params,
+                cache_key=cache_key,
+                auth_required=auth_required,
+                timeout=timeout,
+                expires=expires,
+                hedge_path=path if hedged else None,
+                event=event,
+            )
+
+        if self._single_flight is not None and method == "GET":
+            try:
+                return self._single_flight.do(key, fetch, timeout=remaining(expires))
+            except TimeoutError as e:
+                if isinstance(e, PinergyDeadlineExceeded):
+                    raise
+                raise PinergyDeadlineExceeded(f"Deadline exceeded waiting for {method} {path}") from e
+        return fetch()
+
+    def _fetch(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: dict[str, Any] | None,
+        params: dict[str, str] | None,
+        cache_key: tuple | None,
+        auth_required: bool,
+        timeout: TimeoutPair,
+        expires: float | None,
+        hedge_path: str | None = None,
+        event: RequestEvent | None = None,
+    ) -> dict[str, Any]:
+        """Send the request and decode/check the response; store or invalidate cache entries."""
+        log = self._debug_log if self._debug_log is not None and self._debug_log.sampled() else None
+        if log is not None:
+            log.request(method, url, self._session.headers, params, json)
+        sent = time.perf_counter()
+        resp = self._send(
             method,
             url,
             json=json,
             params=params,
-            timeout=self._timeout,
+            timeout=timeout,
+            expires=expires,
+            hedge_path=hedge_path,
+            event=event,
         )
+        decode_start = time.perf_counter()
         try:
             data = resp.json() if resp.content else {}
         except Exception:
             data = {}
-        self._debug_log_response(resp.status_code, data)
-        if not resp.ok:
-            raise PinergyAPIError(
-                data.get("message", resp.reason or f"HTTP {resp.status_code}"),
-                status_code=resp.status_code,
-                body=data,
-            )
-        if isinstance(data, dict) and data.get("success") is False and method != "GET":
-            raise PinergyAPIError(
-                data.get("message", "Request failed"),
-                status_code=resp.status_code,
-                body=data,
-            )
+        if event is not None:
+            event.network += decode_start - sent
+            event.decode += time.perf_counter() - decode_start
+            event.status = resp.status_code
+            event.bytes += len(resp.content)
+            event.ttfb = resp.elapsed.total_seconds()
+        if log is not None:
+            log.response(method, url, resp.status_code, decode_start - sent, resp.content)
+        _check_response(method, resp.status_code, resp.reason, data)
+        if cache_key is not None:
+            # A 200 can still carry "success": false; never keep a failure for the whole TTL
+            if data.get("success") is not False:
+                self.cache.set(cache_key, resp.content)
+        elif self.cache is not None and auth_required:
+            # Writes (top-up, profile edits, ...) can change what the GETs return
+            self.cache.invalidate(self.auth_token)
         return data
 
+    def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: dict[str, Any] | None,
+        params: dict[str, str] | None,
+        timeout: TimeoutPair = DEFAULT_TIMEOUT,
+        expires: float | None = None,
+        hedge_path: str | None = None,
+        event: RequestEvent | None = None,
+    ) -> requests.Response:
+        """Send one request, retrying per self._retry (if set) on transient failures.
+
+        With ``expires`` (monotonic), attempts and backoff sleeps are fitted into the time left.
+        With ``hedge_path`` each attempt is hedged by self._hedger under that path's latencies.
+        """
+        attempt = 0
+        while True:
+            left = remaining(expires)
+            if left is not None and left <= 0:
+                raise PinergyDeadlineExceeded(f"Deadline exceeded before {method} {url}")
+            send = functools.partial(
+                self._session.request,
+                method,
+                url,
+                json=json,
+                params=params,
+                timeout=cap_timeout(timeout, left),
+            )
+            if self._breaker is not None:
+                send = functools.partial(self._breaker.call, send, ok=_healthy)
+            if self._rate_limit is not None:
+                send = functools.partial(self._throttled, send, expires)
+            if event is not None:
+                event.attempts += 1
+            try:
+                if hedge_path is None:
+                    resp = send()
+                else:
+                    resp = self._hedger.do(hedge_path, send, discard=requests.Response.close)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if isinstance(e, requests.Timeout) and expires is not None and remaining(expires) <= 0:
+                    raise PinergyDeadlineExceeded(f"Deadline exceeded during {method} {url}") from e
+                if self._retry is None:
+                    raise
+                delay = self._retry.next_delay(
+                    method,
+                    attempt,
+                    # ConnectTimeout is raised before anything was sent
+                    connect_failed=isinstance(e, requests.ConnectTimeout),
+                )
+                if delay is None:
+                    raise
+            else:
+                if self._retry is None:
+                    return resp
+                delay = self._retry.next_delay(
+                    method, attempt, status=resp.status_code, headers=resp.headers
+                )
+                if delay is None:
+                    return resp
+                left = remaining(expires)
+                if left is not None and delay >= left:
+                    return resp  # no time for another attempt: surface this response
+                resp.close()
+            left = remaining(expires)
+            if left is not None and delay >= left:
+                raise PinergyDeadlineExceeded(f"Deadline exceeded retrying {method} {url}")
+            attempt += 1
+            time.sleep(delay)
+
+    def _throttled(self, send: Callable[[], requests.Response], expires: float | None) -> requests.Response:
+        """Wait for a rate-limit slot (no longer than the deadline allows), then send."""
+        self._rate_limit.acquire(self.auth_token, max_wait=remaining(expires))
+        return send()
+
     def login(
         self,
         email: str | None = None,
         password: str | None = None,
         device_token: str = "",
+        *,
+        deadline: float | None = None,
     ) -> LoginResponse:
         """Authenticate and set auth_token on this session.
 
         Email and password default to PINERGY_EMAIL and PINERGY_PASSWORD from the environment if not provided.
         Sends only email, SHA-1(UTF-8) hex of password, and device_token (matches LoginApiRequest).
         """
-        email = (email or os.environ.get("PINERGY_EMAIL") or "").strip()
-        raw_password = (password or os.environ.get("PINERGY_PASSWORD") or "").strip()
-        password = hashlib.sha1(raw_password.encode("utf-8")).hexdigest()
-        if not device_token:
-            device_token = self._generate_fake_fcm_token()
-        req = LoginRequest(
-            email=email,
-            password=password,
-            device_token=(device_token or "").strip(),
+        req = _build_login_request(email, password, device_token)
+        out = self._request(
+            "POST", "/login", LoginResponse, json=req.to_dict(), auth_required=False, deadline=deadline
         )
-        data = self._request("POST", "/login", json=req.to_dict(), auth_required=False)
-        out = LoginResponse.from_dict(data)
         if out.auth_token:
             self.set_auth_token(out.auth_token)
         return out
 
-    def logout(self) -> BaseResponse:
-        data = self._request("POST", "/logout", json={})
-        return BaseResponse.from_dict(data)
+    def logout(self, *, deadline: float | None = None) -> BaseResponse:
+        return self._request("POST", "/logout", BaseResponse, json={}, deadline=deadline)
 
-    def forgot_password(self, email: str) -> BaseResponse:
-        data = self._request(
-            "POST", "/forgot", params={"email": email}, json={}, auth_required=False
+    def forgot_password(self, email: str, *, deadline: float | None = None) -> BaseResponse:
+        return self._request(
+            "POST",
+            "/forgot",
+            BaseResponse,
+            params={"email": email},
+            json={},
+            auth_required=False,
+            deadline=deadline,
         )
-        return BaseResponse.from_dict(data)
 
-    def change_password(self, new_password: str) -> BaseResponse:
+    def change_password(self, new_password: str, *, deadline: float | None = None) -> BaseResponse:
         from pinergy_client.models import ChangePasswordRequest
 
         req = ChangePasswordRequest(new_password=new_password)
-        data = self._request("POST", "/changepass", json=req.to_dict())
-        return BaseResponse.from_dict(data)
+        return self._request("POST", "/changepass", BaseResponse, json=req.to_dict(), deadline=deadline)
 
-    def balance(self) -> BalanceResponse:
-        data = self._request("GET", "/balance")
-        return BalanceResponse.from_dict(data)
+    def balance(self, *, bypass_cache: bool = False, deadline: float | None = None) -> BalanceResponse:
+        return self._request("GET", "/balance", BalanceResponse, bypass_cache=bypass_cache, deadline=deadline)
 
-    def top_up(self, request: TopUpRequest) -> TopUpResponse:
-        data = self._request("POST", "/topup", json=request.to_dict())
-        return TopUpResponse.from_dict(data)
+    def top_up(self, request: TopUpRequest, *, deadline: float | None = None) -> TopUpResponse:
+        return self._request("POST", "/topup", TopUpResponse, json=request.to_dict(), deadline=deadline)
 
-    def schedule_top_up(self, request: TopUpRequest) -> BaseResponse:
-        data = self._request("POST", "/scheduletopup", json=request.to_dict())
-        return BaseResponse.from_dict(data)
+    def schedule_top_up(self, request: TopUpRequest, *, deadline: float | None = None) -> BaseResponse:
+        return self._request(
+            "POST", "/scheduletopup", BaseResponse, json=request.to_dict(), deadline=deadline
+        )
 
-    def auto_top_up(self, request: TopUpRequest) -> BaseResponse:
-        data = self._request("POST", "/autotopup", json=request.to_dict())
-        return BaseResponse.from_dict(data)
+    def auto_top_up(self, request: TopUpRequest, *, deadline: float | None = None) -> BaseResponse:
+        return self._request("POST", "/autotopup", BaseResponse, json=request.to_dict(), deadline=deadline)
 
-    def get_active_top_ups(self) -> ActiveTopUpsResponse:
-        data = self._request("GET", "/activetopups")
-        return ActiveTopUpsResponse.from_dict(data)
+    def get_active_top_ups(
+        self, *, bypass_cache: bool = False, deadline: float | None = None
+    ) -> ActiveTopUpsResponse:
+        return self._request(
+            "GET", "/activetopups", ActiveTopUpsResponse, bypass_cache=bypass_cache, deadline=deadline
+        )
 
-    def get_top_up_history(self) -> TopUpHistoryResponse:
-        data = self._request("GET", "/topuphistory")
-        return TopUpHistoryResponse.from_dict(data)
+    def get_top_up_history(
+        self, *, bypass_cache: bool = False, deadline: float | None = None
+    ) -> TopUpHistoryResponse:
+        return self._request(
+            "GET", "/topuphistory", TopUpHistoryResponse, bypass_cache=bypass_cache, deadline=deadline
+        )
 
-    def get_usage(self) -> UsagesResponse:
-        data = self._request("GET", "/usage")
-        return UsagesResponse.from_dict(data)
+    def get_usage(self, *, bypass_cache: bool = False, deadline: float | None = None) -> UsagesResponse:
+        return self._request("GET", "/usage", UsagesResponse, bypass_cache=bypass_cache, deadline=deadline)
 
-    def get_level_pay_usage(self) -> LevelPayUsage:
-        data = self._request("GET", "/levelPayUsage")
-        return LevelPayUsage.from_dict(data)
+    def get_level_pay_usage(
+        self, *, bypass_cache: bool = False, deadline: float | None = None
+    ) -> LevelPayUsage:
+        return self._request(
+            "GET", "/levelPayUsage", LevelPayUsage, bypass_cache=bypass_cache, deadline=deadline
+        )
 
-    def compare(self) -> CompareResponse:
-        data = self._request("GET", "/compare")
-        return CompareResponse.from_dict(data)
+    def compare(self, *, bypass_cache: bool = False, deadline: float | None = None) -> CompareResponse:
+        return self._request("GET", "/compare", CompareResponse, bypass_cache=bypass_cache, deadline=deadline)
 
-    def edit_profile(self, request: EditProfileRequest) -> BaseResponse:
-        data = self._request("POST", "/editprofile", json=request.to_dict())
-        return BaseResponse.from_dict(data)
+    def edit_profile(self, request: EditProfileRequest, *, deadline: float | None = None) -> BaseResponse:
+        return self._request("POST", "/editprofile", BaseResponse, json=request.to_dict(), deadline=deadline)
 
-    def update_house(self, request: EditHouseDetailsRequest) -> BaseResponse:
-        data = self._request("POST", "/updatehouse", json=request.to_dict())
-        return BaseResponse.from_dict(data)
+    def update_house(
+        self, request: EditHouseDetailsRequest, *, deadline: float | None = None
+    ) -> BaseResponse:
+        return self._request("POST", "/updatehouse", BaseResponse, json=request.to_dict(), deadline=deadline)
 
-    def get_notification_settings(self) -> GetPrefsResponse:
-        data = self._request("GET", "/getnotif")
-        return GetPrefsResponse.from_dict(data)
+    def get_notification_settings(
+        self, *, bypass_cache: bool = False, deadline: float | None = None
+    ) -> GetPrefsResponse:
+        return self._request(
+            "GET", "/getnotif", GetPrefsResponse, bypass_cache=bypass_cache, deadline=deadline
+        )
 
     def update_notification_settings(
-        self, request: NotificationSettingsRequest
+        self, request: NotificationSettingsRequest, *, deadline: float | None = None
     ) -> NotificationSettingsResponse:
-        data = self._request("POST", "/updatenotif", json=request.to_dict())
-        return NotificationSettingsResponse.from_dict(data)
+        return self._request(
+            "POST", "/updatenotif", NotificationSettingsResponse, json=request.to_dict(), deadline=deadline
+        )
 
-    def update_device_token(self, request: UpdateDeviceTokenRequest) -> BaseResponse:
-        data = self._request("POST", "/updatedevicetoken", json=request.to_dict())
-        return BaseResponse.from_dict(data)
+    def update_device_token(
+        self, request: UpdateDeviceTokenRequest, *, deadline: float | None = None
+    ) -> BaseResponse:
+        return self._request(
+            "POST", "/updatedevicetoken", BaseResponse, json=request.to_dict(), deadline=deadline
+        )
 
-    def delete_credit_card(self, cc_token: str) -> BaseResponse:
+    def delete_credit_card(self, cc_token: str, *, deadline: float | None = None) -> BaseResponse:
         from pinergy_client.models import DeleteCreditCardRequest
 
         req = DeleteCreditCardRequest(cc_token=cc_token)
-        data = self._request("POST", "/deletecc", json=req.to_dict())
-        return BaseResponse.from_dict(data)
+        return self._request("POST", "/deletecc", BaseResponse, json=req.to_dict(), deadline=deadline)
 
-    def get_config_info(self) -> ConfigInfoResponse:
-        data = self._request("GET", "/configinfo")
-        return ConfigInfoResponse.from_dict(data)
+    def get_config_info(
+        self, *, bypass_cache: bool = False, deadline: float | None = None
+    ) -> ConfigInfoResponse:
+        return self._request(
+            "GET", "/configinfo", ConfigInfoResponse, bypass_cache=bypass_cache, deadline=deadline
+        )
 
-    def get_defaults_info(self) -> DefaultInfoResponse:
-        data = self._request("GET", "/defaultsinfo", auth_required=False)
-        return DefaultInfoResponse.from_dict(data)
+    def get_defaults_info(
+        self, *, bypass_cache: bool = False, deadline: float | None = None
+    ) -> DefaultInfoResponse:
+        return self._request(
+            "GET",
+            "/defaultsinfo",
+            DefaultInfoResponse,
+            auth_required=False,
+            bypass_cache=bypass_cache,
+            deadline=deadline,
+        )
 
-    def landlord_check(self, premises_number: str) -> LandLordCheckResponse:
-        data = self._request(
+    def landlord_check(
+        self, premises_number: str, *, bypass_cache: bool = False, deadline: float | None = None
+    ) -> LandLordCheckResponse:
+        return self._request(
             "GET",
             "/landlordcheck",
+            LandLordCheckResponse,
             params={"premises_number": premises_number},
             auth_required=False,
+            bypass_cache=bypass_cache,
+            deadline=deadline,
         )
-        return LandLordCheckResponse.from_dict(data)
 
-    def landlord_verify(self, request: LandlordRequest) -> BaseResponse:
-        data = self._request("POST", "/landlordverify", json=request.to_dict(), auth_required=False)
-        return BaseResponse.from_dict(data)
+    def landlord_verify(self, request: LandlordRequest, *, deadline: float | None = None) -> BaseResponse:
+        return self._request(
+            "POST",
+            "/landlordverify",
+            BaseResponse,
+            json=request.to_dict(),
+            auth_required=False,
+            deadline=deadline,
+        )
 
     def close(self) -> None:
-        self._session.close()
+        if self._hedger is not None:
+            self._hedger.close()
+        if self._cassette is not None:
+            self._cassette.save()
+        if self._owns_adapter:
+            self._session.close()  # closes the adapter's pooled connections
 
     def __enter__(self) -> PinergyClient:
         return self
@@ -0,0 +1,144 @@
+"""Request/response debug logging through ``logging``: lazy, sampled, truncated and redacted."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import IO, Any, Mapping
+
+LOGGER_NAME = "pinergy_client.http"
+
+# Header names and JSON keys whose values never reach the log (compared case-insensitively)
+DEFAULT_REDACT = frozenset({"auth_token", "authorization", "cookie", "set-cookie", "password", "device_token"})
+
+REDACTED = "***REDACTED***"
+
+
+class _Headers:
+    """Headers formatted (and redacted) only if the record is actually emitted."""
+
+    __slots__ = ("headers", "redact")
+
+    def __init__(self, headers: Mapping[str, str], redact: frozenset[str]):
+        self.headers = headers
+        self.redact = redact
+
+    def __str__(self) -> str:
+        return repr({k: REDACTED if k.lower() in self.redact else v for k, v in self.headers.items()})
+
+
+class _Body:
+    """A JSON body cut to ``limit`` bytes, with redacted keys' string values masked.
+
+    Truncation happens before decoding and redaction, so a large response costs no more
+    to log than its first ``limit`` bytes.
+    """
+
+    __slots__ = ("body", "limit", "pattern")
+
+    def __init__(self, body: bytes | Mapping[str, Any] | None, limit: int | None, pattern: re.Pattern[str]):
+        self.body = body
+        self.limit = limit
+        self.pattern = pattern
+
+    def __str__(self) -> str:
+        body = self.body
+        if body is None:
+            return "None"
+        if not isinstance(body, bytes):
+            body = json.dumps(body, separators=(",", ":")).encode()
+        size, suffix = len(body), ""
+        if self.limit is not None and size > self.limit:
+            body, suffix = body[: self.limit], f"... ({size} bytes)"
+        return self.pattern.sub(rf'\1"{REDACTED}"', body.decode("utf-8", "replace")) + suffix
+
+
+def _pattern(keys: frozenset[str]) -> re.Pattern[str]:
+    # "key": "value" -- the closing quote is optional so a value cut by truncation is masked too
+    names = "|".join(re.escape(k) for k in sorted(keys))
+    return re.compile(rf'("(?i:{names})"\s*:\s*)"(?:[^"\\]|\\.)*"?')
+
+
+@dataclass(frozen=True)
+class DebugLog:
+    """How a client logs its HTTP traffic: each request and response at DEBUG level.
+
+    Records go to the ``pinergy_client.http`` logger (or ``logger``), so handlers, levels
+    and formatting come from the application's logging config. Nothing is formatted while
+    DEBUG is disabled for that logger, and only one call in ``sample`` is logged at all.
+    Bodies are cut to ``max_body`` bytes (None: no limit); header and JSON-key values named
+    in ``redact`` are masked.
+
+        logging.getLogger("pinergy_client.http").setLevel(logging.DEBUG)
+        client = PinergyClient(debug=DebugLog(sample=100, max_body=512))
+    """
+
+    sample: int = 1
+    max_body: int | None = 2048
+    redact: frozenset[str] = DEFAULT_REDACT
+    logger: logging.Logger | None = None
+    _calls: itertools.count = field(default_factory=itertools.count, init=False, repr=False, compare=False)
+    _pattern: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.sample < 1:
+            raise ValueError("sample must be >= 1")
+        redact = frozenset(k.lower() for k in self.redact)
+        object.__setattr__(self, "redact", redact)
+        object.__setattr__(self, "_pattern", _pattern(redact))
+        if self.logger is None:
+            object.__setattr__(self, "logger", logging.getLogger(LOGGER_NAME))
+
+    @classmethod
+    def to_stream(cls, stream: IO[str] | None = None, **kwargs: Any) -> DebugLog:
+        """Log every call to stream (default stdout) regardless of logging config; used by ``debug=True``."""
+        logger = logging.Logger(LOGGER_NAME, logging.DEBUG)  # private: not registered with logging
+        handler = logging.StreamHandler(stream or sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        return cls(logger=logger, **kwargs)
+
+    def sampled(self) -> bool:
+        """Whether to log the call about to be sent; cheap when DEBUG is off."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return False
+        # next() on itertools.count is atomic under the GIL, so threads share one sequence
+        return self.sample == 1 or next(self._calls) % self.sample == 0
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        params: Mapping[str, str] | None,
+        body: Mapping[str, Any] | None,
+    ) -> None:
+        self.logger.debug(
+            "%s %s params=%s headers=%s body=%s",
+            method,
+            url,
+            params,
+            _Headers(headers, self.redact),
+            _Body(body, self.max_body, self._pattern),
+        )
+
+    def response(self, method: str, url: str, status: int, elapsed: float, body: bytes) -> None:
+        self.logger.debug(
+            "%s %s -> %s in %.3fs body=%s",
+            method,
+            url,
+            status,
+            elapsed,
+            _Body(body, self.max_body, self._pattern),
+        )
+
+
+def debug_log(debug: bool | DebugLog, stream: IO[str] | None = None) -> DebugLog | None:
+    """The DebugLog for a client's ``debug`` argument (True: every call in full, to stream or stdout)."""
+    if isinstance(debug, DebugLog):
+        return debug
+    return DebugLog.to_stream(stream, max_body=None) if debug else None
@@ -12,3 +12,27 @@ class PinergyAPIError(Exception):
 
 class PinergyAuthError(PinergyAPIError):
     """Raised when authentication fails or token is missing/invalid."""
+
+
+class PinergyDeadlineExceeded(PinergyAPIError, TimeoutError):
+    """Raised when a call's ``deadline`` expires, including time spent on retries."""
+
+
+class PinergyCircuitOpenError(PinergyAPIError):
+    """Raised without contacting the server while the circuit breaker for its base URL is open."""
+
+    def __init__(self, message: str, retry_in: float = 0.0):
+        super().__init__(message)
+        self.retry_in = retry_in  # seconds until the breaker lets a trial request through
+
+
+class PinergyRateLimitError(PinergyAPIError):
+    """Raised before sending when the client-side rate limiter's queue wait would exceed its max."""
+
+    def __init__(self, message: str, retry_in: float = 0.0):
+        super().__init__(message)
+        self.retry_in = retry_in  # seconds until a slot frees up
+
+
+class PinergyCassetteError(PinergyAPIError):
+    """Raised when replaying a cassette that has no recorded response for the request."""
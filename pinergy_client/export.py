@@ -0,0 +1,135 @@
+"""Flat row streams over the typed responses, written as CSV or NDJSON.
+
+Each ``*_rows`` function yields one tuple per record (matching its ``*_FIELDS`` header) without
+building anything beyond the response itself; the writers emit rows as they are produced.
+``to_jsonable`` turns a whole response model into plain JSON types.
+"""
+
+from __future__ import annotations
+
+import csv
+import dataclasses
+import json
+from array import array
+from datetime import date, datetime, timezone
+from typing import IO, Any, Iterable, Iterator, Sequence
+
+from pinergy_client.models import (
+    LevelPayUsage,
+    PlanMatrix,
+    TopUpHistoryResponse,
+    UsagesResponse,
+)
+
+Row = tuple[object, ...]
+
+USAGE_FIELDS = ("period", "date", "timestamp", "kwh", "amount", "co2")
+TOP_UP_HISTORY_FIELDS = ("top_up_id", "date", "timestamp", "amount", "action", "code")
+LEVEL_PAY_FIELDS = ("day", "slot", "kwh", "euro")
+LEVEL_PAY_PERIOD_FIELDS = ("period", "label", "plan", "kwh", "euro")
+
+FORMATS = ("csv", "ndjson")
+
+
+def _iso_date(ts: int) -> str:
+    """UTC date for an API timestamp (seconds), or "" when unset."""
+    if ts <= 0:
+        return ""
+    try:
+        return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
+    except (OSError, ValueError, OverflowError):
+        return ""
+
+
+def to_jsonable(obj: Any) -> Any:
+    """Plain JSON value for a response model: dataclasses to dicts, arrays and views to lists."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: to_jsonable(getattr(obj, f.name)) for f in dataclasses.fields(obj)}
+    if isinstance(obj, (array, memoryview)):
+        return obj.tolist()
+    if isinstance(obj, dict):
+        return {str(k): to_jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return [to_jsonable(v) for v in obj]
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    return obj
+
+
+def usage_rows(resp: UsagesResponse) -> Iterator[Row]:
+    """One row per usage entry across the day, week and month series."""
+    for period, items in (("day", resp.day), ("week", resp.week), ("month", resp.month)):
+        for u in items:
+            yield (period, _iso_date(u.date), u.date, u.kwh, u.amount, u.co2)
+
+
+def top_up_history_rows(resp: TopUpHistoryResponse) -> Iterator[Row]:
+    """One row per historical top-up."""
+    for t in resp.top_ups:
+        yield (t.top_up_id, _iso_date(t.top_up_date), t.top_up_date, t.top_up_amount, t.top_up_action, t.top_up_code)
+
+
+def level_pay_rows(usage: LevelPayUsage) -> Iterator[Row]:
+    """One row per (day, half-hour slot) of Level Pay daily data."""
+    daily = usage.daily
+    if daily is None:
+        return
+    slots = daily.slot_labels
+    for d, day in enumerate(daily.day_labels):
+        kwh = daily.day_kwh_slots(d)
+        euro = daily.day_euro_slots(d)
+        for s, slot in enumerate(slots):
+            yield (day, slot, kwh[s], euro[s])
+
+
+def _matrix_rows(period: str, kwh: PlanMatrix, euro: PlanMatrix) -> Iterator[Row]:
+    euro_index = {plan: p for p, plan in enumerate(euro.plans)}
+    for p, plan in enumerate(kwh.plans):
+        e = euro_index.get(plan)
+        for i, label in enumerate(kwh.labels):
+            yield (period, label, plan, kwh.value(p, i), euro.value(e, i) if e is not None else 0.0)
+
+
+def level_pay_period_rows(usage: LevelPayUsage) -> Iterator[Row]:
+    """One row per (period, label, plan) for the daily, seven-day, weekly and monthly breakdowns."""
+    if usage.daily is not None:
+        yield from _matrix_rows("daily", usage.daily.day_kwh, usage.daily.day_euro)
+    for period, periods in (
+        ("seven_days", usage.seven_days),
+        ("weekly", usage.weekly),
+        ("monthly", usage.monthly),
+    ):
+        if periods is not None:
+            yield from _matrix_rows(period, periods.kwh, periods.euro)
+
+
+def write_csv(rows: Iterable[Row], fields: Sequence[str], out: IO[str], header: bool = True) -> int:
+    """Write rows as CSV (with a header line unless ``header`` is False); returns the row count."""
+    writer = csv.writer(out, lineterminator="\n")
+    if header:
+        writer.writerow(fields)
+    n = 0
+    for row in rows:
+        writer.writerow(row)
+        n += 1
+    return n
+
+
+def write_ndjson(rows: Iterable[Row], fields: Sequence[str], out: IO[str]) -> int:
+    """Write rows as newline-delimited JSON objects keyed by fields; returns the row count."""
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    n = 0
+    for row in rows:
+        out.write(dumps(dict(zip(fields, row))))
+        out.write("\n")
+        n += 1
+    return n
+
+
+def write_rows(rows: Iterable[Row], fields: Sequence[str], out: IO[str], fmt: str = "csv") -> int:
+    """Write rows in ``fmt`` ("csv" or "ndjson"); returns the row count."""
+    if fmt == "csv":
+        return write_csv(rows, fields, out)
+    if fmt == "ndjson":
+        return write_ndjson(rows, fields, out)
+    raise ValueError(f"Unknown export format: {fmt!r} (expected one of {', '.join(FORMATS)})")
@@ -0,0 +1,213 @@
+"""Fan calls out across many Pinergy accounts with bounded concurrency."""
+
+from __future__ import annotations
+
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+from pinergy_client.client import PinergyClient
+from pinergy_client.exceptions import PinergyAuthError
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_PER_ACCOUNT = 1
+
+
+@dataclass(frozen=True)
+class Account:
+    """One account in a fleet: either an existing auth token or email/password credentials.
+
+    Raises ValueError for an account with neither, which would otherwise fall back to the
+    PINERGY_EMAIL / PINERGY_PASSWORD login and report another account's data under this name.
+    """
+
+    name: str
+    auth_token: str | None = None
+    email: str | None = None
+    password: str | None = None
+
+    def __post_init__(self) -> None:
+        if not self.auth_token and not self.email:
+            raise ValueError(f"Account {self.name!r} has neither an auth token nor an email")
+
+    @property
+    def credentials(self) -> tuple[str, str] | None:
+        """(email, password) for clients that re-login when the token expires, if known."""
+        return (self.email, self.password or "") if self.email else None
+
+    @classmethod
+    def coerce(cls, value: Account | str | tuple[str, str], index: int = 0) -> Account:
+        """Account from an Account, a bare auth token, or an (email, password) pair."""
+        if isinstance(value, Account):
+            return value
+        if isinstance(value, str):
+            return cls(name=f"account-{index}", auth_token=value)
+        email, password = value
+        return cls(name=email, email=email, password=password)
+
+
+def load_accounts(lines: Iterable[str]) -> list[Account]:
+    """Accounts from text lines: a bare auth token, ``email,password``, or a JSON object with
+    ``name`` / ``auth_token`` (or ``token``) / ``email`` / ``password``. Blank and ``#`` lines are skipped.
+
+    Raises ValueError, naming the line, for a JSON account with neither a token nor an email.
+    """
+    accounts: list[Account] = []
+    for lineno, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        index = len(accounts)
+        try:
+            if line.startswith("{"):
+                d = json.loads(line)
+                token = d.get("auth_token") or d.get("token")
+                email = d.get("email")
+                name = d.get("name") or email or f"account-{index}"
+                accounts.append(Account(name=name, auth_token=token, email=email, password=d.get("password")))
+            elif "," in line and "@" in line.split(",", 1)[0]:
+                email, password = line.split(",", 1)
+                accounts.append(Account.coerce((email.strip(), password), index))
+            else:
+                accounts.append(Account.coerce(line, index))
+        except ValueError as e:
+            raise ValueError(f"Line {lineno}: {e}") from e
+    return accounts
+
+
+class FleetMember:
+    """Per-account state: warm client, login lock and concurrency semaphore.
+
+    ``ensure_login()`` makes sure the client holds a token before a call, logging in at
+    most once even when several threads ask at the same time.
+    """
+
+    def __init__(self, account: Account, client: PinergyClient, per_account: int):
+        self.account = account
+        self.client = client
+        self.slots = threading.BoundedSemaphore(per_account)
+        self.login_lock = threading.Lock()
+
+    def ensure_login(self) -> None:
+        if self.client.auth_token:
+            return
+        with self.login_lock:
+            if self.client.auth_token:
+                return
+            if self.client.has_credentials:
+                self.client.authenticate()  # token cache / stable device token, if configured
+                return
+            if not self.account.email:
+                # login() without an email would use PINERGY_EMAIL, i.e. someone else's account
+                raise PinergyAuthError("No auth token or credentials", body={"account": self.account.name})
+            resp = self.client.login(email=self.account.email, password=self.account.password)
+            if not resp.success or not resp.auth_token:
+                raise PinergyAuthError(resp.message or "Login failed", body={"account": self.account.name})
+
+
+def member_for(
+    account: Account,
+    base_url: str | None = None,
+    client_factory: Callable[[Account], PinergyClient] | None = None,
+    per_account: int = DEFAULT_PER_ACCOUNT,
+) -> FleetMember:
+    """FleetMember for account, with a client from client_factory or a PinergyClient on base_url."""
+    if client_factory is not None:
+        client = client_factory(account)
+    else:
+        client = PinergyClient(
+            base_url=base_url, auth_token=account.auth_token or "", credentials=account.credentials
+        )
+    return FleetMember(account, client, per_account)
+
+
+class PinergyFleet:
+    """Run the same client call across many accounts.
+
+    Calls run on a shared thread pool of ``max_workers`` (the global cap), and at most
+    ``per_account`` calls run against any one account at a time. Results stream back as
+    ``(account, result_or_exception)`` pairs in completion order, so one slow meter never
+    holds up the others. Each account keeps one warm PinergyClient for the fleet's lifetime;
+    clients for email/password accounts log in again by themselves if their token expires.
+    """
+
+    def __init__(
+        self,
+        accounts: Iterable[Account | str | tuple[str, str]],
+        base_url: str | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        per_account: int = DEFAULT_PER_ACCOUNT,
+        client_factory: Callable[[Account], PinergyClient] | None = None,
+    ):
+        if max_workers < 1 or per_account < 1:
+            raise ValueError("max_workers and per_account must be >= 1")
+        self._members = [
+            member_for(account, base_url, client_factory, per_account)
+            for account in (Account.coerce(a, i) for i, a in enumerate(accounts))
+        ]
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pinergy-fleet")
+
+    @property
+    def accounts(self) -> list[Account]:
+        return [m.account for m in self._members]
+
+    def _run(self, member: FleetMember, fn: Callable[[PinergyClient], T]) -> T:
+        with member.slots:
+            member.ensure_login()
+            return fn(member.client)
+
+    def map(self, fn: Callable[[PinergyClient], T]) -> Iterator[tuple[Account, T | Exception]]:
+        """Call ``fn(client)`` for every account; yield (account, result or exception) as each finishes."""
+        futures: dict[Future[T], Account] = {
+            self._executor.submit(self._run, m, fn): m.account for m in self._members
+        }
+        try:
+            for fut in as_completed(futures):
+                exc = fut.exception()
+                yield futures[fut], (exc if exc is not None else fut.result())
+        finally:
+            for fut in futures:
+                fut.cancel()
+
+    def call(self, method: str, *args: Any, **kwargs: Any) -> Iterator[tuple[Account, Any]]:
+        """Call the named PinergyClient method on every account (see map)."""
+        return self.map(lambda c: getattr(c, method)(*args, **kwargs))
+
+    def balance(self) -> Iterator[tuple[Account, Any]]:
+        return self.call("balance")
+
+    def get_usage(self) -> Iterator[tuple[Account, Any]]:
+        return self.call("get_usage")
+
+    def get_level_pay_usage(self) -> Iterator[tuple[Account, Any]]:
+        return self.call("get_level_pay_usage")
+
+    def get_active_top_ups(self) -> Iterator[tuple[Account, Any]]:
+        return self.call("get_active_top_ups")
+
+    def get_top_up_history(self) -> Iterator[tuple[Account, Any]]:
+        return self.call("get_top_up_history")
+
+    def compare(self) -> Iterator[tuple[Account, Any]]:
+        return self.call("compare")
+
+    def get_config_info(self) -> Iterator[tuple[Account, Any]]:
+        return self.call("get_config_info")
+
+    def get_notification_settings(self) -> Iterator[tuple[Account, Any]]:
+        return self.call("get_notification_settings")
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for m in self._members:
+            m.client.close()
+
+    def __enter__(self) -> PinergyFleet:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
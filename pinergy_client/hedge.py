@@ -0,0 +1,190 @@
+"""Hedged requests: re-send a slow idempotent GET and take whichever answer arrives first."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """When to send a duplicate of an in-flight GET.
+
+    If an attempt has not answered after the hedge delay, another identical request is
+    sent (up to ``max_hedges`` extra) and the first response to arrive wins. The delay
+    is ``delay`` when set; otherwise the ``quantile`` (p95) of the last ``window``
+    latencies seen for that path, or ``initial_delay`` until ``min_samples`` have been
+    observed. Only GETs are ever hedged; ``paths`` restricts hedging further
+    (e.g. ``frozenset({"/usage", "/levelPayUsage"})``).
+    """
+
+    delay: float | None = None
+    quantile: float = 0.95
+    initial_delay: float = 1.0
+    window: int = 200
+    min_samples: int = 20
+    max_hedges: int = 1
+    paths: frozenset[str] | None = None
+    max_workers: int = 32  # threads shared by all hedged calls of one PinergyClient
+
+    def applies(self, method: str, path: str) -> bool:
+        return method.upper() == "GET" and self.max_hedges > 0 and (self.paths is None or path in self.paths)
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    """Counters for one client: hedgeable calls, hedge requests sent, and calls a hedge won."""
+
+    calls: int = 0
+    fired: int = 0
+    won: int = 0
+
+
+class _Latencies:
+    """Recent winning latencies per path, for the adaptive hedge delay."""
+
+    def __init__(self, policy: HedgePolicy) -> None:
+        self.policy = policy
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def delay_for(self, path: str) -> float:
+        if self.policy.delay is not None:
+            return self.policy.delay
+        with self._lock:
+            samples = sorted(self._samples.get(path, ()))
+        if len(samples) < self.policy.min_samples:
+            return self.policy.initial_delay
+        return samples[min(len(samples) - 1, int(self.policy.quantile * len(samples)))]
+
+    def record(self, path: str, seconds: float) -> None:
+        with self._lock:
+            window = self._samples.get(path)
+            if window is None:
+                window = self._samples[path] = deque(maxlen=self.policy.window)
+            window.append(seconds)
+
+
+class Hedger:
+    """Thread-pool hedging for PinergyClient.
+
+    Attempts run on a shared executor while the caller waits. Losing attempts cannot be
+    interrupted; they finish in the background and their results go to ``discard``.
+    An attempt that fails waits on any still in flight; the call only fails when every
+    attempt has (with the first error), retries being RetryPolicy's job.
+    """
+
+    def __init__(self, policy: HedgePolicy) -> None:
+        self.policy = policy
+        self._latencies = _Latencies(policy)
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self.calls = 0
+        self.fired = 0
+        self.won = 0
+
+    @property
+    def stats(self) -> HedgeStats:
+        with self._lock:
+            return HedgeStats(self.calls, self.fired, self.won)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.policy.max_workers, thread_name_prefix="pinergy-hedge"
+                )
+            return self._executor
+
+    def do(self, path: str, fn: Callable[[], T], discard: Callable[[T], object] | None = None) -> T:
+        pool = self._pool()
+        delay = self._latencies.delay_for(path)
+        start = time.monotonic()
+        attempts: list[Future[T]] = [pool.submit(fn)]
+        pending = set(attempts)
+        errors: list[BaseException] = []
+        with self._lock:
+            self.calls += 1
+        while True:
+            can_hedge = len(attempts) <= self.policy.max_hedges
+            done, pending = wait(pending, timeout=delay if can_hedge else None, return_when=FIRST_COMPLETED)
+            if not done:
+                attempts.append(pool.submit(fn))
+                pending.add(attempts[-1])
+                with self._lock:
+                    self.fired += 1
+                continue
+            winner = next((f for f in attempts if f in done and f.exception() is None), None)
+            if winner is None:
+                errors.extend(f.exception() for f in attempts if f in done)  # type: ignore[misc]
+                if pending:
+                    continue
+                raise errors[0]
+            self._latencies.record(path, time.monotonic() - start)
+            if winner is not attempts[0]:
+                with self._lock:
+                    self.won += 1
+            for f in attempts:
+                if f is not winner and discard is not None:
+                    f.add_done_callback(lambda f: discard(f.result()) if f.exception() is None else None)
+            return winner.result()
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class AsyncHedger:
+    """Hedging for AsyncPinergyClient: attempts are tasks and losers are cancelled."""
+
+    def __init__(self, policy: HedgePolicy) -> None:
+        self.policy = policy
+        self._latencies = _Latencies(policy)
+        self.calls = 0
+        self.fired = 0
+        self.won = 0
+
+    @property
+    def stats(self) -> HedgeStats:
+        return HedgeStats(self.calls, self.fired, self.won)
+
+    async def do(self, path: str, fn: Callable[[], Awaitable[T]]) -> T:
+        delay = self._latencies.delay_for(path)
+        start = time.monotonic()
+        attempts = [asyncio.ensure_future(fn())]
+        pending = set(attempts)
+        errors: list[BaseException] = []
+        self.calls += 1
+        try:
+            while True:
+                can_hedge = len(attempts) <= self.policy.max_hedges
+                done, pending = await asyncio.wait(
+                    pending, timeout=delay if can_hedge else None, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    attempts.append(asyncio.ensure_future(fn()))
+                    pending.add(attempts[-1])
+                    self.fired += 1
+                    continue
+                winner = next((t for t in attempts if t in done and t.exception() is None), None)
+                if winner is None:
+                    errors.extend(t.exception() for t in attempts if t in done)  # type: ignore[misc]
+                    if pending:
+                        continue
+                    raise errors[0]
+                self._latencies.record(path, time.monotonic() - start)
+                if winner is not attempts[0]:
+                    self.won += 1
+                return winner.result()
+        finally:
+            for t in attempts:
+                t.cancel()
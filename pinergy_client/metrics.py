@@ -0,0 +1,252 @@
+"""Request instrumentation: per-call events for hooks, and built-in per-endpoint histograms."""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+# Upper bounds (seconds) of the latency histogram buckets; the last one catches everything
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, math.inf,
+)  # fmt: skip
+
+PHASES = ("total", "network", "connect", "ttfb", "decode", "parse")
+
+
+@dataclass
+class RequestEvent:
+    """One client call, passed to every hook once it has finished (successfully or not).
+
+    Timings are in seconds. ``network`` spans every HTTP attempt including retry backoff;
+    ``ttfb`` is from sending the (last) request to its response headers; ``connect`` is
+    DNS + TCP + TLS when a new connection was opened (async client only; None otherwise).
+    ``decode`` is JSON decoding and ``parse`` building the response model (``from_dict``).
+    ``total`` is the whole call. Cache hits and calls answered by a coalesced in-flight
+    request send nothing (``attempts == 0``).
+    """
+
+    method: str
+    path: str
+    status: int | None = None
+    bytes: int = 0  # response body size
+    attempts: int = 0
+    cache_hit: bool = False
+    error: BaseException | None = None
+    network: float = 0.0
+    connect: float | None = None
+    ttfb: float | None = None
+    decode: float = 0.0
+    parse: float = 0.0
+    total: float = 0.0
+
+    @property
+    def endpoint(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+Hook = Callable[[RequestEvent], object]
+
+
+def emit(hooks: Iterable[Hook], event: RequestEvent) -> None:
+    """Pass event to every hook; a failing hook never breaks the call it observes."""
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            pass
+
+
+@dataclass
+class Histogram:
+    """Cumulative-bucket histogram, as in Prometheus."""
+
+    bounds: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    sum: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * len(self.bounds)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        out, running = [], 0
+        for bound, n in zip(self.bounds, self.counts):
+            running += n
+            out.append((bound, running))
+        return out
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (0.0 when empty)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for bound, running in self.cumulative():
+            if running >= rank:
+                return bound
+        return self.bounds[-1]
+
+
+@dataclass
+class _Endpoint:
+    requests: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    bytes: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+    phases: dict[str, Histogram] = field(default_factory=dict)
+
+
+def _le(bound: float) -> str:
+    return "+Inf" if bound == math.inf else repr(bound)
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class EndpointMetrics:
+    """Per-endpoint request counts and latency histograms, fed by RequestEvents.
+
+    Every PinergyClient records into one (``client.metrics``); pass the same instance as
+    ``metrics=`` to several clients to aggregate them. Read it with ``as_dict()`` or expose
+    ``to_prometheus()`` on a scrape endpoint.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        if buckets[-1] != math.inf:
+            buckets = (*buckets, math.inf)
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._endpoints: dict[tuple[str, str], _Endpoint] = {}
+
+    def __call__(self, event: RequestEvent) -> None:
+        self.record(event)
+
+    def record(self, event: RequestEvent) -> None:
+        with self._lock:
+            ep = self._endpoints.get((event.method, event.path))
+            if ep is None:
+                ep = self._endpoints[(event.method, event.path)] = _Endpoint()
+            ep.requests += 1
+            ep.errors += event.error is not None
+            ep.cache_hits += event.cache_hit
+            ep.bytes += event.bytes
+            if event.status is not None:
+                ep.statuses[event.status] = ep.statuses.get(event.status, 0) + 1
+            for phase in PHASES:
+                value = getattr(event, phase)
+                if value is None or (phase != "total" and not event.attempts):
+                    continue  # no request was sent: only the total is meaningful
+                hist = ep.phases.get(phase)
+                if hist is None:
+                    hist = ep.phases[phase] = Histogram(self.buckets)
+                hist.observe(value)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """``{"GET /balance": {"requests", "errors", "cache_hits", "bytes", "statuses", "latency"}}``.
+
+        ``latency`` maps each phase to ``{"count", "sum", "p50", "p95", "p99", "buckets"}``
+        with cumulative bucket counts keyed by upper bound.
+        """
+        with self._lock:
+            out: dict[str, dict[str, Any]] = {}
+            for (method, path), ep in sorted(self._endpoints.items(), key=lambda kv: (kv[0][1], kv[0][0])):
+                out[f"{method} {path}"] = {
+                    "requests": ep.requests,
+                    "errors": ep.errors,
+                    "cache_hits": ep.cache_hits,
+                    "bytes": ep.bytes,
+                    "statuses": dict(sorted(ep.statuses.items())),
+                    "latency": {
+                        phase: {
+                            "count": h.count,
+                            "sum": h.sum,
+                            "p50": h.quantile(0.5),
+                            "p95": h.quantile(0.95),
+                            "p99": h.quantile(0.99),
+                            "buckets": {_le(b): n for b, n in h.cumulative()},
+                        }
+                        for phase, h in ep.phases.items()
+                    },
+                }
+            return out
+
+    def to_prometheus(self, prefix: str = "pinergy") -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        statuses, errors, cache_hits, sizes, latency = [], [], [], [], []
+        with self._lock:
+            for (method, path), ep in sorted(self._endpoints.items(), key=lambda kv: (kv[0][1], kv[0][0])):
+                labels = f'method="{_label(method)}",path="{_label(path)}"'
+                for status, n in sorted(ep.statuses.items()):
+                    statuses.append(f'{prefix}_requests_total{{{labels},status="{status}"}} {n}')
+                errors.append(f"{prefix}_request_errors_total{{{labels}}} {ep.errors}")
+                cache_hits.append(f"{prefix}_cache_hits_total{{{labels}}} {ep.cache_hits}")
+                sizes.append(f"{prefix}_response_bytes_total{{{labels}}} {ep.bytes}")
+                for phase, h in ep.phases.items():
+                    phase_labels = f'{labels},phase="{phase}"'
+                    bucket = f"{prefix}_request_duration_seconds_bucket"
+                    for bound, n in h.cumulative():
+                        latency.append(f'{bucket}{{{phase_labels},le="{_le(bound)}"}} {n}')
+                    latency.append(f"{prefix}_request_duration_seconds_sum{{{phase_labels}}} {h.sum}")
+                    latency.append(f"{prefix}_request_duration_seconds_count{{{phase_labels}}} {h.count}")
+        lines = [
+            f"# HELP {prefix}_requests_total Responses received, by HTTP status.",
+            f"# TYPE {prefix}_requests_total counter",
+            *statuses,
+            f"# HELP {prefix}_request_errors_total Calls that raised.",
+            f"# TYPE {prefix}_request_errors_total counter",
+            *errors,
+            f"# HELP {prefix}_cache_hits_total Calls answered from the response cache.",
+            f"# TYPE {prefix}_cache_hits_total counter",
+            *cache_hits,
+            f"# HELP {prefix}_response_bytes_total Response body bytes received.",
+            f"# TYPE {prefix}_response_bytes_total counter",
+            *sizes,
+            f"# HELP {prefix}_request_duration_seconds Call latency by phase.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+            *latency,
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class HttpcoreTrace:
+    """httpx ``trace`` extension callback recording connect and time-to-first-byte."""
+
+    def __init__(self) -> None:
+        self._marks: dict[str, float] = {}
+
+    def reset(self) -> None:
+        self._marks.clear()
+
+    async def __call__(self, name: str, info: dict[str, Any]) -> None:
+        # e.g. "connection.connect_tcp.started", "http11.receive_response_headers.complete"
+        self._marks[name.split(".", 1)[-1]] = time.perf_counter()
+
+    def _span(self, start: str, *ends: str) -> float | None:
+        began = self._marks.get(start)
+        for end in ends:
+            if began is not None and end in self._marks:
+                return self._marks[end] - began
+        return None
+
+    @property
+    def connect(self) -> float | None:
+        return self._span("connect_tcp.started", "start_tls.complete", "connect_tcp.complete")
+
+    @property
+    def ttfb(self) -> float | None:
+        return self._span("send_request_headers.started", "receive_response_headers.complete")
@@ -0,0 +1,722 @@
+"""Local stand-in for the Pinergy API: synthetic accounts served over HTTP, with fault injection.
+
+MockPinergyAPI holds N generated accounts and answers every endpoint PinergyClient calls.
+Each account has half-hourly usage priced per plan, so the daily, weekly and monthly
+figures, the balance, and the top-up history all agree. MockPinergyServer serves it over
+HTTP (stdlib ThreadingHTTPServer) and can add latency, 5xx errors, 429s, connection
+resets and slowly trickled bodies (see Faults). Nothing outside the standard library is
+needed, so it runs anywhere the client does:
+
+    with MockPinergyServer(MockPinergyAPI(accounts=100), faults=Faults(latency=0.05)) as server:
+        client = PinergyClient(base_url=server.url, auth_token=server.api.accounts[0].auth_token)
+
+or from a shell: ``pinergy mock-server --accounts 100 --latency 0.05 --error-rate 0.01``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import secrets
+import socket
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Mapping
+from urllib.parse import parse_qsl, urlsplit
+
+from pinergy_client.client import AUTH_HEADER
+from pinergy_client.store import METER_TZ, slot_timestamp
+
+SLOTS = 48
+API_PREFIX = "/api"
+
+# €/kWh by plan, and which half-hour slots each plan covers (the rest is Standard)
+TARIFFS = {"Standard": 0.32, "Night": 0.18, "Drive": 0.09}
+_DRIVE_SLOTS = range(4, 10)  # 02:00-05:00
+_NIGHT_SLOTS = frozenset(range(0, 16)) | frozenset(range(46, SLOTS))  # 23:00-08:00
+CO2_PER_KWH = 0.3  # kg
+TOP_UP_AMOUNTS = [10, 20, 30, 50, 100]
+THRESHOLDS = [5, 10, 15, 20]
+
+Params = dict[str, str]
+Body = dict[str, Any]
+Response = tuple[int, Body]
+
+
+def _plan(slot: int) -> str:
+    if slot in _DRIVE_SLOTS:
+        return "Drive"
+    return "Night" if slot in _NIGHT_SLOTS else "Standard"
+
+
+def _sha1(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _day_start(day: date) -> int:
+    return slot_timestamp(day, 0)
+
+
+def _week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def _recent(account: MockAccount, n: int) -> range:
+    """Indices of the account's last n days."""
+    return range(max(0, len(account.days) - n), len(account.days))
+
+
+@dataclass
+class MockAccount:
+    """One synthetic customer; ``kwh[d][s]`` is the usage of half-hour s on ``days[d]``."""
+
+    email: str
+    password: str
+    auth_token: str
+    pinergy_id: str
+    premises_number: str
+    name: str
+    balance: float = 0.0
+    is_landlord: bool = False
+    days: list[date] = field(default_factory=list)
+    kwh: list[list[float]] = field(default_factory=list)
+    top_ups: list[dict[str, Any]] = field(default_factory=list)
+    auto_top_ups: list[dict[str, Any]] = field(default_factory=list)
+    scheduled: list[dict[str, Any]] = field(default_factory=list)
+    credit_cards: list[dict[str, Any]] = field(default_factory=list)
+    house: dict[str, int] = field(default_factory=dict)
+    notifications: dict[str, bool] = field(default_factory=dict)
+    profile: dict[str, str] = field(default_factory=dict)
+    device_token: str = ""
+    totals: list[tuple[dict[str, float], dict[str, float]]] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def euro(self, d: int, s: int) -> float:
+        return round(self.kwh[d][s] * TARIFFS[_plan(s)], 4)
+
+    def day_totals(self, d: int) -> tuple[dict[str, float], dict[str, float]]:
+        """Per-plan kWh and € for day index d, each with a ``Total`` (usage never changes, so cached)."""
+        if d < len(self.totals):
+            return self.totals[d]
+        kwh: dict[str, float] = {"Total": 0.0}
+        euro: dict[str, float] = {"Total": 0.0}
+        for s in range(SLOTS):
+            plan = _plan(s)
+            kwh[plan] = kwh.get(plan, 0.0) + self.kwh[d][s]
+            euro[plan] = euro.get(plan, 0.0) + self.euro(d, s)
+        kwh["Total"] = sum(v for k, v in kwh.items() if k != "Total")
+        euro["Total"] = sum(v for k, v in euro.items() if k != "Total")
+        return {k: round(v, 3) for k, v in kwh.items()}, {k: round(v, 2) for k, v in euro.items()}
+
+
+class MockPinergyAPI:
+    """In-memory Pinergy backend with ``accounts`` generated customers.
+
+    Accounts are reproducible from ``seed``: account i logs in as ``user{i}@example.com`` /
+    ``password{i}`` and also has a ready-made token ``mock-token-{i}``, so load tests can skip
+    logging in. Each has ``days`` days of half-hourly usage ending yesterday (``today``
+    defaults to the current date), with top-ups whenever its credit ran low. Writes (top-ups,
+    profile edits, ...) change the state later reads return. Thread-safe: each call holds
+    only its own account's lock, so requests for different accounts run in parallel.
+    """
+
+    def __init__(self, accounts: int = 10, days: int = 60, seed: int = 0, today: date | None = None):
+        self._lock = threading.Lock()  # guards _by_token only
+        self.today = today or datetime.now(METER_TZ).date()
+        self.accounts = [self._generate(i, days, random.Random(f"{seed}:{i}")) for i in range(accounts)]
+        self._by_email = {a.email: a for a in self.accounts}
+        self._by_token = {a.auth_token: a for a in self.accounts}
+        self._averages = {n: self._average(n) for n in (7, 30)}
+        self._routes: dict[tuple[str, str], Callable[..., Response]] = {
+            ("POST", "/login"): self._login,
+            ("POST", "/logout"): self._logout,
+            ("POST", "/forgot"): self._forgot,
+            ("POST", "/changepass"): self._change_password,
+            ("GET", "/balance"): self._balance,
+            ("POST", "/topup"): self._top_up,
+            ("POST", "/scheduletopup"): self._schedule_top_up,
+            ("POST", "/autotopup"): self._auto_top_up,
+            ("GET", "/activetopups"): self._active_top_ups,
+            ("GET", "/topuphistory"): self._top_up_history,
+            ("GET", "/usage"): self._usage,
+            ("GET", "/levelPayUsage"): self._level_pay_usage,
+            ("GET", "/compare"): self._compare,
+            ("POST", "/editprofile"): self._edit_profile,
+            ("POST", "/updatehouse"): self._update_house,
+            ("GET", "/getnotif"): self._get_notifications,
+            ("POST", "/updatenotif"): self._update_notifications,
+            ("POST", "/updatedevicetoken"): self._update_device_token,
+            ("POST", "/deletecc"): self._delete_card,
+            ("GET", "/configinfo"): self._config_info,
+            ("GET", "/defaultsinfo"): self._defaults_info,
+            ("GET", "/landlordcheck"): self._landlord_check,
+            ("POST", "/landlordverify"): self._landlord_verify,
+        }
+        self._public = {"/login", "/forgot", "/defaultsinfo", "/landlordcheck", "/landlordverify"}
+
+    def _generate(self, i: int, n_days: int, rng: random.Random) -> MockAccount:
+        first = rng.choice(["Aoife", "Ciarán", "Niamh", "Seán", "Róisín", "Darragh", "Saoirse", "Oisín"])
+        last = rng.choice(["Murphy", "Kelly", "O'Brien", "Walsh", "Byrne", "Ryan", "O'Connor", "Doyle"])
+        account = MockAccount(
+            email=f"user{i}@example.com",
+            password=f"password{i}",
+            auth_token=f"mock-token-{i}",
+            pinergy_id=f"PIN{100000 + i}",
+            premises_number=f"{rng.randrange(10**9, 10**10)}",
+            name=f"{first} {last}",
+            is_landlord=rng.random() < 0.1,
+            credit_cards=[
+                {
+                    "name": f"{first} {last}",
+                    "cc_token": f"cc-{i}-{rng.randrange(10**6):06d}",
+                    "payment_token": f"{rng.getrandbits(64):016x}",
+                    "last_4_digits": f"{rng.randrange(10**4):04d}",
+                    "z50": "",
+                    "email": f"user{i}@example.com",
+                }
+            ],
+            house={
+                "type": rng.randrange(1, 5),
+                "adult_count": rng.randrange(1, 4),
+                "bedroom_count": rng.randrange(1, 6),
+                "children_count": rng.randrange(0, 4),
+                "heating_type": rng.randrange(1, 5),
+            },
+            notifications={"email": True, "sms": rng.random() < 0.5, "phone": False},
+            profile={"title": rng.choice(["Mr", "Ms", "Dr"]), "mobile": f"08{rng.randrange(10**8):08d}"},
+        )
+        # Daily load shape: low overnight, morning and evening peaks, optional EV charging
+        scale = rng.uniform(0.6, 1.6)
+        has_ev = rng.random() < 0.3
+        credit = rng.uniform(20, 60)
+        for d in range(n_days):
+            day = self.today - timedelta(days=n_days - d)
+            row = []
+            for s in range(SLOTS):
+                hour = s / 2
+                base = 0.12 + 0.35 * (7 <= hour < 9) + 0.6 * (17 <= hour < 22) + 0.15 * (9 <= hour < 17)
+                ev = 3.2 if has_ev and s in _DRIVE_SLOTS and rng.random() < 0.6 else 0.0
+                row.append(round(max(0.0, rng.gauss(base * scale, 0.05)) + ev, 3))
+            account.days.append(day)
+            account.kwh.append(row)
+            account.totals.append(account.day_totals(d))
+            credit -= account.totals[d][1]["Total"]
+            if credit < 10:  # the customer tops up when credit runs low
+                amount = float(rng.choice([20, 30, 50]))
+                credit += amount
+                account.top_ups.append(self._top_up_record(rng, amount, _day_start(day) + 9 * 3600))
+        account.balance = round(credit, 2)
+        return account
+
+    @staticmethod
+    def _top_up_record(rng: random.Random | None, amount: float, ts: int) -> dict[str, Any]:
+        code = "".join(str((rng or random).randrange(10)) for _ in range(20))
+        return {
+            "top_up_id": f"{(rng or random).getrandbits(48):012x}",
+            "top_up_amount": amount,
+            "top_up_date": ts,
+            "top_up_action": "Top Up",
+            "top_up_code": code,
+        }
+
+    def account(self, token: str | None) -> MockAccount | None:
+        with self._lock:
+            return self._by_token.get(token or "")
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        params: Mapping[str, str] | None = None,
+        body: Mapping[str, Any] | None = None,
+        token: str | None = None,
+    ) -> Response:
+        """Answer one API call: (HTTP status, JSON body). ``path`` is relative to /api."""
+        route = self._routes.get((method.upper(), path))
+        if route is None:
+            return 404, {"success": False, "message": f"No such endpoint: {method} {path}", "error_code": 404}
+        if path in self._public:
+            return route(None, dict(params or {}), dict(body or {}))
+        account = self.account(token)
+        if account is None:
+            return 401, {"success": False, "message": "Invalid or expired token", "error_code": 401}
+        with account.lock:
+            return route(account, dict(params or {}), dict(body or {}))
+
+    # --- Auth / account ---
+
+    def _login(self, _: None, params: Params, body: Body) -> Response:
+        account = self._by_email.get(str(body.get("email", "")).strip().lower())
+        if account is None or body.get("password") != _sha1(account.password):
+            return 200, {"success": False, "message": "Invalid email or password", "error_code": 1}
+        token = secrets.token_hex(16)
+        with self._lock:
+            self._by_token[token] = account
+        with account.lock:
+            account.device_token = body.get("device_token", "")
+            return 200, {
+                "success": True,
+                "message": "",
+                "error_code": 0,
+                "auth_token": token,
+                "user": self._user(account),
+                "house": dict(account.house),
+                "credit_cards": list(account.credit_cards),
+                "premises_number": account.premises_number,
+                "is_legacy_meter": False,
+                "is_no_wan_meter": False,
+            }
+
+    def _logout(self, account: MockAccount, params: Params, body: Body) -> Response:
+        with self._lock:
+            for token in [t for t, a in self._by_token.items() if a is account and t != account.auth_token]:
+                del self._by_token[token]
+        return _ok()
+
+    def _forgot(self, _: None, params: Params, body: Body) -> Response:
+        return _ok()  # never reveals whether the email exists
+
+    def _change_password(self, account: MockAccount, params: Params, body: Body) -> Response:
+        if not body.get("new_password"):
+            return _fail("Password required")
+        account.password = body["new_password"]
+        return _ok()
+
+    def _user(self, account: MockAccount) -> dict[str, Any]:
+        return {
+            "name": account.name,
+            "title": account.profile.get("title", ""),
+            "pinergy_id": account.pinergy_id,
+            "mobile_number": account.profile.get("mobile", ""),
+            "email_notifications": account.notifications["email"],
+            "sms_notifications": account.notifications["sms"],
+        }
+
+    def _edit_profile(self, account: MockAccount, params: Params, body: Body) -> Response:
+        account.name = f"{body.get('first_name', '')} {body.get('last_name', '')}".strip() or account.name
+        account.profile.update(title=body.get("title", ""), mobile=body.get("mobile", ""))
+        return _ok()
+
+    def _update_house(self, account: MockAccount, params: Params, body: Body) -> Response:
+        account.house.update(body.get("house") or {})
+        return _ok()
+
+    def _get_notifications(self, account: MockAccount, params: Params, body: Body) -> Response:
+        return 200, {**account.notifications, "should_show": False, "should_show_message": ""}
+
+    def _update_notifications(
+        self, account: MockAccount, params: Params, body: Body
+    ) -> Response:
+        account.notifications.update({k: bool(body[k]) for k in ("email", "sms", "phone") if k in body})
+        return _ok(email=account.notifications["email"], sms=account.notifications["sms"])
+
+    def _update_device_token(
+        self, account: MockAccount, params: Params, body: Body
+    ) -> Response:
+        account.device_token = body.get("device_token", "")
+        return _ok()
+
+    def _delete_card(self, account: MockAccount, params: Params, body: Body) -> Response:
+        cards = [c for c in account.credit_cards if c["cc_token"] != body.get("cc_token")]
+        if len(cards) == len(account.credit_cards):
+            return _fail("Card not found")
+        account.credit_cards = cards
+        return _ok()
+
+    # --- Balance and top-ups ---
+
+    def _balance(self, account: MockAccount, params: Params, body: Body) -> Response:
+        last = account.top_ups[-1] if account.top_ups else {}
+        recent = [account.day_totals(d)[1]["Total"] for d in _recent(account, 7)]
+        daily_spend = sum(recent) / len(recent) if recent else 0.0
+        last_day = account.days[-1] if account.days else self.today
+        return _ok(
+            balance=account.balance,
+            credit_low=account.balance < 10,
+            emergency_credit=account.balance <= 0,
+            last_reading=_day_start(last_day) + (SLOTS - 1) * 1800,
+            last_top_up_time=last.get("top_up_date", 0),
+            last_top_up_amount=last.get("top_up_amount", 0.0),
+            pending_top_up=False,
+            pending_top_up_by="",
+            power_off=False,
+            top_up_in_days=int(account.balance / daily_spend) if daily_spend > 0 else 0,
+        )
+
+    def _check_top_up(self, account: MockAccount, body: dict[str, Any]) -> str | None:
+        if body.get("pinergy_id") != account.pinergy_id:
+            return "Unknown Pinergy ID"
+        if not any(c["cc_token"] == body.get("cc_token") for c in account.credit_cards):
+            return "Unknown card"
+        try:
+            amount = float(body.get("amount", 0))
+        except (TypeError, ValueError):
+            amount = 0.0
+        return None if amount > 0 else "Invalid amount"
+
+    def _top_up(self, account: MockAccount, params: Params, body: Body) -> Response:
+        error = self._check_top_up(account, body)
+        if error:
+            return _fail(error)
+        amount = float(body["amount"])
+        record = self._top_up_record(None, amount, int(time.time()))
+        account.top_ups.append(record)
+        account.balance = round(account.balance + amount, 2)
+        return _ok(
+            last_top_up_time=record["top_up_date"],
+            latest_balance=account.balance,
+            pending_top_up=False,
+            top_up_code=record["top_up_code"],
+            top_up_in_days=0,
+            top_up_message=f"€{amount:.2f} added",
+        )
+
+    def _top_up_user(self, account: MockAccount, body: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "customer": account.name,
+            "current_user": True,
+            "top_up_amount": float(body["amount"]),
+            "top_up_day": int(body.get("day_of_month") or 0),
+            "top_up_threshold": int(body.get("threshold") or 0),
+        }
+
+    def _schedule_top_up(self, account: MockAccount, params: Params, body: Body) -> Response:
+        error = self._check_top_up(account, body) or (None if body.get("day_of_month") else "Day required")
+        if error:
+            return _fail(error)
+        account.scheduled = [self._top_up_user(account, body)]
+        return _ok()
+
+    def _auto_top_up(self, account: MockAccount, params: Params, body: Body) -> Response:
+        error = self._check_top_up(account, body) or (None if body.get("threshold") else "Threshold required")
+        if error:
+            return _fail(error)
+        account.auto_top_ups = [self._top_up_user(account, body)]
+        return _ok()
+
+    def _active_top_ups(self, account: MockAccount, params: Params, body: Body) -> Response:
+        return _ok(auto_top_ups=account.auto_top_ups, scheduled=account.scheduled)
+
+    def _top_up_history(self, account: MockAccount, params: Params, body: Body) -> Response:
+        return _ok(top_ups=list(reversed(account.top_ups)))
+
+    # --- Usage ---
+
+    def _groups(self, account: MockAccount, key: Callable[[date], date]) -> list[tuple[date, list[int]]]:
+        """Day indices grouped by key(day) (week or month start), oldest first."""
+        groups: dict[date, list[int]] = {}
+        for d, day in enumerate(account.days):
+            groups.setdefault(key(day), []).append(d)
+        return list(groups.items())
+
+    def _usage(self, account: MockAccount, params: Params, body: Body) -> Response:
+        def entry(start: date, days: list[int]) -> dict[str, Any]:
+            kwh = sum(account.day_totals(d)[0]["Total"] for d in days)
+            euro = sum(account.day_totals(d)[1]["Total"] for d in days)
+            return {
+                "date": _day_start(start),
+                "kwh": round(kwh, 3),
+                "amount": round(euro, 2),
+                "co2": round(kwh * CO2_PER_KWH, 3),
+            }
+
+        days = [entry(account.days[d], [d]) for d in _recent(account, 7)]
+        weeks = self._groups(account, _week_start)
+        months = self._groups(account, _month_start)
+        return _ok(
+            day=days,
+            week=[entry(start, ds) for start, ds in weeks[-5:]],
+            month=[entry(start, ds) for start, ds in months[-12:]],
+        )
+
+    def _level_pay_usage(self, account: MockAccount, params: Params, body: Body) -> Response:
+        totals = [account.day_totals(d) for d in range(len(account.days))]
+        daily = {
+            "labels": [f"{s // 2:02d}:{30 * (s % 2):02d}" for s in range(SLOTS)],
+            "values": [
+                {
+                    "label": day.strftime("%d/%m"),
+                    "daykWh": totals[d][0],
+                    "dayEuro": totals[d][1],
+                    "halfHourlykWh": account.kwh[d],
+                    "halfHourlyEuro": [account.euro(d, s) for s in range(SLOTS)],
+                }
+                for d, day in enumerate(account.days)
+            ],
+        }
+
+        def sum_plan(days: list[int], i: int, plan: str) -> float:
+            return round(sum(totals[d][i].get(plan, 0.0) for d in days), 3)
+
+        def periods(groups: list[tuple[str, list[int]]], kwh_key: str, euro_key: str) -> dict[str, Any]:
+            out: dict[str, Any] = {"labels": [label for label, _ in groups]}
+            for key, i in ((kwh_key, 0), (euro_key, 1)):
+                out[key] = [
+                    {"label": plan, "usage": [sum_plan(ds, i, plan) for _, ds in groups]} for plan in TARIFFS
+                ]
+            return out
+
+        seven = [(account.days[d].strftime("%a"), [d]) for d in _recent(account, 7)]
+        weeks = [(s.strftime("%d/%m"), ds) for s, ds in self._groups(account, _week_start)]
+        months = [(s.strftime("%b %Y"), ds) for s, ds in self._groups(account, _month_start)]
+        return _ok(
+            usageData={
+                "daily": daily,
+                "sevenDays": periods(seven, "daykWh", "dayEuro"),
+                "weekly": periods(weeks, "weeklykWh", "weeklyEuro"),
+                "monthly": periods(months, "monthlykWh", "monthlyEuro"),
+            }
+        )
+
+    @staticmethod
+    def _last_kwh(account: MockAccount, n: int) -> float:
+        return sum(account.day_totals(d)[0]["Total"] for d in _recent(account, n))
+
+    def _average(self, n: int) -> tuple[float, float]:
+        """Average home's kWh and kg CO2 over the last n days, across all accounts."""
+        kwh = sum(self._last_kwh(a, n) for a in self.accounts) / max(1, len(self.accounts))
+        return kwh, kwh * CO2_PER_KWH
+
+    def _compare(self, account: MockAccount, params: Params, body: Body) -> Response:
+        def period(n: int) -> dict[str, Any]:
+            kwh = self._last_kwh(account, n)
+            mine, average = (kwh, kwh * CO2_PER_KWH), self._averages[n]
+            return {
+                "available": len(account.days) >= n,
+                "kwh": {"average_home": round(average[0], 2), "users_home": round(mine[0], 2)},
+                "co2": {"average_home": round(average[1], 2), "users_home": round(mine[1], 2)},
+            }
+
+        return _ok(week=period(7), month=period(30))
+
+    # --- Static / landlord ---
+
+    def _config_info(self, account: MockAccount, params: Params, body: Body) -> Response:
+        return _ok(
+            auto_up_amounts=TOP_UP_AMOUNTS,
+            scheduled_top_up_amounts=TOP_UP_AMOUNTS,
+            thresholds=THRESHOLDS,
+            top_up_amounts=TOP_UP_AMOUNTS,
+        )
+
+    def _defaults_info(self, _: None, params: Params, body: Body) -> Response:
+        kinds = ["Apartment", "Terraced", "Semi-detached", "Detached"]
+        heating = ["Gas", "Oil", "Electric", "Heat pump"]
+        return _ok(
+            default_adults=2,
+            default_bedrooms=3,
+            default_children=0,
+            max_adults=10,
+            max_bedrooms=10,
+            max_children=10,
+            house_types=[{"id": i + 1, "name": n} for i, n in enumerate(kinds)],
+            heating_types=[{"id": i + 1, "name": n} for i, n in enumerate(heating)],
+        )
+
+    def _by_premises(self, premises: str) -> MockAccount | None:
+        return next((a for a in self.accounts if a.premises_number == premises), None)
+
+    def _landlord_check(self, _: None, params: Params, body: Body) -> Response:
+        account = self._by_premises(params.get("premises_number", ""))
+        if account is None:
+            return _fail("Unknown premises number")
+        return _ok(is_landlord_account=account.is_landlord)
+
+    def _landlord_verify(self, _: None, params: Params, body: Body) -> Response:
+        account = self._by_premises(str(body.get("premises_number", "")))
+        if account is None or not account.is_landlord or body.get("password") not in (
+            account.password,
+            _sha1(account.password),
+        ):
+            return _fail("Verification failed")
+        return _ok()
+
+
+def _ok(**fields: Any) -> Response:
+    return 200, {"success": True, "message": "", "error_code": 0, **fields}
+
+
+def _fail(message: str, error_code: int = 1) -> Response:
+    return 200, {"success": False, "message": message, "error_code": error_code}
+
+
+@dataclass(frozen=True)
+class Faults:
+    """Misbehaviour to inject, each drawn independently per request.
+
+    ``latency`` is the median delay added before answering; ``latency_sigma`` > 0 makes it
+    lognormal with that shape (about 1.0 gives a heavy tail), 0 keeps it fixed.
+    ``error_rate`` answers 500/502/503, ``throttle_rate`` answers 429 with ``Retry-After:
+    retry_after``, ``reset_rate`` closes the connection without a response, and
+    ``slow_body_rate`` sends a normal response but trickles its body out over
+    ``slow_body_seconds``.
+    """
+
+    latency: float = 0.0
+    latency_sigma: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: int = 1
+    reset_rate: float = 0.0
+    slow_body_rate: float = 0.0
+    slow_body_seconds: float = 2.0
+
+    def delay(self, rng: random.Random) -> float:
+        if self.latency <= 0:
+            return 0.0
+        if self.latency_sigma <= 0:
+            return self.latency
+        return rng.lognormvariate(0.0, self.latency_sigma) * self.latency
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so client connection pools behave as in production
+    disable_nagle_algorithm = True  # headers and body are separate writes; don't stall the body
+    server: MockPinergyServer
+
+    def do_GET(self) -> None:
+        self._serve()
+
+    def do_POST(self) -> None:
+        self._serve()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _serve(self) -> None:
+        server = self.server
+        parts = urlsplit(self.path)
+        path = parts.path.removeprefix(API_PREFIX) or "/"
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        faults = server.faults_for(path)
+        roll = server.roll
+        server.count(path)
+
+        time.sleep(faults.delay(server.rng))
+        if roll(faults.reset_rate):
+            server.count("reset")
+            self.close_connection = True
+            self.connection.shutdown(socket.SHUT_RDWR)
+            return
+        if roll(faults.throttle_rate):
+            server.count("429")
+            body = {"success": False, "message": "Too many requests", "error_code": 429}
+            self._reply(429, body, {"Retry-After": str(faults.retry_after)})
+            return
+        if roll(faults.error_rate):
+            status = server.rng.choice([500, 502, 503])
+            server.count(str(status))
+            self._reply(status, {"success": False, "message": "Service unavailable", "error_code": status})
+            return
+
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            self._reply(400, {"success": False, "message": "Malformed JSON", "error_code": 400})
+            return
+        status, payload = server.api.handle(
+            self.command, path, dict(parse_qsl(parts.query)), body, self.headers.get(AUTH_HEADER)
+        )
+        slow = faults.slow_body_seconds if roll(faults.slow_body_rate) else 0.0
+        if slow:
+            server.count("slow_body")
+        self._reply(status, payload, slow=slow)
+
+    def _reply(
+        self, status: int, payload: Body, headers: Mapping[str, str] | None = None, slow: float = 0.0
+    ) -> None:
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if not slow:
+            self.wfile.write(data)
+            return
+        chunks = 20
+        step = max(1, -(-len(data) // chunks))
+        for i in range(0, len(data), step):
+            self.wfile.write(data[i : i + step])
+            self.wfile.flush()
+            time.sleep(slow / chunks)
+
+
+class MockPinergyServer(ThreadingHTTPServer):
+    """Serve a MockPinergyAPI over HTTP on ``host:port`` (port 0 picks a free one).
+
+    ``faults`` applies to every endpoint and ``path_faults`` overrides it per path, e.g.
+    ``{"/levelPayUsage": Faults(slow_body_rate=0.2)}``. ``stats`` counts requests per path
+    and injected faults per kind. ``start()`` serves from a daemon thread; the server is also
+    a context manager that starts and stops it.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        api: MockPinergyAPI | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        faults: Faults = Faults(),
+        path_faults: Mapping[str, Faults] | None = None,
+        seed: int | None = None,
+        verbose: bool = False,
+    ):
+        super().__init__((host, port), _Handler)
+        self.api = api if api is not None else MockPinergyAPI()
+        self.faults = faults
+        self.path_faults = dict(path_faults or {})
+        self.verbose = verbose
+        self.rng = random.Random(seed)
+        self.stats: Counter[str] = Counter()
+        self._stats_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to a client as ``base_url``."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def faults_for(self, path: str) -> Faults:
+        return self.path_faults.get(path, self.faults)
+
+    def roll(self, rate: float) -> bool:
+        return rate > 0 and self.rng.random() < rate
+
+    def count(self, key: str) -> None:
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def start(self) -> MockPinergyServer:
+        self._thread = threading.Thread(
+            target=self.serve_forever, args=(0.1,), name="pinergy-mock-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self) -> MockPinergyServer:
+        return self.start()
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Sequence
 
 
 def _strip_none(d: dict[str, Any]) -> dict[str, Any]:
@@ -629,6 +630,178 @@ class CredoraxHPPLinkReturn:
 
 
 # --- LevelPayUsage (rebrand usage; nested usageData) ---
+#
+# Series are parsed into compact float64 arrays (array("d")) rather than lists of boxed
+# floats. Missing / null values read as 0.0, matching how the app renders them.
+
+
+def _first(d: dict[str, Any], *keys: str) -> Any:
+    """First non-empty value among keys (the API mixes camelCase and snake_case)."""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return None
+
+
+def _fill(out: array, values: Sequence[Any] | None, n: int) -> None:
+    """Append exactly n floats from values to out (truncate / zero-pad, None -> 0.0)."""
+    values = values or []
+    out.extend(float(values[i] or 0) if i < len(values) else 0.0 for i in range(n))
+
+
+@dataclass
+class PlanMatrix:
+    """Per-plan series as a plans × periods matrix stored row-major in one float array.
+
+    ``values[p * len(labels) + i]`` is plan ``plans[p]`` in period ``labels[i]``.
+    """
+
+    plans: list[str] = field(default_factory=list)
+    labels: list[str] = field(default_factory=list)
+    values: array = field(default_factory=lambda: array("d"))
+
+    @property
+    def n_periods(self) -> int:
+        return len(self.labels)
+
+    def plan_index(self, plan: str) -> int:
+        return self.plans.index(plan)
+
+    def value(self, plan: int, period: int) -> float:
+        return self.values[plan * self.n_periods + period]
+
+    def row(self, plan: int) -> memoryview:
+        """Zero-copy view of one plan's series across all periods."""
+        n = self.n_periods
+        return memoryview(self.values)[plan * n : (plan + 1) * n]
+
+    @classmethod
+    def from_tariff_list(
+        cls,
+        labels: list[str],
+        tariffs: list[dict[str, Any]] | None,
+        plans: list[str] | None = None,
+    ) -> PlanMatrix:
+        """Matrix from the API's ``[{label, usage: [...]}, ...]`` shape.
+
+        ``plans`` fixes the row order (e.g. to align a € matrix with its kWh matrix);
+        by default rows follow the order of labelled entries in ``tariffs``.
+        """
+        by_plan = {
+            str(t.get("label") or "").strip(): t.get("usage") or [] for t in (tariffs or []) if t
+        }
+        if plans is None:
+            plans = [p for p in by_plan if p]
+        values = array("d")
+        for p in plans:
+            _fill(values, by_plan.get(p), len(labels))
+        return cls(plans=list(plans), labels=list(labels), values=values)
+
+    @classmethod
+    def from_day_dicts(cls, labels: list[str], days: list[dict[str, Any]]) -> PlanMatrix:
+        """Matrix from per-day ``{Total, <plan>: value, ...}`` dicts (Total excluded, plans sorted)."""
+        plans = sorted({k for d in days for k in d} - {"Total"})
+        values = array("d")
+        for p in plans:
+            values.extend(float(d.get(p) or 0) for d in days)
+        return cls(plans=plans, labels=list(labels), values=values)
+
+
+@dataclass
+class LevelPayDaily:
+    """Daily Level Pay data: half-hourly series indexed by (day, slot) plus per-day plan totals."""
+
+    slot_labels: list[str] = field(default_factory=list)  # "00:00", "00:30", ...
+    day_labels: list[str] = field(default_factory=list)  # "21/02", ...
+    half_hourly_kwh: array = field(default_factory=lambda: array("d"))  # days × slots
+    half_hourly_euro: array = field(default_factory=lambda: array("d"))
+    total_kwh: array = field(default_factory=lambda: array("d"))  # per day
+    total_euro: array = field(default_factory=lambda: array("d"))
+    day_kwh: PlanMatrix = field(default_factory=PlanMatrix)  # plans × days
+    day_euro: PlanMatrix = field(default_factory=PlanMatrix)
+
+    @property
+    def n_days(self) -> int:
+        return len(self.day_labels)
+
+    @property
+    def n_slots(self) -> int:
+        return len(self.slot_labels)
+
+    def kwh(self, day: int, slot: int) -> float:
+        return self.half_hourly_kwh[day * self.n_slots + slot]
+
+    def euro(self, day: int, slot: int) -> float:
+        return self.half_hourly_euro[day * self.n_slots + slot]
+
+    def day_kwh_slots(self, day: int) -> memoryview:
+        """Zero-copy view of one day's half-hourly kWh."""
+        n = self.n_slots
+        return memoryview(self.half_hourly_kwh)[day * n : (day + 1) * n]
+
+    def day_euro_slots(self, day: int) -> memoryview:
+        """Zero-copy view of one day's half-hourly €."""
+        n = self.n_slots
+        return memoryview(self.half_hourly_euro)[day * n : (day + 1) * n]
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any] | None) -> LevelPayDaily | None:
+        if d is None:
+            return None
+        days = [v for v in (d.get("values") or []) if v]
+        slot_labels = list(d.get("labels") or [])
+        if not slot_labels:
+            n = max((len(_first(v, "halfHourlykWh", "half_hourly_kwh") or []) for v in days), default=0)
+            slot_labels = [f"{i // 2:02d}:{30 * (i % 2):02d}" for i in range(n)]
+        day_labels = [v.get("label") or "" for v in days]
+        kwh_dicts = [_first(v, "daykWh", "day_kwh") or {} for v in days]
+        euro_dicts = [_first(v, "dayEuro", "day_euro") or {} for v in days]
+        hh_kwh = array("d")
+        hh_euro = array("d")
+        for v in days:
+            _fill(hh_kwh, _first(v, "halfHourlykWh", "half_hourly_kwh"), len(slot_labels))
+            _fill(hh_euro, _first(v, "halfHourlyEuro", "half_hourly_euro"), len(slot_labels))
+        return cls(
+            slot_labels=slot_labels,
+            day_labels=day_labels,
+            half_hourly_kwh=hh_kwh,
+            half_hourly_euro=hh_euro,
+            total_kwh=array("d", (float(x.get("Total") or 0) for x in kwh_dicts)),
+            total_euro=array("d", (float(x.get("Total") or 0) for x in euro_dicts)),
+            day_kwh=PlanMatrix.from_day_dicts(day_labels, kwh_dicts),
+            day_euro=PlanMatrix.from_day_dicts(day_labels, euro_dicts),
+        )
+
+
+@dataclass
+class LevelPayPeriods:
+    """Per-plan kWh and € for a run of periods (sevenDays, weekly or monthly).
+
+    The € matrix uses the kWh matrix's plan order so rows line up.
+    """
+
+    labels: list[str] = field(default_factory=list)
+    kwh: PlanMatrix = field(default_factory=PlanMatrix)
+    euro: PlanMatrix = field(default_factory=PlanMatrix)
+
+    @property
+    def plans(self) -> list[str]:
+        return self.kwh.plans
+
+    @classmethod
+    def from_dict(
+        cls,
+        d: dict[str, Any] | None,
+        kwh_keys: tuple[str, ...],
+        euro_keys: tuple[str, ...],
+    ) -> LevelPayPeriods | None:
+        if d is None:
+            return None
+        labels = list(d.get("labels") or [])
+        kwh = PlanMatrix.from_tariff_list(labels, _first(d, *kwh_keys))
+        euro = PlanMatrix.from_tariff_list(labels, _first(d, *euro_keys), plans=kwh.plans)
+        return cls(labels=labels, kwh=kwh, euro=euro)
 
 
 @dataclass
@@ -636,15 +809,34 @@ class LevelPayUsage:
     success: bool = False
     message: str = ""
     error_code: int = 0
-    usage_data: dict[str, Any] = field(default_factory=dict)  # keep raw for flexibility
+    usage_data: dict[str, Any] = field(default_factory=dict)  # raw JSON, e.g. for --raw output
+    daily: LevelPayDaily | None = None
+    seven_days: LevelPayPeriods | None = None
+    weekly: LevelPayPeriods | None = None
+    monthly: LevelPayPeriods | None = None
 
     @classmethod
     def from_dict(cls, d: dict[str, Any] | None) -> LevelPayUsage:
         if d is None:
             return cls()
+        usage_data = d.get("usageData") or d.get("usage_data") or {}
         return cls(
             success=d.get("success", False),
             message=d.get("message", ""),
             error_code=int(d.get("error_code", 0)),
-            usage_data=d.get("usageData") or d.get("usage_data") or {},
+            usage_data=usage_data,
+            daily=LevelPayDaily.from_dict(usage_data.get("daily")),
+            seven_days=LevelPayPeriods.from_dict(
+                _first(usage_data, "sevenDays", "seven_days"),
+                ("daykWh", "day_kwh"),
+                ("dayEuro", "day_euro"),
+            ),
+            weekly=LevelPayPeriods.from_dict(
+                usage_data.get("weekly"), ("weeklykWh", "weekly_kwh"), ("weeklyEuro", "weekly_euro")
+            ),
+            monthly=LevelPayPeriods.from_dict(
+                usage_data.get("monthly"),
+                ("monthlykWh", "monthly_kwh"),
+                ("monthlyEuro", "monthly_euro"),
+            ),
         )
@@ -0,0 +1,109 @@
+"""Thread-safe access to PinergyClient: per-thread clients over one shared connection pool."""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any
+
+from requests.adapters import DEFAULT_POOLBLOCK
+
+from pinergy_client.client import PinergyClient
+from pinergy_client.metrics import EndpointMetrics
+from pinergy_client.transport import build_adapter
+
+DEFAULT_POOL_MAXSIZE = 32
+DEFAULT_CLIENTS_PER_THREAD = 8
+
+
+class PinergyClientPool:
+    """Hand out PinergyClient instances that are safe to use from many threads.
+
+    A PinergyClient keeps its token in its session headers, so one instance must not be
+    shared by threads using different tokens (or logging in). The pool gives each thread
+    its own client per auth token, created on first use, while every client sends through
+    one shared HTTPAdapter: connections are reused across threads and capped at
+    ``pool_maxsize`` per host (``pool_block=True`` makes extra threads wait for a free
+    connection rather than opening throwaway ones).
+
+    Each thread keeps at most ``clients_per_thread`` clients, closing the least recently
+    used one to make room, and a thread's clients are dropped when the thread exits, so
+    iterating over many tokens does not grow the pool without bound.
+
+    ``client_kwargs`` are passed to every PinergyClient (e.g. ``retry``, ``cache``,
+    ``breaker``, ``rate_limit``, ``credentials``); pass shared objects to share them.
+    Unless ``metrics`` is given, all clients record into one EndpointMetrics,
+    ``pool.metrics``.
+
+        pool = PinergyClientPool(pool_maxsize=16)
+        with ThreadPoolExecutor(16) as ex:
+            balances = list(ex.map(lambda t: pool.client(t).balance(), tokens))
+        pool.close()
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        clients_per_thread: int = DEFAULT_CLIENTS_PER_THREAD,
+        **client_kwargs: Any,
+    ):
+        if clients_per_thread < 1:
+            raise ValueError("clients_per_thread must be >= 1")
+        self.base_url = base_url
+        self.clients_per_thread = clients_per_thread
+        self._adapter = build_adapter(pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self.metrics: EndpointMetrics = client_kwargs.setdefault("metrics", EndpointMetrics())
+        self._client_kwargs = client_kwargs
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Weak, so the clients of a thread that has exited go with its thread-local storage
+        self._clients: weakref.WeakSet[PinergyClient] = weakref.WeakSet()
+        self._closed = False
+
+    def client(self, auth_token: str | None = None) -> PinergyClient:
+        """This thread's client for auth_token (None: the PINERGY_AUTH_TOKEN / credentials default)."""
+        clients: OrderedDict[str | None, PinergyClient] | None = getattr(self._local, "clients", None)
+        if clients is None:
+            clients = self._local.clients = OrderedDict()
+        client = clients.get(auth_token)
+        if client is not None:
+            clients.move_to_end(auth_token)
+            return client
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("PinergyClientPool is closed")
+            client = PinergyClient(
+                base_url=self.base_url, auth_token=auth_token, adapter=self._adapter, **self._client_kwargs
+            )
+            self._clients.add(client)
+        clients[auth_token] = client
+        if len(clients) > self.clients_per_thread:
+            _, evicted = clients.popitem(last=False)
+            with self._lock:
+                self._clients.discard(evicted)
+            evicted.close()  # leaves the shared adapter open
+        return client
+
+    @property
+    def size(self) -> int:
+        """Number of live clients (at most threads x clients_per_thread)."""
+        with self._lock:
+            return len(self._clients)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            clients = list(self._clients)
+            self._clients.clear()
+        for c in clients:
+            c.close()
+        self._adapter.close()
+
+    def __enter__(self) -> PinergyClientPool:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
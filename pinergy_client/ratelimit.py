@@ -0,0 +1,128 @@
+"""Client-side token-bucket rate limiting, shared across threads and optionally processes."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from pinergy_client.exceptions import PinergyRateLimitError
+
+
+def _refill(tokens: float, updated: float, now: float, rate: float, burst: float) -> float:
+    return min(burst, tokens + max(0.0, now - updated) * rate)
+
+
+class RateLimiter:
+    """Token bucket: ``rate`` requests per second with bursts of up to ``burst``.
+
+    Pass one instance to every client that should share the budget (``rate_limit=``).
+    With ``per_token=True`` each auth token gets its own bucket, otherwise one bucket is
+    shared by all. A request over the limit reserves the next free slot and waits for it,
+    unless that is more than ``max_wait`` seconds away, in which case
+    PinergyRateLimitError is raised without sending anything.
+
+    With ``path`` the buckets live in a small JSON file guarded by ``fcntl.flock``, so
+    worker processes on the same machine draw from the same budget (POSIX only). Tokens
+    are never written there, only a hash of them.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        max_wait: float = 30.0,
+        per_token: bool = False,
+        path: str | os.PathLike[str] | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self.max_wait = max_wait
+        self.per_token = per_token
+        self.path = Path(path) if path is not None else None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: dict[str, tuple[float, float]] = {}  # key -> (tokens, updated)
+        self.waited = 0  # requests that had to queue
+        self.rejected = 0  # requests refused for exceeding max_wait
+
+    def _key(self, token: str | None) -> str:
+        if not self.per_token or not token:
+            return "*"
+        return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+    def _take(self, buckets: dict[str, tuple[float, float]], key: str, max_wait: float) -> float:
+        """Reserve one token in ``buckets`` (updated in place); return the wait before using it."""
+        now = self._clock()
+        tokens, updated = buckets.get(key, (self.burst, now))
+        tokens = _refill(tokens, updated, now, self.rate, self.burst) - 1.0
+        wait = -tokens / self.rate if tokens < 0 else 0.0
+        if wait > max_wait:
+            raise PinergyRateLimitError(f"Rate limited: next slot is {wait:.1f}s away", retry_in=wait)
+        buckets[key] = (tokens, now)
+        return wait
+
+    def reserve(self, token: str | None = None, max_wait: float | None = None) -> float:
+        """Reserve a slot for one request; return how many seconds to wait before sending it.
+
+        ``max_wait`` lowers the limiter's own bound for this call (e.g. to a deadline).
+        """
+        bound = self.max_wait if max_wait is None else min(self.max_wait, max_wait)
+        key = self._key(token)
+        with self._lock:
+            try:
+                if self.path is not None:
+                    wait = self._take_shared(key, bound)
+                else:
+                    wait = self._take(self._buckets, key, bound)
+            except PinergyRateLimitError:
+                self.rejected += 1
+                raise
+            if wait > 0:
+                self.waited += 1
+        return wait
+
+    def acquire(self, token: str | None = None, max_wait: float | None = None) -> None:
+        """Block until a request may be sent (thread-safe)."""
+        wait = self.reserve(token, max_wait)
+        if wait > 0:
+            time.sleep(wait)
+
+    def _take_shared(self, key: str, max_wait: float) -> float:
+        try:
+            import fcntl
+        except ImportError as e:  # pragma: no cover - depends on platform
+            raise RuntimeError("RateLimiter(path=...) needs fcntl (POSIX only)") from e
+        assert self.path is not None
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "r+", encoding="utf-8") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                try:
+                    raw = json.loads(f.read() or "{}")
+                except ValueError:
+                    raw = {}
+                buckets = {k: (float(v[0]), float(v[1])) for k, v in raw.items() if isinstance(v, list)}
+                wait = self._take(buckets, key, max_wait)
+                now = self._clock()
+                # Buckets that have refilled carry no state; dropping them keeps the file small
+                buckets = {
+                    k: (tokens, updated)
+                    for k, (tokens, updated) in buckets.items()
+                    if _refill(tokens, updated, now, self.rate, self.burst) < self.burst
+                }
+                f.seek(0)
+                f.truncate()
+                json.dump({k: list(v) for k, v in buckets.items()}, f)
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return wait
@@ -0,0 +1,108 @@
+"""Single-flight deduplication: concurrent identical calls share one execution."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Thread-safe single-flight group.
+
+    While a call for ``key`` is running, other threads calling ``do`` with the same key
+    wait for it and receive the same result (the same object, not a copy) or exception.
+    Nothing is remembered once the call finishes, so results are never stale.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.shared = 0  # calls answered by another caller's in-flight request
+
+    def do(self, key: Hashable, fn: Callable[[], T], timeout: float | None = None) -> T:
+        """Run fn for key, or wait for the call already in flight for it.
+
+        A follower waits at most ``timeout`` seconds and then raises TimeoutError; the
+        leader's call carries on regardless.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"Timed out waiting for in-flight call {key!r}")
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class _AsyncCall:
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """Single-flight group for coroutines running on one event loop (see SingleFlight).
+
+    The shared call runs as its own task, so a caller that is cancelled (or hits its
+    deadline) stops waiting without cancelling the request for the others; the task is
+    only cancelled once every caller waiting on it has gone.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _AsyncCall] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        call = self._calls.get(key)
+        if call is not None:
+            self.shared += 1
+        else:
+            call = self._calls[key] = _AsyncCall(asyncio.ensure_future(fn()))
+            call.task.add_done_callback(lambda task: self._finished(key, call))
+        call.waiters += 1
+        try:
+            # shield: cancelling this caller must not cancel the shared task
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if call.waiters == 1 and not call.task.done():
+                self._forget(key, call)
+                call.task.cancel()
+            raise
+        finally:
+            call.waiters -= 1
+
+    def _forget(self, key: Hashable, call: _AsyncCall) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    def _finished(self, key: Hashable, call: _AsyncCall) -> None:
+        self._forget(key, call)
+        # Mark retrieved so an unobserved failure is not logged by asyncio
+        if not call.task.cancelled():
+            call.task.exception()
@@ -0,0 +1,184 @@
+"""Incremental local SQLite store for half-hourly Level Pay usage."""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Iterator
+from zoneinfo import ZoneInfo
+
+from pinergy_client.models import LevelPayDaily
+
+if TYPE_CHECKING:
+    from pinergy_client.client import PinergyClient
+
+# Half-hour slots are labelled in Irish local time
+METER_TZ = ZoneInfo("Europe/Dublin")
+SLOT_MINUTES = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS half_hourly (
+    premises TEXT NOT NULL,
+    day TEXT NOT NULL,
+    slot INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    kwh REAL NOT NULL,
+    euro REAL NOT NULL,
+    PRIMARY KEY (premises, day, slot)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sync_state (
+    premises TEXT PRIMARY KEY,
+    high_water_ts INTEGER NOT NULL,
+    synced_at INTEGER NOT NULL
+);
+"""
+
+_DAY_MONTH = re.compile(r"^(\d{1,2})/(\d{1,2})(?:/(\d{2,4}))?$")
+
+
+def resolve_day_label(label: str, today: date | None = None) -> date:
+    """Date for a daily label: ISO (2025-02-21), dd/mm/yyyy, or the API's year-less dd/mm.
+
+    Year-less labels are taken as the most recent such date on or before ``today``.
+    """
+    label = label.strip()
+    try:
+        return date.fromisoformat(label)
+    except ValueError:
+        pass
+    m = _DAY_MONTH.match(label)
+    if not m:
+        raise ValueError(f"Unrecognised day label: {label!r}")
+    day, month, year = int(m.group(1)), int(m.group(2)), m.group(3)
+    if year:
+        return date(int(year) + (2000 if len(year) == 2 else 0), month, day)
+    today = today or date.today()
+    for year_back in range(0, 9):
+        try:
+            resolved = date(today.year - year_back, month, day)
+        except ValueError:  # 29/02 outside a leap year
+            continue
+        if resolved <= today:
+            return resolved
+    raise ValueError(f"Unrecognised day label: {label!r}")
+
+
+def slot_timestamp(day: date, slot: int) -> int:
+    """Unix timestamp of the start of a half-hour slot on a (local) meter day."""
+    start = datetime(day.year, day.month, day.day, tzinfo=METER_TZ)
+    return int((start + timedelta(minutes=SLOT_MINUTES * slot)).timestamp())
+
+
+@dataclass
+class HalfHourReading:
+    premises: str
+    day: date
+    slot: int
+    ts: int
+    kwh: float
+    euro: float
+
+
+@dataclass
+class SyncResult:
+    premises: str
+    written: int = 0  # new or refreshed half-hours
+    skipped: int = 0  # half-hours on days before the high-water day (already final)
+    high_water_ts: int | None = None
+
+
+class UsageStore:
+    """Half-hourly readings keyed by (premises, day, slot), plus a per-account high-water mark.
+
+    Merging only touches half-hours on or after the day of the current high-water mark:
+    older days are final and skipped, and the most recent stored day is re-written because
+    the API reports today's (partial) day too.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = ":memory:"):
+        self._conn = sqlite3.connect(os.fspath(path))
+        self._conn.executescript(_SCHEMA)
+
+    def high_water_mark(self, premises: str) -> int | None:
+        row = self._conn.execute(
+            "SELECT high_water_ts FROM sync_state WHERE premises = ?", (premises,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def merge(self, premises: str, daily: LevelPayDaily, today: date | None = None) -> SyncResult:
+        """Upsert the new half-hours from a LevelPayDaily and advance the high-water mark."""
+        result = SyncResult(premises=premises, high_water_ts=self.high_water_mark(premises))
+        floor_day = (
+            datetime.fromtimestamp(result.high_water_ts, METER_TZ).date()
+            if result.high_water_ts is not None
+            else None
+        )
+        rows = []
+        for d, label in enumerate(daily.day_labels):
+            day = resolve_day_label(label, today)
+            if floor_day is not None and day < floor_day:
+                result.skipped += daily.n_slots
+                continue
+            kwh = daily.day_kwh_slots(d)
+            euro = daily.day_euro_slots(d)
+            iso = day.isoformat()
+            rows.extend(
+                (premises, iso, s, slot_timestamp(day, s), kwh[s], euro[s])
+                for s in range(daily.n_slots)
+            )
+        if rows:
+            high_water = max(r[3] for r in rows)
+            if result.high_water_ts is not None:
+                high_water = max(high_water, result.high_water_ts)
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO half_hourly VALUES (?, ?, ?, ?, ?, ?)", rows
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+                    (premises, high_water, int(time.time())),
+                )
+            result.written = len(rows)
+            result.high_water_ts = high_water
+        return result
+
+    def read(
+        self, premises: str, start: date | None = None, end: date | None = None
+    ) -> Iterator[HalfHourReading]:
+        """Stored readings for premises in time order, optionally limited to [start, end] days."""
+        sql = "SELECT premises, day, slot, ts, kwh, euro FROM half_hourly WHERE premises = ?"
+        args: list[str] = [premises]
+        if start is not None:
+            sql += " AND day >= ?"
+            args.append(start.isoformat())
+        if end is not None:
+            sql += " AND day <= ?"
+            args.append(end.isoformat())
+        for p, day, slot, ts, kwh, euro in self._conn.execute(sql + " ORDER BY day, slot", args):
+            yield HalfHourReading(p, date.fromisoformat(day), slot, ts, kwh, euro)
+
+    def premises(self) -> list[str]:
+        return [r[0] for r in self._conn.execute("SELECT premises FROM sync_state ORDER BY premises")]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> UsageStore:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+def sync_usage(
+    client: PinergyClient, store: UsageStore, premises: str, today: date | None = None
+) -> SyncResult:
+    """Fetch Level Pay usage and merge its new half-hours into store for premises."""
+    usage = client.get_level_pay_usage()
+    if usage.daily is None:
+        return SyncResult(premises=premises, high_water_ts=store.high_water_mark(premises))
+    return store.merge(premises, usage.daily, today=today)
@@ -0,0 +1,181 @@
+"""Persistent per-email auth token cache shared across processes."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - depends on platform
+    fcntl = None  # type: ignore[assignment]
+
+from pinergy_client.exceptions import PinergyAuthError
+
+if TYPE_CHECKING:
+    from pinergy_client.client import PinergyClient
+
+TOKEN_FILE = "tokens.json"
+
+
+def default_cache_dir() -> Path:
+    """PINERGY_CACHE_DIR, else the platform's user cache dir (XDG_CACHE_HOME, ~/.cache, ...)/pinergy."""
+    override = os.environ.get("PINERGY_CACHE_DIR")
+    if override:
+        return Path(override)
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pinergy"
+
+
+@dataclass
+class StoredToken:
+    auth_token: str = ""
+    device_token: str = ""
+    saved_at: int = 0
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> StoredToken:
+        return cls(
+            auth_token=d.get("auth_token", ""),
+            device_token=d.get("device_token", ""),
+            saved_at=int(d.get("saved_at", 0)),
+        )
+
+
+class TokenStore:
+    """JSON file of ``{email: {auth_token, device_token, saved_at}}``, readable only by the owner.
+
+    The directory is created 0700 and the file 0600; every write replaces the file atomically,
+    so concurrent processes always see a complete file. Updates hold a thread lock and, on
+    POSIX, an ``flock`` on ``<path>.lock`` across the read-modify-write, so concurrent savers
+    never drop each other's entries. The device token for an email is generated once and
+    kept across re-logins, so the server sees one stable device.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None):
+        self.path = Path(path) if path is not None else default_cache_dir() / TOKEN_FILE
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(email: str) -> str:
+        return email.strip().lower()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @contextmanager
+    def _locked(self) -> Iterator[dict[str, dict[str, Any]]]:
+        """Hold the store's locks and yield its current contents for updating."""
+        with self._lock:
+            if fcntl is None:  # pragma: no cover - depends on platform
+                yield self._load()
+                return
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # The token file itself is replaced on every write, so lock a sidecar file instead
+            fd = os.open(self.path.with_name(self.path.name + ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+            with os.fdopen(fd, "r+") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    yield self._load()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _write(self, data: dict[str, dict[str, Any]]) -> None:
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".tokens-", suffix=".tmp")
+        try:
+            os.chmod(tmp, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def _entry(self, data: dict[str, dict[str, Any]], email: str) -> StoredToken | None:
+        entry = data.get(self._key(email))
+        return StoredToken.from_dict(entry) if isinstance(entry, dict) else None
+
+    def _put(self, data: dict[str, dict[str, Any]], email: str, auth_token: str, device_token: str) -> None:
+        data[self._key(email)] = asdict(
+            StoredToken(auth_token=auth_token, device_token=device_token, saved_at=int(time.time()))
+        )
+        self._write(data)
+
+    def get(self, email: str) -> StoredToken | None:
+        return self._entry(self._load(), email)
+
+    def device_token(self, email: str) -> str:
+        """Stable device token for email, generated and saved on first use."""
+        entry = self.get(email)
+        if entry and entry.device_token:
+            return entry.device_token
+        from pinergy_client.client import PinergyClient
+
+        with self._locked() as data:
+            entry = self._entry(data, email)  # another process may have saved one meanwhile
+            if entry and entry.device_token:
+                return entry.device_token
+            token = PinergyClient._generate_fake_fcm_token()
+            self._put(data, email, entry.auth_token if entry else "", token)
+        return token
+
+    def save(self, email: str, auth_token: str, device_token: str | None = None) -> None:
+        with self._locked() as data:
+            previous = self._entry(data, email) or StoredToken()
+            self._put(data, email, auth_token, device_token or previous.device_token)
+
+    def forget(self, email: str) -> None:
+        """Drop the cached auth token for email (the device token is kept)."""
+        if not (entry := self.get(email)) or not entry.auth_token:
+            return
+        with self._locked() as data:
+            entry = self._entry(data, email)
+            if entry and entry.auth_token:
+                self._put(data, email, "", entry.device_token)
+
+
+def cached_login(
+    client: PinergyClient,
+    store: TokenStore,
+    email: str,
+    password: str | None = None,
+    *,
+    force: bool = False,
+) -> str:
+    """Set the cached token for email on client, logging in (and caching) only if needed.
+
+    ``force=True`` skips the cached token, e.g. after the server rejected it.
+    """
+    entry = None if force else store.get(email)
+    if entry and entry.auth_token:
+        client.set_auth_token(entry.auth_token)
+        return entry.auth_token
+    device_token = store.device_token(email)
+    resp = client.login(email=email, password=password, device_token=device_token)
+    if not resp.success or not resp.auth_token:
+        store.forget(email)
+        raise PinergyAuthError(resp.message or "Login failed", body={"email": email})
+    store.save(email, resp.auth_token, device_token)
+    return resp.auth_token
@@ -0,0 +1,141 @@
+"""Transport tuning: connection pool adapter, retry/backoff policy, timeouts and deadlines."""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Mapping
+
+import requests
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, BaseAdapter, HTTPAdapter
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before re-sending a request.
+
+    Idempotent methods (GET) are retried on transport errors and on ``statuses``.
+    Anything else (e.g. POST /topup) is only re-sent when the connection was never
+    established, so the server cannot have seen it and a top-up never double-fires.
+    Backoff is exponential (``backoff_factor * 2**attempt``, capped at ``backoff_max``)
+    with ``jitter`` as the fraction of the delay that is randomised. For 429/503 a
+    ``Retry-After`` header, when present, replaces the computed backoff.
+    """
+
+    total: int = 3
+    backoff_factor: float = 0.5
+    backoff_max: float = 30.0
+    jitter: float = 1.0
+    statuses: frozenset[int] = RETRY_STATUSES
+    idempotent_methods: frozenset[str] = IDEMPOTENT_METHODS
+    respect_retry_after: bool = True
+    retry_after_max: float = 120.0
+    _random: random.Random = field(default_factory=random.Random, repr=False, compare=False)
+
+    def backoff(self, attempt: int) -> float:
+        """Jittered exponential delay before retry number ``attempt + 1``."""
+        delay = min(self.backoff_max, self.backoff_factor * (2**attempt))
+        return delay - delay * self.jitter * self._random.random()
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        *,
+        status: int | None = None,
+        headers: Mapping[str, str] | None = None,
+        connect_failed: bool = False,
+    ) -> float | None:
+        """Seconds to wait before retrying, or None if the request must not be retried.
+
+        ``status`` is None for transport errors; ``connect_failed`` marks errors raised
+        before the request was sent.
+        """
+        if attempt >= self.total:
+            return None
+        if method.upper() not in self.idempotent_methods and not connect_failed:
+            return None
+        if status is not None and status not in self.statuses:
+            return None
+        if status in RETRY_AFTER_STATUSES and self.respect_retry_after and headers:
+            after = parse_retry_after(headers.get("Retry-After"))
+            if after is not None:
+                return min(after, self.retry_after_max)
+        return self.backoff(attempt)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After as seconds from now (delta-seconds or HTTP-date); None if absent or invalid."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+TimeoutPair = tuple[float, float]  # (connect, read) seconds, as requests takes them
+
+
+def normalize_timeouts(timeouts: Mapping[str, float | TimeoutPair] | None) -> dict[str, TimeoutPair]:
+    """Per-path timeouts as (connect, read) pairs; a bare number applies to both phases."""
+    out: dict[str, TimeoutPair] = {}
+    for path, value in (timeouts or {}).items():
+        path = "/" + path.lstrip("/")
+        if isinstance(value, (int, float)):
+            out[path] = (float(value), float(value))
+        else:
+            connect, read = value
+            out[path] = (float(connect), float(read))
+    return out
+
+
+def deadline_at(deadline: float | None) -> float | None:
+    """Monotonic expiry time for a relative ``deadline`` in seconds (None for no deadline)."""
+    if deadline is None:
+        return None
+    if deadline <= 0:
+        raise ValueError("deadline must be positive")
+    return time.monotonic() + deadline
+
+
+def remaining(expires: float | None) -> float | None:
+    """Seconds left before ``expires`` (may be <= 0), or None without a deadline."""
+    return None if expires is None else expires - time.monotonic()
+
+
+def cap_timeout(timeout: TimeoutPair, left: float | None) -> TimeoutPair:
+    """Shorten each phase of timeout so neither exceeds the time left before a deadline."""
+    if left is None:
+        return timeout
+    connect, read = timeout
+    return (min(connect, left), min(read, left))
+
+
+def build_adapter(
+    pool_connections: int = DEFAULT_POOLSIZE,
+    pool_maxsize: int = DEFAULT_POOLSIZE,
+    pool_block: bool = DEFAULT_POOLBLOCK,
+) -> HTTPAdapter:
+    """HTTPAdapter with explicit urllib3 pool sizing; retries are handled by RetryPolicy instead."""
+    return HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=0,
+    )
+
+
+def mount_adapter(session: requests.Session, adapter: BaseAdapter) -> None:
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
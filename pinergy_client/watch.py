@@ -0,0 +1,156 @@
+"""Long-running balance poller with per-account adaptive intervals."""
+
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+from pinergy_client.client import PinergyClient
+from pinergy_client.fleet import Account, member_for
+from pinergy_client.models import BalanceResponse
+
+
+@dataclass(frozen=True)
+class WatchPolicy:
+    """How the poll interval adapts to ``BalanceResponse.last_reading``.
+
+    When the reading changes, the gap between the last two readings is taken as the meter's
+    cadence and the next poll is scheduled ``grace`` seconds after the next expected reading.
+    While the reading is static the interval grows by ``backoff``. While ``credit_low`` or
+    ``emergency_credit`` is set the interval never exceeds ``urgent_interval``.
+    """
+
+    min_interval: float = 60.0
+    max_interval: float = 1800.0
+    initial_interval: float = 300.0
+    backoff: float = 2.0
+    urgent_interval: float = 120.0
+    grace: float = 30.0
+
+    def clamp(self, interval: float) -> float:
+        return min(self.max_interval, max(self.min_interval, interval))
+
+
+@dataclass
+class WatchState:
+    """Per-account adaptive state."""
+
+    interval: float
+    last_reading: int | None = None
+    cadence: float | None = None  # seconds between meter readings, once two have been seen
+
+
+@dataclass
+class WatchEvent:
+    """One poll: the balance (or the error raised), whether the reading moved, and the next delay."""
+
+    account: Account
+    balance: BalanceResponse | None
+    error: Exception | None
+    changed: bool
+    next_poll_in: float
+
+
+def next_interval(
+    policy: WatchPolicy, state: WatchState, resp: BalanceResponse, now: float
+) -> tuple[float, bool]:
+    """Update state from a fresh balance; return (seconds until the next poll, reading changed)."""
+    reading = resp.last_reading
+    changed = state.last_reading is not None and reading != state.last_reading
+    if state.last_reading is None:
+        interval = policy.initial_interval
+    elif changed:
+        if state.last_reading > 0 and reading > state.last_reading:
+            state.cadence = float(reading - state.last_reading)
+        if state.cadence:
+            interval = reading + state.cadence + policy.grace - now
+        else:
+            interval = state.interval / policy.backoff
+    else:
+        interval = state.interval * policy.backoff
+    state.last_reading = reading
+    state.interval = policy.clamp(interval)
+    if resp.credit_low or resp.emergency_credit:
+        return min(state.interval, policy.urgent_interval), changed
+    return state.interval, changed
+
+
+class BalanceWatcher:
+    """Poll /balance for one or more accounts, each on its own adaptive schedule.
+
+    One warm PinergyClient is kept per account, so the connection and login are reused
+    between polls. Iterate ``run()`` to receive a WatchEvent after every poll; ``stop()``
+    (from another thread or a signal handler) ends the iteration.
+    """
+
+    def __init__(
+        self,
+        accounts: Iterable[Account | str | tuple[str, str]],
+        base_url: str | None = None,
+        policy: WatchPolicy | None = None,
+        client_factory: Callable[[Account], PinergyClient] | None = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], object] | None = None,
+    ):
+        self.policy = policy or WatchPolicy()
+        self._members = [
+            member_for(account, base_url, client_factory)
+            for account in (Account.coerce(a, i) for i, a in enumerate(accounts))
+        ]
+        self._states = [WatchState(interval=self.policy.initial_interval) for _ in self._members]
+        self._clock = clock
+        self._stopped = threading.Event()
+        self._sleep = sleep or self._stopped.wait
+
+    @property
+    def accounts(self) -> list[Account]:
+        return [m.account for m in self._members]
+
+    def poll(self, index: int) -> WatchEvent:
+        """Poll one account now and update its schedule."""
+        member, state = self._members[index], self._states[index]
+        try:
+            member.ensure_login()
+            resp = member.client.balance(bypass_cache=True)
+        except Exception as e:
+            state.interval = self.policy.clamp(state.interval * self.policy.backoff)
+            return WatchEvent(member.account, None, e, False, state.interval)
+        interval, changed = next_interval(self.policy, state, resp, self._clock())
+        return WatchEvent(member.account, resp, None, changed, interval)
+
+    def run(self, max_polls: int | None = None) -> Iterator[WatchEvent]:
+        """Poll every account immediately, then each again when its interval elapses."""
+        self._stopped.clear()
+        now = self._clock()
+        schedule = [(now, i) for i in range(len(self._members))]
+        heapq.heapify(schedule)
+        polls = 0
+        while schedule and not self._stopped.is_set():
+            if max_polls is not None and polls >= max_polls:
+                return
+            due, i = schedule[0]
+            delay = due - self._clock()
+            if delay > 0:
+                self._sleep(delay)
+                continue
+            event = self.poll(i)
+            polls += 1
+            heapq.heapreplace(schedule, (self._clock() + event.next_poll_in, i))
+            yield event
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def close(self) -> None:
+        self.stop()
+        for m in self._members:
+            m.client.close()
+
+    def __enter__(self) -> BalanceWatcher:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
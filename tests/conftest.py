@@ -1,4 +1,4 @@
-"""Pytest fixtures and env for integration tests."""
+"""Shared pytest fixtures, and env for integration tests."""
 
 import os
 
@@ -23,3 +23,26 @@ def env_auth() -> tuple[str, str] | None:
     if token:
         return ("token", token)  # placeholder; client will use token
     return None
+
+
+class FakeClock:
+    """Settable stand-in for time.time / time.monotonic; ``sleep`` advances it instantly."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def base_url() -> str:
+    return "https://api.pinergy.ie/api"
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
@@ -0,0 +1,41 @@
+"""Unit tests for Level Pay analytics."""
+
+from array import array
+
+from pinergy_client import analytics
+from pinergy_client.models import LevelPayDaily, PlanMatrix
+
+
+def _daily() -> LevelPayDaily:
+    return LevelPayDaily(
+        slot_labels=["00:00", "00:30", "01:00"],
+        day_labels=["a", "b"],
+        half_hourly_kwh=array("d", [1.0, 4.0, 2.0, 3.0, 0.0, 2.0]),
+        half_hourly_euro=array("d", [0.5, 0.0, 0.1, 0.5, 0.2, 0.1]),
+    )
+
+
+class TestAnalytics:
+    def test_slot_averages(self) -> None:
+        avg_kwh, avg_euro = analytics.slot_averages(_daily())
+        assert list(avg_kwh) == [2.0, 2.0, 2.0]
+        assert list(avg_euro) == [0.5, 0.1, 0.1]
+
+    def test_column_means_empty(self) -> None:
+        assert list(analytics.column_means(array("d"), 3)) == [0.0, 0.0, 0.0]
+        assert list(analytics.column_means(array("d"), 0)) == []
+
+    def test_top_n_orders_ties_by_index(self) -> None:
+        assert analytics.top_n([1.0, 3.0, 3.0, 2.0], 3) == [1, 2, 3]
+        assert analytics.top_n([1.0], 5) == [0]
+
+    def test_peak_slots(self) -> None:
+        by_kwh, by_euro = analytics.peak_slots(_daily(), n=2)
+        assert by_kwh == [("00:00", 2.0), ("00:30", 2.0)]
+        assert by_euro[0] == ("00:00", 0.5)
+
+    def test_plan_and_period_totals(self) -> None:
+        m = PlanMatrix(plans=["Standard", "Drive"], labels=["w1", "w2", "w3"], values=array("d", [1, 2, 3, 10, 20, 30]))
+        assert analytics.plan_totals(m) == {"Standard": 6.0, "Drive": 60.0}
+        assert list(analytics.period_totals(m)) == [11.0, 22.0, 33.0]
+        assert list(analytics.period_totals(PlanMatrix(labels=["w1"]))) == [0.0]
@@ -0,0 +1,53 @@
+"""Unit tests for the memory-mapped half-hourly archive."""
+
+from array import array
+from datetime import date
+
+import pytest
+
+from pinergy_client.archive import UsageArchive, archive_from_store, write_archive
+from pinergy_client.models import LevelPayDaily
+from pinergy_client.store import UsageStore
+
+
+def test_round_trip_and_date_range_views(tmp_path) -> None:
+    path = tmp_path / "P1.pha"
+    kwh = array("d", range(12))  # 3 days × 4 slots
+    euro = array("d", (v / 10 for v in range(12)))
+    write_archive(path, "P1", date(2025, 1, 1), kwh, euro, n_slots=4, present=b"\x01\x00\x01")
+    with UsageArchive(path) as arc:
+        assert (arc.premises, arc.n_days, arc.n_slots) == ("P1", 3, 4)
+        assert arc.end_day == date(2025, 1, 3)
+        view = arc.kwh(start=date(2025, 1, 2))
+        assert view.shape == (2, 4)
+        assert view.tolist() == [[4.0, 5.0, 6.0, 7.0], [8.0, 9.0, 10.0, 11.0]]
+        assert sum(arc.euro(end=date(2025, 1, 1), flat=True)) == pytest.approx(0.6)
+        assert bytes(arc.present()) == b"\x01\x00\x01"
+        assert len(arc.kwh(start=date(2026, 1, 1))) == 0
+        del view
+
+
+def test_rejects_other_files(tmp_path) -> None:
+    path = tmp_path / "not-an-archive"
+    path.write_bytes(b"x" * 128)
+    with pytest.raises(ValueError):
+        UsageArchive(path)
+    with pytest.raises(ValueError):
+        write_archive(tmp_path / "bad", "P1", date(2025, 1, 1), array("d", [1.0]), array("d"), n_slots=1)
+
+
+def test_archive_from_store_fills_gaps(tmp_path) -> None:
+    daily = LevelPayDaily(
+        slot_labels=["00:00", "00:30"],
+        day_labels=["01/03", "03/03"],
+        half_hourly_kwh=array("d", [1.0, 2.0, 3.0, 4.0]),
+        half_hourly_euro=array("d", [0.1, 0.2, 0.3, 0.4]),
+    )
+    path = tmp_path / "P1.pha"
+    with UsageStore() as store:
+        store.merge("P1", daily, today=date(2025, 3, 5))
+        assert archive_from_store(store, "P1", path, n_slots=2) == 3
+    with UsageArchive(path) as arc:
+        assert arc.start_day == date(2025, 3, 1)
+        assert arc.kwh().tolist() == [[1.0, 2.0], [0.0, 0.0], [3.0, 4.0]]
+        assert bytes(arc.present()) == b"\x01\x00\x01"
@@ -0,0 +1,151 @@
+"""Unit tests for AsyncPinergyClient (httpx.MockTransport)."""
+
+import asyncio
+import json
+from typing import Callable
+
+import httpx
+import pytest
+
+from pinergy_client.async_client import AsyncPinergyClient
+from pinergy_client.exceptions import PinergyAPIError, PinergyAuthError, PinergyDeadlineExceeded
+from pinergy_client.models import TopUpRequest
+
+MakeClient = Callable[..., AsyncPinergyClient]
+
+@pytest.fixture
+def make_client(base_url: str) -> MakeClient:
+    def make(handler, auth_token: str | None = "test-token") -> AsyncPinergyClient:
+        return AsyncPinergyClient(
+            base_url=base_url,
+            auth_token=auth_token,
+            transport=httpx.MockTransport(handler),
+        )
+
+    return make
+
+
+class TestAsyncPinergyClient:
+    def test_balance_success(self, make_client: MakeClient) -> None:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"success": True, "balance": 12.5})
+
+        async def run() -> None:
+            async with make_client(handler) as c:
+                resp = await c.balance()
+            assert resp.success is True
+            assert resp.balance == 12.5
+
+        asyncio.run(run())
+        assert seen[0].headers["auth_token"] == "test-token"
+        assert seen[0].url.path == "/api/balance"
+
+    def test_requires_auth(self, make_client: MakeClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("PINERGY_AUTH_TOKEN", raising=False)
+
+        async def run() -> None:
+            async with make_client(lambda r: httpx.Response(200, json={}), auth_token=None) as c:
+                await c.balance()
+
+        with pytest.raises(PinergyAuthError):
+            asyncio.run(run())
+
+    def test_http_error_raises(self, make_client: MakeClient) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500, json={"message": "Server error"})
+
+        async def run() -> None:
+            async with make_client(handler) as c:
+                await c.get_usage()
+
+        with pytest.raises(PinergyAPIError) as exc_info:
+            asyncio.run(run())
+        assert exc_info.value.status_code == 500
+        assert "Server error" in str(exc_info.value)
+
+    def test_failed_post_raises(self, make_client: MakeClient) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert json.loads(request.content)["amount"] == 20.0
+            return httpx.Response(200, json={"success": False, "message": "Card declined"})
+
+        async def run() -> None:
+            async with make_client(handler) as c:
+                await c.top_up(TopUpRequest(pinergy_id="p1", cc_token="cc1", amount=20.0))
+
+        with pytest.raises(PinergyAPIError, match="Card declined"):
+            asyncio.run(run())
+
+    def test_login_sets_token(self, make_client: MakeClient) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/login"):
+                assert "auth_token" not in request.headers
+                return httpx.Response(200, json={"success": True, "auth_token": "new-token"})
+            return httpx.Response(200, json={"success": True, "balance": 1.0})
+
+        async def run() -> str | None:
+            async with make_client(handler, auth_token="") as c:
+                await c.login("a@b.ie", "pass")
+                await c.balance()
+                return c.auth_token
+
+        assert asyncio.run(run()) == "new-token"
+
+    def test_concurrent_requests_share_pool(self, make_client: MakeClient) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"success": True, "balance": 3.0})
+
+        async def run() -> list[float]:
+            async with make_client(handler) as c:
+                results = await asyncio.gather(*(c.balance() for _ in range(200)))
+            return [r.balance for r in results]
+
+        assert asyncio.run(run()) == [3.0] * 200
+
+    def test_concurrent_401s_trigger_one_login_and_replay(self, base_url: str) -> None:
+        logins = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal logins
+            if request.url.path == "/api/login":
+                logins += 1
+                return httpx.Response(200, json={"success": True, "auth_token": "fresh"})
+            if request.headers.get("auth_token") != "fresh":
+                return httpx.Response(401, json={"message": "Token expired"})
+            return httpx.Response(200, json={"success": True, "balance": 3.0})
+
+        async def run() -> list[float]:
+            async with AsyncPinergyClient(
+                base_url=base_url,
+                auth_token="expired",
+                transport=httpx.MockTransport(handler),
+                credentials=("a@b.ie", "pw"),
+            ) as c:
+                results = await asyncio.gather(*(c.balance() for _ in range(10)))
+            return [r.balance for r in results]
+
+        assert asyncio.run(run()) == [3.0] * 10
+        assert logins == 1
+
+    def test_deadline_cancels_slow_call(self, base_url: str) -> None:
+        seen: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            await asyncio.sleep(5)
+            return httpx.Response(200, json={"success": True})
+
+        async def run() -> None:
+            async with AsyncPinergyClient(
+                base_url=base_url,
+                auth_token="t",
+                transport=httpx.MockTransport(handler),
+                timeouts={"/usage": (3, 30)},
+            ) as c:
+                with pytest.raises(PinergyDeadlineExceeded):
+                    await c.get_usage(deadline=0.05)
+
+        asyncio.run(run())
+        assert seen[0].extensions["timeout"] == {"connect": 3.0, "read": 30.0, "write": 30.0, "pool": None}
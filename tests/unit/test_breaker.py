@@ -0,0 +1,91 @@
+"""Unit tests for the per-base-URL circuit breaker."""
+
+import pytest
+import requests
+from requests_mock import Mocker
+
+from pinergy_client import breaker as breaker_module
+from pinergy_client.breaker import CLOSED, HALF_OPEN, OPEN, BreakerPolicy, CircuitBreaker, breaker_for
+from pinergy_client.client import PinergyClient
+from pinergy_client.exceptions import PinergyAPIError, PinergyCircuitOpenError
+
+POLICY = BreakerPolicy(failure_rate=0.5, window=4, min_calls=4, open_for=10.0)
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(breaker_module, "_registry", {})
+
+
+class TestCircuitBreaker:
+    def test_trips_on_failure_rate_and_fails_fast(self, clock) -> None:
+        b = CircuitBreaker("x", POLICY, clock=clock)
+        for ok in (True, False, True):
+            b.allow()
+            b.record(ok)
+        assert b.state == CLOSED  # below min_calls
+        b.allow()
+        b.record(False)
+        assert b.state == OPEN
+        with pytest.raises(PinergyCircuitOpenError) as exc:
+            b.allow()
+        assert exc.value.retry_in == 10.0
+        assert isinstance(exc.value, PinergyAPIError)
+        assert b.rejected == 1
+
+    def test_half_open_probe_closes_or_reopens(self, clock) -> None:
+        b = CircuitBreaker("x", POLICY, clock=clock)
+        for _ in range(4):
+            b.allow()
+            b.record(False)
+        clock.now += 10
+        assert b.state == HALF_OPEN
+        b.allow()  # the single trial
+        with pytest.raises(PinergyCircuitOpenError):
+            b.allow()
+        b.record(False)
+        assert b.state == OPEN
+        clock.now += 10
+        b.allow()
+        b.record(True)
+        assert b.state == CLOSED
+
+    def test_release_frees_trial_slot(self, clock) -> None:
+        b = CircuitBreaker("x", POLICY, clock=clock)
+        for _ in range(4):
+            b.allow()
+            b.record(False)
+        clock.now += 10
+        b.allow()
+        b.release()
+        b.allow()
+        assert b.state == HALF_OPEN
+
+    def test_registry_shared_per_base_url(self, base_url: str) -> None:
+        assert breaker_for(base_url, POLICY) is breaker_for(base_url + "/", POLICY)
+        assert breaker_for(base_url, POLICY) is not breaker_for("https://other/api", POLICY)
+
+
+class TestClientBreaker:
+    def test_open_circuit_fails_fast_across_clients(self, base_url: str) -> None:
+        a = PinergyClient(base_url=base_url, auth_token="a", breaker=POLICY)
+        b = PinergyClient(base_url=base_url, auth_token="b", breaker=POLICY)
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", exc=requests.ConnectTimeout)
+            for _ in range(4):
+                with pytest.raises(requests.ConnectTimeout):
+                    a.balance()
+            assert m.call_count == 4
+            with pytest.raises(PinergyCircuitOpenError):
+                b.balance()
+            assert m.call_count == 4
+
+    def test_client_errors_do_not_trip(self, base_url: str) -> None:
+        c = PinergyClient(base_url=base_url, auth_token="t", breaker=POLICY)
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", status_code=404, json={"message": "Not found"})
+            for _ in range(6):
+                with pytest.raises(PinergyAPIError) as exc:
+                    c.balance()
+                assert not isinstance(exc.value, PinergyCircuitOpenError)
+        assert breaker_for(base_url, POLICY).state == CLOSED
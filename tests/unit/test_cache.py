@@ -0,0 +1,93 @@
+"""Unit tests for ResponseCache and its use in PinergyClient."""
+
+import pytest
+from requests_mock import Mocker
+
+from pinergy_client.cache import ResponseCache
+from pinergy_client.client import PinergyClient
+from pinergy_client.exceptions import PinergyAPIError
+from pinergy_client.models import TopUpRequest
+
+
+class TestResponseCache:
+    def test_ttl_expiry(self, clock) -> None:
+        cache = ResponseCache(ttls={"/balance": 10}, clock=clock)
+        key = cache.key("t", "GET", "/balance")
+        cache.set(key, b'{"balance": 1}')
+        assert cache.get(key) == {"balance": 1}
+        clock.now += 10
+        assert cache.get(key) is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 0)
+
+    def test_uncached_path_not_stored(self) -> None:
+        cache = ResponseCache(ttls={"/balance": 10})
+        key = cache.key("t", "GET", "/usage")
+        cache.set(key, b"{}")
+        assert cache.get(key) is None
+
+    def test_lru_eviction_by_entries_and_bytes(self) -> None:
+        cache = ResponseCache(ttls={"/a": 60, "/b": 60, "/c": 60}, max_entries=2, max_bytes=20)
+        ka, kb, kc = (cache.key("t", "GET", p) for p in ("/a", "/b", "/c"))
+        cache.set(ka, b'{"x": 1}')
+        cache.set(kb, b'{"x": 2}')
+        cache.get(ka)  # a is now most recently used
+        cache.set(kc, b'{"x": 3}')
+        assert cache.get(kb) is None
+        assert cache.get(ka) == {"x": 1}
+        cache.set(kb, b'{"x": "a long body"}')
+        assert cache.stats().bytes <= 20
+        assert cache.stats().evictions >= 2
+
+    def test_key_includes_token_and_params(self) -> None:
+        cache = ResponseCache(ttls={"/landlordcheck": 60})
+        cache.set(cache.key("t1", "GET", "/landlordcheck", {"premises_number": "1"}), b"{}")
+        assert cache.get(cache.key("t2", "GET", "/landlordcheck", {"premises_number": "1"})) is None
+        assert cache.get(cache.key("t1", "GET", "/landlordcheck", {"premises_number": "2"})) is None
+        assert cache.get(cache.key("t1", "GET", "/landlordcheck", {"premises_number": "1"})) == {}
+
+
+class TestClientCaching:
+    def test_repeated_get_served_from_cache(self, base_url: str) -> None:
+        cache = ResponseCache()
+        c = PinergyClient(base_url=base_url, auth_token="t", cache=cache)
+        with Mocker() as m:
+            m.get(f"{base_url}/configinfo", json={"success": True, "thresholds": [5]})
+            assert c.get_config_info().thresholds == [5]
+            assert c.get_config_info().thresholds == [5]
+            assert m.call_count == 1
+            c.get_config_info(bypass_cache=True)
+            assert m.call_count == 2
+        assert cache.stats().hits == 1
+
+    def test_write_invalidates_token_entries(self, base_url: str) -> None:
+        c = PinergyClient(base_url=base_url, auth_token="t", cache=ResponseCache())
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", json={"success": True, "balance": 1.0})
+            m.post(f"{base_url}/topup", json={"success": True})
+            c.balance()
+            c.top_up(TopUpRequest(pinergy_id="p", cc_token="cc", amount=10.0))
+            c.balance()
+            assert m.call_count == 3
+
+    def test_errors_not_cached(self, base_url: str) -> None:
+        c = PinergyClient(base_url=base_url, auth_token="t", cache=ResponseCache())
+        with Mocker() as m:
+            m.get(
+                f"{base_url}/compare",
+                [{"status_code": 500, "json": {}}, {"json": {"success": True}}],
+            )
+            with pytest.raises(PinergyAPIError):
+                c.compare()
+            assert c.compare().success is True
+
+    def test_unsuccessful_200_not_cached(self, base_url: str) -> None:
+        c = PinergyClient(base_url=base_url, auth_token="t", cache=ResponseCache())
+        with Mocker() as m:
+            m.get(
+                f"{base_url}/configinfo",
+                [{"json": {"success": False, "message": "busy"}}, {"json": {"success": True, "thresholds": [5]}}],
+            )
+            assert c.get_config_info().success is False
+            assert c.get_config_info().thresholds == [5]
+            assert m.call_count == 2
@@ -0,0 +1,104 @@
+"""Unit tests for cassette record / replay."""
+
+import json
+from pathlib import Path
+
+import pytest
+import requests
+
+from pinergy_client.cassette import Cassette
+from pinergy_client.client import PinergyClient
+from pinergy_client.debuglog import REDACTED
+from pinergy_client.exceptions import PinergyAPIError, PinergyCassetteError
+
+
+class _Server(requests.adapters.BaseAdapter):
+    """Fake transport answering from a path -> (status, body) map, counting requests."""
+
+    def __init__(self, routes: dict[str, tuple[int, object]]) -> None:
+        super().__init__()
+        self.routes = routes
+        self.calls = 0
+
+    def send(self, request, **kwargs) -> requests.Response:
+        self.calls += 1
+        status, body = self.routes[request.path_url.split("?")[0].removeprefix("/api")]
+        resp = requests.Response()
+        resp.status_code = status
+        resp.reason = "OK" if status < 400 else "Error"
+        resp.headers["Content-Type"] = "application/json"
+        resp._content = json.dumps(body).encode()
+        resp.request = request
+        return resp
+
+    def close(self) -> None:
+        pass
+
+
+def _record(base_url: str, path: Path, balances: list[float]) -> None:
+    server = _Server(
+        {
+            "/login": (200, {"success": True, "auth_token": "live-secret", "user": {"email": "a@b.c"}}),
+            "/usage": (500, {"message": "boom"}),
+        }
+    )
+    with PinergyClient(base_url=base_url, adapter=server, cassette=Cassette(path, mode="record")) as c:
+        c.login(email="a@b.c", password="hunter2")
+        for b in balances:
+            server.routes["/balance"] = (200, {"success": True, "balance": b})
+            c.balance()
+        with pytest.raises(PinergyAPIError):
+            c.get_usage()
+
+
+class TestCassette:
+    def test_record_redacts_and_replay_serves_offline(self, base_url: str, tmp_path: Path) -> None:
+        path = tmp_path / "fixtures" / "session.json"
+        _record(base_url, path, [5.0, 4.5])
+        text = path.read_text()
+        assert "live-secret" not in text and "hunter2" not in text and REDACTED in text
+
+        cassette = Cassette(path)
+        assert len(cassette) == 4
+        c = PinergyClient(base_url=base_url, cassette=cassette)
+        login = c.login(email="x@y.z", password="other")
+        assert login.auth_token == REDACTED
+        assert [c.balance().balance for _ in range(3)] == [5.0, 4.5, 4.5]  # the last one repeats
+        with pytest.raises(PinergyAPIError) as exc:
+            c.get_usage()
+        assert exc.value.status_code == 500
+        with pytest.raises(PinergyCassetteError):
+            c.compare()
+
+    def test_replay_needs_no_token(
+        self, base_url: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("PINERGY_AUTH_TOKEN", raising=False)
+        path = tmp_path / "session.json.gz"
+        _record(base_url, path, [7.0])
+        with PinergyClient(base_url=base_url, cassette=Cassette(path)) as c:
+            assert c.auth_token in (None, "")
+            assert c.balance().balance == 7.0
+
+    def test_gzip_and_params_in_key(self, base_url: str, tmp_path: Path) -> None:
+        path = tmp_path / "session.json.gz"
+        cassette = Cassette(path, mode="record")
+        server = _Server({"/x": (200, {"n": 1})})
+        adapter = cassette.adapter(server)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.get(f"{base_url}/x", params={"b": "2", "a": "1", "auth_token": "s3cret"})
+        cassette.save()
+        assert path.read_bytes()[:2] == b"\x1f\x8b"
+
+        replay = Cassette(path)
+        prepared = requests.Request("GET", f"{base_url}/x?a=1&b=2&auth_token=other").prepare()
+        assert replay.play(prepared).json() == {"n": 1}
+        with pytest.raises(PinergyCassetteError):
+            replay.play(requests.Request("GET", f"{base_url}/x?a=1").prepare())
+
+    def test_replay_requires_existing_file_and_valid_mode(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            Cassette(tmp_path / "missing.json")
+        with pytest.raises(ValueError):
+            Cassette(tmp_path / "x.json", mode="append")
@@ -0,0 +1,116 @@
+"""Unit tests for the CLI commands, mostly run against the local mock API server."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+from requests_mock import Mocker
+
+from pinergy_client.cli import main
+from pinergy_client.mockserver import MockPinergyAPI, MockPinergyServer
+
+
+@pytest.fixture(autouse=True)
+def _isolated_env(monkeypatch, tmp_path) -> None:
+    for name in ("PINERGY_AUTH_TOKEN", "PINERGY_EMAIL", "PINERGY_PASSWORD", "PINERGY_BASE_URL", "PINERGY_OUTPUT"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("PINERGY_CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def server():
+    with MockPinergyServer(MockPinergyAPI(accounts=3, days=7)) as server:
+        yield server
+
+
+def _lines(output: str) -> list[dict]:
+    return [json.loads(line) for line in output.splitlines() if line.strip()]
+
+
+class TestMulti:
+    def test_ndjson_lines_and_failure_exit_code(self, server, tmp_path) -> None:
+        accounts = tmp_path / "accounts.txt"
+        accounts.write_text("# tokens\nmock-token-0\nmock-token-1\nbad-token\n")
+        result = CliRunner().invoke(
+            main, ["--base-url", server.url, "multi", "balance", "--accounts", str(accounts), "--workers", "3"]
+        )
+        assert result.exit_code == 1
+        lines = sorted(_lines(result.stdout), key=lambda line: line["account"])
+        assert [line["ok"] for line in lines] == [True, True, False]
+        for line in lines:
+            assert line["command"] == "balance" and line["latency_ms"] >= 0
+        assert lines[0]["result"]["success"] and "error" not in lines[0]
+        assert lines[2]["status_code"] == 401 and lines[2]["error"] and "result" not in lines[2]
+        assert "2 ok, 1 failed" in result.stderr
+
+    def test_account_without_token_or_email_is_rejected(self, server, monkeypatch) -> None:
+        monkeypatch.setenv("PINERGY_EMAIL", "user0@example.com")
+        monkeypatch.setenv("PINERGY_PASSWORD", "password0")
+        result = CliRunner().invoke(main, ["--base-url", server.url, "multi", "balance"], input='{"name": "Flat 4"}\n')
+        assert result.exit_code == 2
+        assert "Flat 4" in result.stderr and result.stdout == ""
+        assert server.stats["/login"] == 0
+
+    def test_accounts_from_stdin(self, server) -> None:
+        result = CliRunner().invoke(
+            main, ["--base-url", server.url, "multi", "compare"], input="mock-token-0\nmock-token-2\n"
+        )
+        assert result.exit_code == 0, result.output
+        assert [line["ok"] for line in _lines(result.stdout)] == [True, True]
+
+    def test_email_password_accounts_use_token_cache(self, server, tmp_path) -> None:
+        accounts = "user0@example.com,password0\nuser1@example.com,password1\n"
+        args = ["--base-url", server.url, "multi", "balance"]
+        for _ in range(2):
+            result = CliRunner().invoke(main, args, input=accounts)
+            assert result.exit_code == 0, result.output
+            assert {line["account"] for line in _lines(result.stdout)} == {"user0@example.com", "user1@example.com"}
+        assert server.stats["/login"] == 2  # the second run reuses the cached tokens
+        cached = json.loads((tmp_path / "cache" / "tokens.json").read_text())
+        assert set(cached) == {"user0@example.com", "user1@example.com"}
+        assert all(entry["auth_token"] for entry in cached.values())
+
+
+class TestWatch:
+    def test_json_output_is_one_line_per_poll(self, server) -> None:
+        args = ["--base-url", server.url, "--output", "json", "watch", "--token", "mock-token-0", "--count", "2"]
+        result = CliRunner().invoke(main, [*args, "--min-interval", "0.01", "--max-interval", "0.01"])
+        assert result.exit_code == 0, result.output
+        lines = result.stdout.splitlines()
+        assert len(lines) == 2
+        assert all(json.loads(line)["balance"]["success"] for line in lines)
+
+
+class TestExport:
+    def test_csv_to_file(self, server, tmp_path) -> None:
+        path = tmp_path / "usage.csv"
+        result = CliRunner().invoke(
+            main, ["--base-url", server.url, "export", "usage", "--token", "mock-token-0", "--out", str(path)]
+        )
+        assert result.exit_code == 0, result.output
+        assert result.stdout == ""
+        header, *rows = path.read_text().splitlines()
+        assert header == "period,date,timestamp,kwh,amount,co2"
+        assert rows and {row.split(",")[0] for row in rows} <= {"day", "week", "month"}
+
+    def test_ndjson_to_stdout(self, server) -> None:
+        result = CliRunner().invoke(
+            main,
+            ["--base-url", server.url, "export", "level-pay", "--format", "ndjson"],
+            env={"PINERGY_AUTH_TOKEN": "mock-token-1"},
+        )
+        assert result.exit_code == 0, result.output
+        rows = _lines(result.stdout)
+        assert len(rows) == 7 * 48
+        assert set(rows[0]) == {"day", "slot", "kwh", "euro"}
+
+    def test_unsuccessful_response_exits_1(self, base_url: str, tmp_path) -> None:
+        path = tmp_path / "history.csv"
+        with Mocker() as m:
+            m.get(f"{base_url}/topuphistory", json={"success": False, "message": "Not available"})
+            result = CliRunner().invoke(
+                main, ["--base-url", base_url, "export", "topup-history", "--token", "t", "-o", str(path)]
+            )
+        assert result.exit_code == 1
+        assert "Not available" in result.stderr
+        assert not path.exists()
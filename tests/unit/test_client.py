@@ -8,11 +8,6 @@ from pinergy_client.exceptions import PinergyAPIError, PinergyAuthError
 from pinergy_client.models import TopUpRequest
 
 
-@pytest.fixture
-def base_url() -> str:
-    return "https://api.pinergy.ie/api"
-
-
 @pytest.fixture
 def client(base_url: str) -> PinergyClient:
     return PinergyClient(base_url=base_url, auth_token="test-token")
@@ -97,6 +92,13 @@ class TestPinergyClientEndpoints:
             assert exc_info.value.status_code == 500
             assert "Server error" in str(exc_info.value)
 
+    def test_rejected_token_raises_auth_error(self, client: PinergyClient, base_url: str) -> None:
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", status_code=401, json={"message": "Invalid token"})
+            with pytest.raises(PinergyAuthError) as exc_info:
+                client.balance()
+            assert exc_info.value.status_code == 401
+
     def test_get_defaults_no_auth(self, client: PinergyClient, base_url: str) -> None:
         c = PinergyClient(base_url=base_url)
         with Mocker() as m:
@@ -130,3 +132,55 @@ class TestPinergyClientEndpoints:
             resp = c.landlord_check(premises_number="P123")
             assert resp.is_landlord_account is True
             assert "premises_number" in (m.last_request.query or "")
+
+
+class TestPinergyClientReauth:
+    def _balance(self, request, context):
+        if request.headers.get("auth_token") != "fresh":
+            context.status_code = 401
+            return {"message": "Token expired"}
+        return {"success": True, "balance": 7.0}
+
+    def test_logs_in_lazily_with_credentials(self, base_url: str) -> None:
+        with Mocker() as m:
+            login = m.post(f"{base_url}/login", json={"success": True, "auth_token": "fresh"})
+            m.get(f"{base_url}/balance", json=self._balance)
+            with PinergyClient(base_url=base_url, auth_token="", credentials=("a@b.ie", "pw")) as c:
+                assert c.balance().balance == 7.0
+        assert login.call_count == 1
+
+    def test_concurrent_401s_trigger_one_login_and_replay(self, base_url: str) -> None:
+        import threading
+
+        with Mocker() as m:
+            login = m.post(f"{base_url}/login", json={"success": True, "auth_token": "fresh"})
+            m.get(f"{base_url}/balance", json=self._balance)
+            c = PinergyClient(base_url=base_url, auth_token="expired", credentials=("a@b.ie", "pw"))
+            results: list[float] = []
+            threads = [threading.Thread(target=lambda: results.append(c.balance().balance)) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert results == [7.0] * 8
+        assert login.call_count == 1
+        device_tokens = {r.json()["device_token"] for r in login.request_history}
+        assert len(device_tokens) == 1
+
+    def test_failed_write_refreshes_but_is_not_replayed(self, base_url: str) -> None:
+        with Mocker() as m:
+            m.post(f"{base_url}/login", json={"success": True, "auth_token": "fresh"})
+            top_up = m.post(f"{base_url}/topup", status_code=401, json={"message": "Token expired"})
+            c = PinergyClient(base_url=base_url, auth_token="expired", credentials=("a@b.ie", "pw"))
+            with pytest.raises(PinergyAuthError):
+                c.top_up(TopUpRequest(pinergy_id="p", cc_token="cc", amount=10))
+        assert top_up.call_count == 1
+        assert c.auth_token == "fresh"
+
+    def test_without_credentials_401_propagates(self, base_url: str, client: PinergyClient) -> None:
+        with Mocker() as m:
+            login = m.post(f"{base_url}/login", json={"success": True, "auth_token": "fresh"})
+            m.get(f"{base_url}/balance", json=self._balance)
+            with pytest.raises(PinergyAuthError):
+                client.balance()
+        assert login.call_count == 0
@@ -0,0 +1,71 @@
+"""Unit tests for request/response debug logging."""
+
+import io
+import logging
+
+import pytest
+from requests_mock import Mocker
+
+from pinergy_client.client import PinergyClient
+from pinergy_client.debuglog import LOGGER_NAME, REDACTED, DebugLog
+
+
+class TestDebugLog:
+    def test_debug_true_writes_redacted_traffic_to_stream(self, base_url: str) -> None:
+        stream = io.StringIO()
+        c = PinergyClient(base_url=base_url, auth_token="secret-token", debug=True, log_stream=stream)
+        with Mocker() as m:
+            m.post(f"{base_url}/login", json={"success": True, "auth_token": "new-secret"})
+            c.login(email="a@b.c", password="pw", device_token="dev-secret")
+        out = stream.getvalue()
+        assert "POST https://api.pinergy.ie/api/login" in out and "-> 200" in out
+        assert "a@b.c" in out and out.count(REDACTED) >= 4
+        for secret in ("secret-token", "new-secret", "dev-secret"):
+            assert secret not in out
+
+    def test_debug_true_does_not_truncate_bodies(self, base_url: str) -> None:
+        stream = io.StringIO()
+        c = PinergyClient(base_url=base_url, auth_token="t", debug=True, log_stream=stream)
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", json={"success": True, "message": "x" * 5000})
+            c.balance()
+        assert "x" * 5000 + '"' in stream.getvalue() and "bytes)" not in stream.getvalue()
+
+    def test_nothing_formatted_when_debug_disabled(
+        self, base_url: str, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        caplog.set_level(logging.INFO, logger=LOGGER_NAME)
+        log = DebugLog()
+        assert log.sampled() is False
+        c = PinergyClient(base_url=base_url, auth_token="t", debug=log)
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", json={"success": True})
+            c.balance()
+        assert caplog.records == []
+
+    def test_sampling(self, base_url: str, caplog: pytest.LogCaptureFixture) -> None:
+        caplog.set_level(logging.DEBUG, logger=LOGGER_NAME)
+        c = PinergyClient(base_url=base_url, auth_token="t", debug=DebugLog(sample=3))
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", json={"success": True})
+            for _ in range(6):
+                c.balance()
+        assert len(caplog.records) == 4  # request + response for calls 1 and 4
+
+    def test_truncation_masks_cut_secrets(self, caplog: pytest.LogCaptureFixture) -> None:
+        caplog.set_level(logging.DEBUG, logger=LOGGER_NAME)
+        body = b'{"message": "ok", "auth_token": "abcdefghijklmnop", "data": "' + b"x" * 1000 + b'"}'
+        log = DebugLog(max_body=40)
+        log.response("POST", "/login", 200, 0.1, body)
+        text = caplog.records[0].getMessage()
+        assert f'"auth_token": "{REDACTED}"' in text
+        assert "abcdef" not in text
+        assert text.endswith(f"... ({len(body)} bytes)")
+
+    def test_custom_redact_keys_and_validation(self, caplog: pytest.LogCaptureFixture) -> None:
+        caplog.set_level(logging.DEBUG, logger=LOGGER_NAME)
+        DebugLog(redact=frozenset({"Email"})).request("POST", "/x", {}, None, {"email": "a@b.c", "password": "p"})
+        text = caplog.records[0].getMessage()
+        assert "a@b.c" not in text and '"password":"p"' in text
+        with pytest.raises(ValueError):
+            DebugLog(sample=0)
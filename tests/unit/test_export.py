@@ -0,0 +1,98 @@
+"""Unit tests for CSV / NDJSON export."""
+
+import io
+import json
+from array import array
+
+import pytest
+
+from pinergy_client import export
+from pinergy_client.models import (
+    LevelPayDaily,
+    LevelPayUsage,
+    PlanMatrix,
+    TopUpHistoryResponse,
+    UsagesResponse,
+)
+
+
+def _level_pay() -> LevelPayUsage:
+    return LevelPayUsage(
+        success=True,
+        daily=LevelPayDaily(
+            slot_labels=["00:00", "00:30"],
+            day_labels=["21/02", "22/02"],
+            half_hourly_kwh=array("d", [1.0, 2.0, 3.0, 4.0]),
+            half_hourly_euro=array("d", [0.1, 0.2, 0.3, 0.4]),
+            day_kwh=PlanMatrix(plans=["Day", "Night"], labels=["21/02", "22/02"], values=array("d", [1, 2, 3, 4])),
+            day_euro=PlanMatrix(plans=["Night"], labels=["21/02", "22/02"], values=array("d", [0.3, 0.4])),
+        ),
+    )
+
+
+class TestRows:
+    def test_usage_rows_cover_every_period_untruncated(self) -> None:
+        resp = UsagesResponse.from_dict(
+            {"success": True, "day": [{"date": 1740096000, "kwh": 1.5}] * 20, "month": [{"date": 0, "amount": 9}]}
+        )
+        rows = list(export.usage_rows(resp))
+        assert len(rows) == 21
+        assert rows[0] == ("day", "2025-02-21", 1740096000, 1.5, 0.0, 0.0)
+        assert rows[-1] == ("month", "", 0, 0.0, 9.0, 0.0)
+
+    def test_top_up_history_rows(self) -> None:
+        resp = TopUpHistoryResponse.from_dict(
+            {"success": True, "top_ups": [{"top_up_id": "t1", "top_up_amount": 20, "top_up_date": 1740096000}]}
+        )
+        assert list(export.top_up_history_rows(resp)) == [("t1", "2025-02-21", 1740096000, 20.0, "", "")]
+
+    def test_level_pay_rows_one_per_half_hour(self) -> None:
+        rows = list(export.level_pay_rows(_level_pay()))
+        assert rows == [
+            ("21/02", "00:00", 1.0, 0.1),
+            ("21/02", "00:30", 2.0, 0.2),
+            ("22/02", "00:00", 3.0, 0.3),
+            ("22/02", "00:30", 4.0, 0.4),
+        ]
+        assert list(export.level_pay_rows(LevelPayUsage())) == []
+
+    def test_level_pay_period_rows_align_euro_by_plan(self) -> None:
+        rows = list(export.level_pay_period_rows(_level_pay()))
+        assert rows == [
+            ("daily", "21/02", "Day", 1.0, 0.0),
+            ("daily", "22/02", "Day", 2.0, 0.0),
+            ("daily", "21/02", "Night", 3.0, 0.3),
+            ("daily", "22/02", "Night", 4.0, 0.4),
+        ]
+
+
+class TestWriters:
+    def test_csv(self) -> None:
+        out = io.StringIO()
+        n = export.write_rows(export.level_pay_rows(_level_pay()), export.LEVEL_PAY_FIELDS, out, "csv")
+        assert n == 4
+        lines = out.getvalue().splitlines()
+        assert lines[0] == "day,slot,kwh,euro"
+        assert lines[1] == "21/02,00:00,1.0,0.1"
+
+    def test_ndjson(self) -> None:
+        out = io.StringIO()
+        n = export.write_rows(iter([("a", 1.0), ("€", 2.0)]), ("k", "v"), out, "ndjson")
+        assert n == 2
+        assert [json.loads(line) for line in out.getvalue().splitlines()] == [
+            {"k": "a", "v": 1.0},
+            {"k": "€", "v": 2.0},
+        ]
+
+    def test_unknown_format(self) -> None:
+        with pytest.raises(ValueError, match="Unknown export format"):
+            export.write_rows(iter([]), ("k",), io.StringIO(), "xml")
+
+
+class TestToJsonable:
+    def test_models_become_plain_json(self) -> None:
+        data = export.to_jsonable(_level_pay())
+        assert data["daily"]["half_hourly_kwh"] == [1.0, 2.0, 3.0, 4.0]
+        assert data["daily"]["day_euro"] == {"plans": ["Night"], "labels": ["21/02", "22/02"], "values": [0.3, 0.4]}
+        assert data["weekly"] is None
+        assert json.loads(json.dumps(data)) == data
@@ -0,0 +1,98 @@
+"""Unit tests for PinergyFleet (mocked HTTP)."""
+
+import threading
+import time
+
+import pytest
+from requests_mock import Mocker
+
+from pinergy_client.client import PinergyClient
+from pinergy_client.exceptions import PinergyAPIError, PinergyAuthError
+from pinergy_client.fleet import Account, PinergyFleet, load_accounts
+
+
+def _balance_callback(request, context):
+    token = request.headers.get("auth_token")
+    if token == "bad":
+        context.status_code = 500
+        return {"message": "Server error"}
+    return {"success": True, "balance": {"t1": 1.0, "t2": 2.0, "logged-in": 3.0}[token]}
+
+
+class TestPinergyFleet:
+    def test_balance_streams_results_and_errors(self, base_url: str) -> None:
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", json=_balance_callback)
+            with PinergyFleet(["t1", "t2", "bad"], base_url=base_url) as fleet:
+                results = {a.name: r for a, r in fleet.balance()}
+        assert results["account-0"].balance == 1.0
+        assert results["account-1"].balance == 2.0
+        assert isinstance(results["account-2"], PinergyAPIError)
+        assert results["account-2"].status_code == 500
+
+    def test_credentials_account_logs_in_once(self, base_url: str) -> None:
+        with Mocker() as m:
+            login = m.post(f"{base_url}/login", json={"success": True, "auth_token": "logged-in"})
+            m.get(f"{base_url}/balance", json=_balance_callback)
+            with PinergyFleet([("a@b.ie", "pw")], base_url=base_url) as fleet:
+                first = list(fleet.balance())
+                second = list(fleet.balance())
+        assert first[0][0] == Account(name="a@b.ie", email="a@b.ie", password="pw")
+        assert first[0][1].balance == 3.0
+        assert second[0][1].balance == 3.0
+        assert login.call_count == 1
+
+    def test_account_without_token_or_email_never_uses_env_login(self, base_url: str, monkeypatch) -> None:
+        monkeypatch.setenv("PINERGY_EMAIL", "someone-else@b.ie")
+        monkeypatch.setenv("PINERGY_PASSWORD", "pw")
+        with pytest.raises(ValueError):
+            Account(name="flat 4")
+        with pytest.raises(ValueError, match="Line 2"):
+            load_accounts(["tok-1", '{"name": "flat 4"}'])
+        factory = lambda a: PinergyClient(base_url=base_url, auth_token="")  # noqa: E731 - drops the token
+        with Mocker() as m:
+            login = m.post(f"{base_url}/login", json={"success": True, "auth_token": "someone-else"})
+            with PinergyFleet(["t1"], base_url=base_url, client_factory=factory) as fleet:
+                [(_, result)] = list(fleet.balance())
+        assert isinstance(result, PinergyAuthError)
+        assert login.call_count == 0
+
+    def test_global_concurrency_cap(self, base_url: str) -> None:
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def slow(_client):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return True
+
+        with PinergyFleet([f"t{i}" for i in range(10)], base_url=base_url, max_workers=3) as fleet:
+            results = list(fleet.map(slow))
+        assert len(results) == 10
+        assert all(r is True for _, r in results)
+        assert peak <= 3
+
+
+class TestLoadAccounts:
+    def test_parses_tokens_credentials_and_json(self) -> None:
+        lines = [
+            "# comment",
+            "tok-1",
+            "",
+            "a@b.ie,pw,with,commas",
+            '{"name": "flat 4", "token": "tok-2"}',
+            '{"email": "c@d.ie", "password": "x"}',
+        ]
+        assert load_accounts(lines) == [
+            Account(name="account-0", auth_token="tok-1"),
+            Account(name="a@b.ie", email="a@b.ie", password="pw,with,commas"),
+            Account(name="flat 4", auth_token="tok-2"),
+            Account(name="c@d.ie", email="c@d.ie", password="x"),
+        ]
+        assert load_accounts(lines)[3].credentials == ("c@d.ie", "x")
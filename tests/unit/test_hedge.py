@@ -0,0 +1,139 @@
+"""Unit tests for hedged GETs."""
+
+import asyncio
+import itertools
+import json
+import time
+
+import httpx
+import pytest
+import requests
+from requests_mock import Mocker
+
+from pinergy_client.async_client import AsyncPinergyClient
+from pinergy_client.client import PinergyClient
+from pinergy_client.hedge import HedgePolicy, HedgeStats, Hedger, _Latencies
+from pinergy_client.models import TopUpRequest
+
+
+class _Adapter(requests.adapters.BaseAdapter):
+    """Concurrent fake transport (requests_mock serialises requests across threads)."""
+
+    def __init__(self, delays: list[float]) -> None:
+        super().__init__()
+        self.delays = delays
+        self.calls = itertools.count()
+
+    def send(self, request, **kwargs) -> requests.Response:
+        n = next(self.calls)
+        time.sleep(self.delays[n] if n < len(self.delays) else 0)
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = json.dumps({"success": True, "day": [{"date": n, "kwh": 1.0}]}).encode()
+        resp.request = request
+        return resp
+
+    def close(self) -> None:
+        pass
+
+
+class TestHedgePolicy:
+    def test_only_gets_on_listed_paths(self) -> None:
+        policy = HedgePolicy(paths=frozenset({"/usage"}))
+        assert policy.applies("GET", "/usage")
+        assert not policy.applies("GET", "/balance")
+        assert not policy.applies("POST", "/usage")
+        assert not HedgePolicy(max_hedges=0).applies("GET", "/usage")
+
+    def test_adaptive_delay_tracks_quantile(self) -> None:
+        latencies = _Latencies(HedgePolicy(initial_delay=2.0, min_samples=10, quantile=0.9))
+        assert latencies.delay_for("/usage") == 2.0
+        for ms in range(1, 21):
+            latencies.record("/usage", ms / 1000)
+        assert latencies.delay_for("/usage") == 0.019
+        assert latencies.delay_for("/balance") == 2.0
+        assert _Latencies(HedgePolicy(delay=0.3)).delay_for("/usage") == 0.3
+
+
+class TestHedger:
+    def test_all_attempts_failing_raises_first_error(self) -> None:
+        hedger = Hedger(HedgePolicy(delay=0.01, max_hedges=2))
+        calls = itertools.count()
+
+        def fail() -> int:
+            n = next(calls)
+            time.sleep(0.05)
+            raise ValueError(f"attempt {n}")
+
+        with pytest.raises(ValueError, match="attempt 0"):
+            hedger.do("/usage", fail)
+        assert hedger.stats == HedgeStats(calls=1, fired=2, won=0)
+        hedger.close()
+
+
+class TestClientHedging:
+    def test_slow_get_is_hedged_and_hedge_wins(self, base_url: str) -> None:
+        adapter = _Adapter([0.5])
+        with PinergyClient(base_url=base_url, auth_token="t", hedge=HedgePolicy(delay=0.05)) as c:
+            c._session.mount(base_url, adapter)
+            start = time.monotonic()
+            resp = c.get_usage()
+            assert time.monotonic() - start < 0.4
+            assert resp.day[0].date == 1
+            assert c.hedge_stats == HedgeStats(calls=1, fired=1, won=1)
+
+    def test_fast_get_not_hedged(self, base_url: str) -> None:
+        with PinergyClient(base_url=base_url, auth_token="t", hedge=HedgePolicy(delay=0.5)) as c:
+            with Mocker() as m:
+                m.get(f"{base_url}/balance", json={"success": True, "balance": 1.0})
+                c.balance()
+                assert m.call_count == 1
+            assert c.hedge_stats == HedgeStats(calls=1, fired=0, won=0)
+
+    def test_top_up_never_hedged(self, base_url: str) -> None:
+        def slow(request, context):
+            time.sleep(0.1)
+            return {"success": True}
+
+        with PinergyClient(base_url=base_url, auth_token="t", hedge=HedgePolicy(delay=0.01)) as c:
+            with Mocker() as m:
+                m.post(f"{base_url}/topup", json=slow)
+                c.top_up(TopUpRequest(pinergy_id="p", cc_token="cc", amount=10.0))
+                assert m.call_count == 1
+            assert c.hedge_stats == HedgeStats()
+
+    def test_connection_error_on_both_attempts_raises(self, base_url: str) -> None:
+        with PinergyClient(base_url=base_url, auth_token="t", hedge=HedgePolicy(delay=0.0)) as c:
+            with Mocker() as m:
+                m.get(f"{base_url}/usage", exc=requests.ConnectionError)
+                with pytest.raises(requests.ConnectionError):
+                    c.get_usage()
+
+    def test_async_hedge_wins_and_loser_is_cancelled(self, base_url: str) -> None:
+        calls = itertools.count()
+        cancelled: list[int] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            n = next(calls)
+            try:
+                if n == 0:
+                    await asyncio.sleep(5)
+                return httpx.Response(200, json={"success": True, "balance": float(n)})
+            except asyncio.CancelledError:
+                cancelled.append(n)
+                raise
+
+        async def run() -> tuple[float, HedgeStats]:
+            async with AsyncPinergyClient(
+                base_url=base_url,
+                auth_token="t",
+                transport=httpx.MockTransport(handler),
+                hedge=HedgePolicy(delay=0.02),
+            ) as c:
+                resp = await c.balance()
+                return resp.balance, c.hedge_stats
+
+        balance, stats = asyncio.run(run())
+        assert balance == 1.0
+        assert stats == HedgeStats(calls=1, fired=1, won=1)
+        assert cancelled == [0]
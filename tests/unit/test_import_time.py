@@ -0,0 +1,46 @@
+"""Import-time guards for the package and CLI (fresh interpreters via subprocess)."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Heavy dependencies that must only load when a command actually needs them
+# (checked by module presence, not timing, so the guard is immune to a busy machine)
+HEAVY = ("requests", "urllib3", "rich", "pydantic", "dotenv", "httpx", "asyncio", "sqlite3")
+
+
+def _loaded_heavy(module: str) -> list[str]:
+    code = (
+        f"import sys, {module}\n"
+        f"heavy = {HEAVY!r}\n"
+        "print(' '.join(sorted({m.split('.')[0] for m in sys.modules} & set(heavy))))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=ROOT)
+    return out.stdout.split()
+
+
+class TestImportTime:
+    def test_package_import_is_lazy(self) -> None:
+        assert _loaded_heavy("pinergy_client") == []
+
+    def test_cli_import_is_lazy(self) -> None:
+        assert _loaded_heavy("pinergy_client.cli") == []
+
+    def test_json_output_never_imports_rich(self) -> None:
+        code = (
+            "import sys, requests_mock\n"
+            "from click.testing import CliRunner\n"
+            "from pinergy_client.cli import main\n"
+            "with requests_mock.Mocker() as m:\n"
+            "    m.get('https://api.pinergy.ie/api/balance', json={'success': True, 'balance': 1.5})\n"
+            "    r = CliRunner().invoke(main, ['--output', 'ndjson', 'balance', '--token', 't'])\n"
+            "assert r.exit_code == 0, r.output\n"
+            "print(r.output.strip())\n"
+            "print('rich' in sys.modules)\n"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=ROOT)
+        line, rich_loaded = out.stdout.splitlines()
+        assert '"balance":1.5' in line
+        assert rich_loaded == "False"
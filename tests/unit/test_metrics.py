@@ -0,0 +1,135 @@
+"""Unit tests for request hooks and per-endpoint metrics."""
+
+import asyncio
+
+import httpx
+import pytest
+from requests_mock import Mocker
+
+from pinergy_client.async_client import AsyncPinergyClient
+from pinergy_client.cache import ResponseCache
+from pinergy_client.client import PinergyClient
+from pinergy_client.exceptions import PinergyAPIError
+from pinergy_client.metrics import EndpointMetrics, Histogram, HttpcoreTrace, RequestEvent
+
+
+class TestHistogram:
+    def test_buckets_and_quantiles(self) -> None:
+        h = Histogram((0.1, 1.0, float("inf")))
+        for v in (0.05, 0.1, 0.5, 2.0):
+            h.observe(v)
+        assert h.cumulative() == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+        assert h.quantile(0.5) == 0.1
+        assert h.quantile(0.75) == 1.0
+        assert h.count == 4 and h.sum == pytest.approx(2.65)
+
+
+class TestEndpointMetrics:
+    def _metrics(self) -> EndpointMetrics:
+        m = EndpointMetrics(buckets=(0.1, 1.0))
+        m(RequestEvent("GET", "/balance", status=200, bytes=40, attempts=1, network=0.05, ttfb=0.04, total=0.06))
+        m(RequestEvent("GET", "/balance", status=503, attempts=1, network=2.0, total=2.0, error=PinergyAPIError("x")))
+        m(RequestEvent("GET", "/balance", cache_hit=True, total=0.001))
+        return m
+
+    def test_as_dict(self) -> None:
+        data = self._metrics().as_dict()["GET /balance"]
+        assert (data["requests"], data["errors"], data["cache_hits"], data["bytes"]) == (3, 1, 1, 40)
+        assert data["statuses"] == {200: 1, 503: 1}
+        assert data["latency"]["total"]["count"] == 3
+        assert data["latency"]["network"]["buckets"] == {"0.1": 1, "1.0": 1, "+Inf": 2}
+        assert data["latency"]["ttfb"]["count"] == 1
+        assert "connect" not in data["latency"]
+
+    def test_prometheus_text(self) -> None:
+        text = self._metrics().to_prometheus()
+        assert "# TYPE pinergy_request_duration_seconds histogram" in text
+        assert 'pinergy_requests_total{method="GET",path="/balance",status="503"} 1' in text
+        assert (
+            'pinergy_request_duration_seconds_bucket{method="GET",path="/balance",phase="total",le="+Inf"} 3'
+            in text
+        )
+        assert 'pinergy_request_duration_seconds_count{method="GET",path="/balance",phase="network"} 2' in text
+        assert text.endswith("\n")
+
+
+class TestClientHooks:
+    def test_hook_receives_event_and_metrics_record(self, base_url: str) -> None:
+        events: list[RequestEvent] = []
+        c = PinergyClient(base_url=base_url, auth_token="t", hooks=[events.append])
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", json={"success": True, "balance": 5.0})
+            assert c.balance().balance == 5.0
+        (event,) = events
+        assert (event.method, event.path, event.status, event.attempts) == ("GET", "/balance", 200, 1)
+        assert event.bytes == len(b'{"success": true, "balance": 5.0}')
+        assert event.error is None and event.ttfb is not None
+        assert event.total >= event.network + event.decode + event.parse
+        assert c.metrics.as_dict()["GET /balance"]["requests"] == 1
+
+    def test_failed_call_and_cache_hit(self, base_url: str) -> None:
+        events: list[RequestEvent] = []
+        c = PinergyClient(base_url=base_url, auth_token="t", cache=ResponseCache())
+        c.add_hook(events.append)
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", json={"success": True, "balance": 5.0})
+            m.get(f"{base_url}/usage", status_code=500, json={"message": "boom"})
+            c.balance()
+            c.balance()
+            with pytest.raises(PinergyAPIError):
+                c.get_usage()
+        assert [e.cache_hit for e in events] == [False, True, False]
+        assert events[1].attempts == 0
+        assert isinstance(events[2].error, PinergyAPIError) and events[2].status == 500
+
+    def test_broken_hook_does_not_break_call(self, base_url: str) -> None:
+        def broken(event: RequestEvent) -> None:
+            raise RuntimeError("hook bug")
+
+        c = PinergyClient(base_url=base_url, auth_token="t", hooks=[broken])
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", json={"success": True})
+            assert c.balance().success is True
+
+    def test_shared_metrics_across_clients(self, base_url: str) -> None:
+        metrics = EndpointMetrics()
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", json={"success": True})
+            for token in ("a", "b"):
+                PinergyClient(base_url=base_url, auth_token=token, metrics=metrics).balance()
+        assert metrics.as_dict()["GET /balance"]["requests"] == 2
+
+    def test_async_client_emits_events(self, base_url: str) -> None:
+        events: list[RequestEvent] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"success": True, "balance": 2.0})
+
+        async def run() -> None:
+            async with AsyncPinergyClient(
+                base_url=base_url, auth_token="t", transport=httpx.MockTransport(handler), hooks=[events.append]
+            ) as c:
+                await c.balance()
+
+        asyncio.run(run())
+        (event,) = events
+        assert (event.path, event.status, event.attempts) == ("/balance", 200, 1)
+        assert event.bytes > 0
+
+
+class TestHttpcoreTrace:
+    def test_connect_and_ttfb_from_marks(self) -> None:
+        trace = HttpcoreTrace()
+        trace._marks.update(
+            {
+                "connect_tcp.started": 1.0,
+                "connect_tcp.complete": 1.2,
+                "start_tls.complete": 1.5,
+                "send_request_headers.started": 1.6,
+                "receive_response_headers.complete": 2.1,
+            }
+        )
+        assert trace.connect == pytest.approx(0.5)
+        assert trace.ttfb == pytest.approx(0.5)
+        trace.reset()
+        assert trace.connect is None and trace.ttfb is None
@@ -0,0 +1,95 @@
+"""Unit tests for the local mock Pinergy API server."""
+
+import time
+from datetime import date
+
+import pytest
+import requests
+
+from pinergy_client.client import PinergyClient
+from pinergy_client.exceptions import PinergyAPIError, PinergyAuthError
+from pinergy_client.mockserver import Faults, MockPinergyAPI, MockPinergyServer
+from pinergy_client.models import TopUpRequest
+from pinergy_client.transport import RetryPolicy
+
+
+@pytest.fixture(scope="module")
+def api() -> MockPinergyAPI:
+    return MockPinergyAPI(accounts=3, days=40, seed=1, today=date(2026, 3, 1))
+
+
+class TestMockPinergyAPI:
+    def test_data_is_reproducible_and_consistent(self, api: MockPinergyAPI) -> None:
+        again = MockPinergyAPI(accounts=3, days=40, seed=1, today=date(2026, 3, 1))
+        assert [a.kwh for a in again.accounts] == [a.kwh for a in api.accounts]
+        status, body = api.handle("GET", "/levelPayUsage", token="mock-token-0")
+        assert status == 200
+        days = body["usageData"]["daily"]["values"]
+        assert len(days) == 40 and days[-1]["label"] == "28/02"
+        day = days[-1]
+        assert day["daykWh"]["Total"] == pytest.approx(sum(day["halfHourlykWh"]), abs=1e-3)
+        assert day["dayEuro"]["Total"] == pytest.approx(sum(day["halfHourlyEuro"]), abs=0.01)
+        monthly = body["usageData"]["monthly"]
+        total = sum(sum(p["usage"]) for p in monthly["monthlykWh"])
+        assert total == pytest.approx(sum(d["daykWh"]["Total"] for d in days), abs=0.01)
+
+    def test_unknown_token_and_endpoint(self, api: MockPinergyAPI) -> None:
+        assert api.handle("GET", "/balance", token="nope")[0] == 401
+        assert api.handle("GET", "/nope", token="mock-token-0")[0] == 404
+        assert api.handle("GET", "/defaultsinfo")[0] == 200
+
+    def test_accounts_do_not_block_each_other(self, api: MockPinergyAPI) -> None:
+        with api.accounts[0].lock:  # as if a slow call for account 0 were in progress
+            assert api.handle("GET", "/balance", token="mock-token-1")[0] == 200
+            assert api.handle("POST", "/login", body={"email": "user2@example.com", "password": "x"})[0] == 200
+
+
+class TestMockPinergyServer:
+    def test_client_round_trip(self) -> None:
+        api = MockPinergyAPI(accounts=2, days=14, today=date(2026, 3, 1))
+        with MockPinergyServer(api) as server, PinergyClient(base_url=server.url) as c:
+            login = c.login("user1@example.com", "password1")
+            assert login.success and login.user.pinergy_id == "PIN100001"
+            before = c.balance().balance
+            history = len(c.get_top_up_history().top_ups)
+            c.top_up(TopUpRequest(login.user.pinergy_id, login.credit_cards[0].cc_token, 20))
+            assert c.balance(bypass_cache=True).balance == pytest.approx(before + 20)
+            assert len(c.get_top_up_history().top_ups) == history + 1
+            assert c.get_level_pay_usage().daily.n_days == 14
+            c.logout()
+            with pytest.raises(PinergyAuthError):
+                c.balance()
+            with pytest.raises(PinergyAPIError):
+                c.login("user1@example.com", "wrong")
+        assert server.stats["/balance"] == 3
+
+    def test_injected_429_is_retried(self) -> None:
+        faults = Faults(throttle_rate=0.5, retry_after=0)
+        with MockPinergyServer(MockPinergyAPI(accounts=1, days=7), faults=faults, seed=3) as server:
+            c = PinergyClient(base_url=server.url, auth_token="mock-token-0", retry=RetryPolicy(total=20))
+            for _ in range(10):
+                assert c.balance().success
+            c.close()
+        assert server.stats["429"] > 0
+        assert server.stats["/balance"] == 10 + server.stats["429"]
+
+    def test_errors_resets_and_slow_bodies(self) -> None:
+        api = MockPinergyAPI(accounts=1, days=7)
+        path_faults = {
+            "/usage": Faults(error_rate=1.0),
+            "/compare": Faults(reset_rate=1.0),
+            "/balance": Faults(slow_body_rate=1.0, slow_body_seconds=0.2),
+        }
+        with MockPinergyServer(api, path_faults=path_faults) as server:
+            c = PinergyClient(base_url=server.url, auth_token="mock-token-0")
+            with pytest.raises(PinergyAPIError) as exc:
+                c.get_usage()
+            assert exc.value.status_code in (500, 502, 503)
+            with pytest.raises(requests.ConnectionError):
+                c.compare()
+            start = time.perf_counter()
+            resp = requests.get(f"{server.url}/balance", headers={"auth_token": "mock-token-0"}, timeout=5)
+            assert resp.json()["success"]
+            assert resp.elapsed.total_seconds() < 0.15 <= time.perf_counter() - start  # headers first, then body
+            c.close()
+        assert server.stats["slow_body"] == 1 and server.stats["reset"] == 1
@@ -190,3 +190,73 @@ class TestNestedModels:
         )
         assert r.success is True
         assert "daily" in r.usage_data
+
+
+class TestLevelPayUsageTyped:
+    RAW = {
+        "success": True,
+        "usageData": {
+            "daily": {
+                "labels": ["00:00", "00:30", "01:00"],
+                "values": [
+                    {
+                        "label": "20/02",
+                        "daykWh": {"Total": 3.0, "Drive": 2.0, "Standard": 1.0},
+                        "dayEuro": {"Total": 0.6, "Drive": 0.2, "Standard": 0.4},
+                        "halfHourlykWh": [1.0, 2.0, None],
+                        "halfHourlyEuro": [0.1, 0.5],
+                    },
+                    {
+                        "label": "21/02",
+                        "daykWh": {"Total": 6.0, "Standard": 6.0},
+                        "dayEuro": {"Total": 1.2, "Standard": 1.2},
+                        "halfHourlykWh": [3.0, 2.0, 1.0, 9.0],
+                        "halfHourlyEuro": [0.6, 0.4, 0.2],
+                    },
+                ],
+            },
+            "weekly": {
+                "labels": ["09/02", "16/02"],
+                "weeklykWh": [{"label": "Standard", "usage": [1.0, 2.0]}, {"label": "Drive", "usage": [3.0]}],
+                "weeklyEuro": [{"label": "Drive", "usage": [0.3, None]}, {"label": "Standard", "usage": [0.1, 0.2]}],
+            },
+            "seven_days": {
+                "labels": ["Mon"],
+                "day_kwh": [{"label": "Standard", "usage": [4.0]}],
+                "day_euro": [{"label": "Standard", "usage": [0.8]}],
+            },
+        },
+    }
+
+    def test_daily_half_hourly_is_columnar(self) -> None:
+        r = LevelPayUsage.from_dict(self.RAW)
+        daily = r.daily
+        assert daily is not None
+        assert (daily.n_days, daily.n_slots) == (2, 3)
+        assert daily.half_hourly_kwh.typecode == "d"
+        assert list(daily.half_hourly_kwh) == [1.0, 2.0, 0.0, 3.0, 2.0, 1.0]
+        assert daily.kwh(1, 0) == 3.0
+        assert daily.euro(0, 2) == 0.0
+        assert daily.day_kwh_slots(1).tolist() == [3.0, 2.0, 1.0]
+
+    def test_daily_plan_matrix(self) -> None:
+        daily = LevelPayUsage.from_dict(self.RAW).daily
+        assert daily is not None
+        assert list(daily.total_kwh) == [3.0, 6.0]
+        assert daily.day_kwh.plans == ["Drive", "Standard"]
+        assert daily.day_kwh.row(daily.day_kwh.plan_index("Drive")).tolist() == [2.0, 0.0]
+        assert daily.day_euro.value(1, 1) == 1.2
+
+    def test_periods_align_euro_to_kwh_plans(self) -> None:
+        weekly = LevelPayUsage.from_dict(self.RAW).weekly
+        assert weekly is not None
+        assert weekly.plans == ["Standard", "Drive"]
+        assert list(weekly.kwh.values) == [1.0, 2.0, 3.0, 0.0]
+        assert list(weekly.euro.values) == [0.1, 0.2, 0.3, 0.0]
+
+    def test_snake_case_keys_and_missing_sections(self) -> None:
+        r = LevelPayUsage.from_dict(self.RAW)
+        assert r.seven_days is not None
+        assert r.seven_days.kwh.value(0, 0) == 4.0
+        assert r.monthly is None
+        assert "daily" in r.usage_data
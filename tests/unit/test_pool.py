@@ -0,0 +1,79 @@
+"""Unit tests for PinergyClientPool."""
+
+import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from requests_mock import Mocker
+
+from pinergy_client.cache import ResponseCache
+from pinergy_client.pool import PinergyClientPool
+
+
+class TestPinergyClientPool:
+    def test_one_client_per_thread_and_token_sharing_one_adapter(self, base_url: str) -> None:
+        with PinergyClientPool(base_url=base_url) as pool:
+            a = pool.client("a")
+            assert pool.client("a") is a
+            assert pool.client("b") is not a
+            other: list = []
+            t = threading.Thread(target=lambda: other.append(pool.client("a")))
+            t.start()
+            t.join()
+            assert other[0] is not a
+            assert pool.size == 3
+            adapters = {id(c._session.get_adapter(base_url)) for c in (a, pool.client("b"), other[0])}
+            assert adapters == {id(pool._adapter)}
+
+    def test_concurrent_accounts_never_see_each_others_tokens(self, base_url: str) -> None:
+        tokens = [f"token-{i}" for i in range(8)]
+
+        def balance(request, context):
+            return {"success": True, "balance": float(request.headers["auth_token"].split("-")[1])}
+
+        with PinergyClientPool(base_url=base_url) as pool, Mocker() as m:
+            m.get(f"{base_url}/balance", json=balance)
+            with ThreadPoolExecutor(4) as ex:
+                results = list(ex.map(lambda t: pool.client(t).balance().balance, tokens * 5))
+        assert results == [float(i) for i in range(8)] * 5
+
+    def test_client_kwargs_shared(self, base_url: str) -> None:
+        cache = ResponseCache()
+        with PinergyClientPool(base_url=base_url, cache=cache) as pool:
+            assert pool.client("a").cache is cache
+
+    def test_closing_a_client_keeps_pool_usable(self, base_url: str) -> None:
+        with PinergyClientPool(base_url=base_url) as pool, Mocker() as m:
+            m.get(f"{base_url}/balance", json={"success": True, "balance": 1.0})
+            pool.client("a").close()
+            assert pool.client("b").balance().balance == 1.0
+
+    def test_closed_pool_refuses_new_clients(self, base_url: str) -> None:
+        pool = PinergyClientPool(base_url=base_url)
+        pool.close()
+        with pytest.raises(RuntimeError):
+            pool.client("a")
+
+    def test_clients_per_thread_are_capped_and_dropped_with_the_thread(self, base_url: str) -> None:
+        with PinergyClientPool(base_url=base_url, clients_per_thread=2) as pool:
+            a = pool.client("a")
+            pool.client("b")
+            assert pool.client("a") is a  # a is now the most recently used
+            pool.client("c")  # evicts b
+            assert pool.size == 2
+            assert pool.client("a") is a and pool.client("b") is not a
+            t = threading.Thread(target=lambda: [pool.client(f"t{i}") for i in range(5)])
+            t.start()
+            t.join()
+            del t
+            gc.collect()
+            assert pool.size == 2
+
+    def test_clients_share_one_metrics(self, base_url: str) -> None:
+        with PinergyClientPool(base_url=base_url) as pool, Mocker() as m:
+            m.get(f"{base_url}/balance", json={"success": True, "balance": 1.0})
+            with ThreadPoolExecutor(4) as ex:
+                list(ex.map(lambda t: pool.client(t).balance(), ["a", "b"] * 4))
+            assert pool.client("a").metrics is pool.metrics
+            assert pool.metrics.as_dict()["GET /balance"]["requests"] == 8
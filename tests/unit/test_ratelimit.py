@@ -0,0 +1,68 @@
+"""Unit tests for the client-side token-bucket rate limiter."""
+
+import json
+from pathlib import Path
+
+import pytest
+from requests_mock import Mocker
+
+from pinergy_client.client import PinergyClient
+from pinergy_client.exceptions import PinergyAPIError, PinergyRateLimitError
+from pinergy_client.ratelimit import RateLimiter
+
+
+class TestRateLimiter:
+    def test_burst_then_queue_then_reject(self, clock) -> None:
+        limiter = RateLimiter(rate=1.0, burst=2, max_wait=2.5, clock=clock)
+        assert [limiter.reserve() for _ in range(4)] == [0.0, 0.0, 1.0, 2.0]
+        with pytest.raises(PinergyRateLimitError) as exc:
+            limiter.reserve()
+        assert exc.value.retry_in == 3.0
+        assert isinstance(exc.value, PinergyAPIError)
+        assert (limiter.waited, limiter.rejected) == (2, 1)
+
+    def test_refills_over_time(self, clock) -> None:
+        limiter = RateLimiter(rate=2.0, burst=1, clock=clock)
+        assert limiter.reserve() == 0.0
+        assert limiter.reserve() == 0.5
+        clock.now += 5
+        assert limiter.reserve() == 0.0
+
+    def test_per_token_buckets(self, clock) -> None:
+        limiter = RateLimiter(rate=1.0, burst=1, per_token=True, clock=clock)
+        assert limiter.reserve("a") == 0.0
+        assert limiter.reserve("b") == 0.0
+        assert limiter.reserve("a") == 1.0
+        shared = RateLimiter(rate=1.0, burst=1, clock=clock)
+        assert [shared.reserve("a"), shared.reserve("b")] == [0.0, 1.0]
+
+    def test_call_max_wait_lowers_bound(self, clock) -> None:
+        limiter = RateLimiter(rate=1.0, burst=1, max_wait=10, clock=clock)
+        limiter.reserve()
+        with pytest.raises(PinergyRateLimitError):
+            limiter.reserve(max_wait=0.5)
+
+    def test_file_backend_shares_budget(self, clock, tmp_path: Path) -> None:
+        path = tmp_path / "limits" / "ratelimit.json"
+        a = RateLimiter(rate=1.0, burst=1, per_token=True, path=path, clock=clock)
+        b = RateLimiter(rate=1.0, burst=1, per_token=True, path=path, clock=clock)
+        assert a.reserve("secret-token") == 0.0
+        assert b.reserve("secret-token") == 1.0
+        assert "secret-token" not in path.read_text()
+        assert path.stat().st_mode & 0o777 == 0o600
+        clock.now += 60
+        assert b.reserve("other") == 0.0
+        assert len(json.loads(path.read_text())) == 1  # the refilled bucket was dropped
+
+
+class TestClientRateLimit:
+    def test_over_limit_fails_before_sending(self, base_url: str) -> None:
+        limiter = RateLimiter(rate=0.1, burst=1, max_wait=0)
+        a = PinergyClient(base_url=base_url, auth_token="a", rate_limit=limiter)
+        b = PinergyClient(base_url=base_url, auth_token="b", rate_limit=limiter)
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", json={"success": True})
+            a.balance()
+            with pytest.raises(PinergyRateLimitError):
+                b.balance()
+            assert m.call_count == 1
@@ -0,0 +1,146 @@
+"""Unit tests for single-flight request coalescing."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+from requests_mock import Mocker
+
+from pinergy_client.async_client import AsyncPinergyClient
+from pinergy_client.client import PinergyClient
+from pinergy_client.exceptions import PinergyAPIError, PinergyDeadlineExceeded
+from pinergy_client.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def _run_threads(n: int, target) -> None:
+    threads = [threading.Thread(target=target) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_result(self) -> None:
+        group = SingleFlight()
+        calls = 0
+        results: list[int] = []
+
+        def work() -> int:
+            nonlocal calls
+            calls += 1
+            time.sleep(0.05)
+            return 42
+
+        _run_threads(8, lambda: results.append(group.do("k", work)))
+        assert results == [42] * 8
+        assert calls == 1
+        assert group.shared == 7
+
+    def test_exception_shared_and_not_remembered(self) -> None:
+        group = SingleFlight()
+        errors: list[BaseException] = []
+
+        def fail() -> int:
+            time.sleep(0.05)
+            raise ValueError("boom")
+
+        def call() -> None:
+            try:
+                group.do("k", fail)
+            except ValueError as e:
+                errors.append(e)
+
+        _run_threads(4, call)
+        assert len(errors) == 4
+        assert group.do("k", lambda: 1) == 1
+
+    def test_follower_timeout_leaves_leader_running(self) -> None:
+        group = SingleFlight()
+        release = threading.Event()
+        results: list[int] = []
+        leader = threading.Thread(target=lambda: results.append(group.do("k", lambda: release.wait() and 7)))
+        leader.start()
+        while not group._calls:
+            time.sleep(0.001)
+        with pytest.raises(TimeoutError):
+            group.do("k", lambda: 0, timeout=0.01)
+        release.set()
+        leader.join()
+        assert results == [7]
+
+    def test_async_group(self) -> None:
+        group = AsyncSingleFlight()
+        calls = 0
+
+        async def work() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        async def run() -> list[str]:
+            return await asyncio.gather(*(group.do("k", work) for _ in range(5)))
+
+        assert asyncio.run(run()) == ["ok"] * 5
+        assert calls == 1
+
+
+class TestClientCoalescing:
+    def test_sync_client_coalesces_gets(self, base_url: str) -> None:
+        c = PinergyClient(base_url=base_url, auth_token="t", coalesce=True)
+        balances: list[float] = []
+
+        def slow_balance(request, context):
+            time.sleep(0.1)
+            return {"success": True, "balance": 9.0}
+
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", json=slow_balance)
+            _run_threads(6, lambda: balances.append(c.balance().balance))
+            assert m.call_count == 1
+        assert balances == [9.0] * 6
+
+    def test_async_client_coalesces_errors(self, base_url: str) -> None:
+        calls = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(500, json={"message": "down"})
+
+        async def run() -> list:
+            async with AsyncPinergyClient(
+                base_url=base_url, auth_token="t", coalesce=True, transport=httpx.MockTransport(handler)
+            ) as c:
+                return await asyncio.gather(*(c.balance() for _ in range(5)), return_exceptions=True)
+
+        results = asyncio.run(run())
+        assert calls == 1
+        assert all(isinstance(r, PinergyAPIError) for r in results)
+
+    def test_async_leader_deadline_does_not_fail_followers(self, base_url: str) -> None:
+        calls = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.3)
+            return httpx.Response(200, json={"success": True, "balance": 4.0})
+
+        async def run() -> list:
+            async with AsyncPinergyClient(
+                base_url=base_url, auth_token="t", coalesce=True, transport=httpx.MockTransport(handler)
+            ) as c:
+                leader = asyncio.create_task(c.balance(deadline=0.05))
+                await asyncio.sleep(0)
+                follower = asyncio.create_task(c.balance(deadline=5))
+                return await asyncio.gather(leader, follower, return_exceptions=True)
+
+        leader, follower = asyncio.run(run())
+        assert isinstance(leader, PinergyDeadlineExceeded)
+        assert follower.balance == 4.0
+        assert calls == 1
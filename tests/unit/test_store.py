@@ -0,0 +1,89 @@
+"""Unit tests for the local half-hourly usage store."""
+
+from array import array
+from datetime import date
+
+import pytest
+from requests_mock import Mocker
+
+from pinergy_client.client import PinergyClient
+from pinergy_client.models import LevelPayDaily
+from pinergy_client.store import UsageStore, resolve_day_label, slot_timestamp, sync_usage
+
+TODAY = date(2025, 3, 2)
+
+
+def _daily(labels: list[str], base: float) -> LevelPayDaily:
+    n = len(labels)
+    return LevelPayDaily(
+        slot_labels=["00:00", "00:30"],
+        day_labels=labels,
+        half_hourly_kwh=array("d", [base + i for i in range(2 * n)]),
+        half_hourly_euro=array("d", [0.1] * (2 * n)),
+    )
+
+
+class TestResolveDayLabel:
+    def test_year_less_labels_resolve_backwards(self) -> None:
+        assert resolve_day_label("01/03", TODAY) == date(2025, 3, 1)
+        assert resolve_day_label("31/12", TODAY) == date(2024, 12, 31)
+        assert resolve_day_label("29/02", TODAY) == date(2024, 2, 29)
+
+    def test_explicit_formats(self) -> None:
+        assert resolve_day_label("2025-01-05") == date(2025, 1, 5)
+        assert resolve_day_label("05/01/25") == date(2025, 1, 5)
+        with pytest.raises(ValueError):
+            resolve_day_label("Monday")
+
+    def test_slot_timestamp_is_local_time(self) -> None:
+        # Irish winter time is UTC; summer time is UTC+1
+        assert slot_timestamp(date(2025, 1, 1), 1) == 1735691400
+        assert slot_timestamp(date(2025, 7, 1), 0) == 1751324400
+
+
+class TestUsageStore:
+    def test_merge_dedupes_and_tracks_high_water(self) -> None:
+        with UsageStore() as store:
+            first = store.merge("P1", _daily(["27/02", "28/02"], 0.0), today=TODAY)
+            assert (first.written, first.skipped) == (4, 0)
+            assert first.high_water_ts == slot_timestamp(date(2025, 2, 28), 1)
+            # Overlapping window: 27/02 is final and skipped, 28/02 refreshed, 01/03 new
+            second = store.merge("P1", _daily(["27/02", "28/02", "01/03"], 10.0), today=TODAY)
+            assert (second.written, second.skipped) == (4, 2)
+            assert store.high_water_mark("P1") == slot_timestamp(date(2025, 3, 1), 1)
+            rows = list(store.read("P1"))
+            assert [(r.day.isoformat(), r.slot, r.kwh) for r in rows] == [
+                ("2025-02-27", 0, 0.0),
+                ("2025-02-27", 1, 1.0),
+                ("2025-02-28", 0, 12.0),
+                ("2025-02-28", 1, 13.0),
+                ("2025-03-01", 0, 14.0),
+                ("2025-03-01", 1, 15.0),
+            ]
+            assert [r.day for r in store.read("P1", start=date(2025, 3, 1))] == [date(2025, 3, 1)] * 2
+            assert store.premises() == ["P1"]
+
+    def test_persists_to_file(self, tmp_path) -> None:
+        path = tmp_path / "usage.sqlite3"
+        with UsageStore(path) as store:
+            store.merge("P1", _daily(["01/03"], 1.0), today=TODAY)
+        with UsageStore(path) as store:
+            assert len(list(store.read("P1"))) == 2
+            assert store.high_water_mark("P2") is None
+
+    def test_sync_usage_from_client(self, base_url: str) -> None:
+        payload = {
+            "success": True,
+            "usageData": {
+                "daily": {
+                    "labels": ["00:00", "00:30"],
+                    "values": [{"label": "01/03", "halfHourlykWh": [1.5, 2.5], "halfHourlyEuro": [0.3, 0.5]}],
+                }
+            },
+        }
+        client = PinergyClient(base_url=base_url, auth_token="t")
+        with Mocker() as m, UsageStore() as store:
+            m.get(f"{base_url}/levelPayUsage", json=payload)
+            result = sync_usage(client, store, "P1", today=TODAY)
+            assert result.written == 2
+            assert [r.euro for r in store.read("P1")] == [0.3, 0.5]
@@ -0,0 +1,98 @@
+"""Unit tests for the persistent token store (mocked HTTP)."""
+
+import os
+import stat
+import sys
+import threading
+
+import pytest
+from requests_mock import Mocker
+
+from pinergy_client.client import PinergyClient
+from pinergy_client.exceptions import PinergyAuthError
+from pinergy_client.token_store import TokenStore, cached_login, default_cache_dir
+
+
+class TestTokenStore:
+    def test_save_get_forget(self, tmp_path) -> None:
+        store = TokenStore(tmp_path / "pinergy" / "tokens.json")
+        assert store.get("a@b.ie") is None
+        store.save("A@B.ie ", "tok", "dev")
+        entry = TokenStore(store.path).get("a@b.ie")
+        assert (entry.auth_token, entry.device_token) == ("tok", "dev")
+        store.forget("a@b.ie")
+        entry = store.get("a@b.ie")
+        assert (entry.auth_token, entry.device_token) == ("", "dev")
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_file_and_dir_are_private(self, tmp_path) -> None:
+        store = TokenStore(tmp_path / "pinergy" / "tokens.json")
+        store.save("a@b.ie", "tok")
+        assert stat.S_IMODE(os.stat(store.path).st_mode) == 0o600
+        assert stat.S_IMODE(os.stat(store.path.parent).st_mode) == 0o700
+
+    def test_device_token_is_stable(self, tmp_path) -> None:
+        store = TokenStore(tmp_path / "tokens.json")
+        first = store.device_token("a@b.ie")
+        assert first.startswith("APA91")
+        assert TokenStore(store.path).device_token("a@b.ie") == first
+
+    def test_concurrent_saves_are_all_kept(self, tmp_path) -> None:
+        path = tmp_path / "tokens.json"
+        shared = TokenStore(path)
+        # Even threads share one store (thread lock), odd ones open their own (file lock)
+        stores = [shared if i % 2 == 0 else TokenStore(path) for i in range(40)]
+        threads = [
+            threading.Thread(target=store.save, args=(f"user{i}@b.ie", f"tok{i}", f"dev{i}"))
+            for i, store in enumerate(stores)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for i in range(40):
+            entry = shared.get(f"user{i}@b.ie")
+            assert entry is not None and (entry.auth_token, entry.device_token) == (f"tok{i}", f"dev{i}")
+
+    def test_corrupt_file_is_ignored(self, tmp_path) -> None:
+        path = tmp_path / "tokens.json"
+        path.write_text("{not json")
+        assert TokenStore(path).get("a@b.ie") is None
+
+    def test_default_dir_override(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.setenv("PINERGY_CACHE_DIR", str(tmp_path))
+        assert default_cache_dir() == tmp_path
+        assert TokenStore().path == tmp_path / "tokens.json"
+
+
+class TestCachedLogin:
+    def test_logs_in_once_then_reuses_cached_token(self, base_url: str, tmp_path) -> None:
+        store = TokenStore(tmp_path / "tokens.json")
+        with Mocker() as m:
+            login = m.post(f"{base_url}/login", json={"success": True, "auth_token": "fresh"})
+            with PinergyClient(base_url=base_url, auth_token="") as c:
+                assert cached_login(c, store, "a@b.ie", "pw") == "fresh"
+            with PinergyClient(base_url=base_url, auth_token="") as c:
+                assert cached_login(c, store, "a@b.ie", "pw") == "fresh"
+                assert c.auth_token == "fresh"
+        assert login.call_count == 1
+        assert login.last_request.json()["device_token"] == store.get("a@b.ie").device_token
+
+    def test_force_relogs_in_with_same_device_token(self, base_url: str, tmp_path) -> None:
+        store = TokenStore(tmp_path / "tokens.json")
+        store.save("a@b.ie", "stale", "dev-1")
+        with Mocker() as m:
+            login = m.post(f"{base_url}/login", json={"success": True, "auth_token": "fresh"})
+            with PinergyClient(base_url=base_url, auth_token="") as c:
+                assert cached_login(c, store, "a@b.ie", "pw", force=True) == "fresh"
+        assert login.last_request.json()["device_token"] == "dev-1"
+        assert store.get("a@b.ie").auth_token == "fresh"
+
+    def test_failed_login_clears_cache(self, base_url: str, tmp_path) -> None:
+        store = TokenStore(tmp_path / "tokens.json")
+        store.save("a@b.ie", "stale", "dev-1")
+        with Mocker() as m:
+            m.post(f"{base_url}/login", json={"success": True, "auth_token": ""})
+            with PinergyClient(base_url=base_url, auth_token="") as c, pytest.raises(PinergyAuthError):
+                cached_login(c, store, "a@b.ie", "pw", force=True)
+        assert store.get("a@b.ie").auth_token == ""
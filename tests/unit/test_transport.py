@@ -0,0 +1,179 @@
+"""Unit tests for RetryPolicy, timeouts/deadlines and the client's retrying transport."""
+
+import time
+
+import pytest
+import requests
+from requests_mock import Mocker
+
+from pinergy_client.client import PinergyClient
+from pinergy_client.exceptions import PinergyAPIError, PinergyDeadlineExceeded
+from pinergy_client.mockserver import Faults, MockPinergyAPI, MockPinergyServer
+from pinergy_client.models import TopUpRequest
+from pinergy_client.transport import RetryPolicy, parse_retry_after
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    recorded: list[float] = []
+    monkeypatch.setattr("pinergy_client.client.time.sleep", recorded.append)
+    return recorded
+
+
+class TestRetryPolicy:
+    def test_backoff_is_exponential_and_capped(self) -> None:
+        policy = RetryPolicy(backoff_factor=1.0, backoff_max=5.0, jitter=0.0)
+        assert [policy.backoff(a) for a in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_jitter_stays_within_bounds(self) -> None:
+        policy = RetryPolicy(backoff_factor=1.0, jitter=0.5)
+        for _ in range(50):
+            assert 2.0 <= policy.backoff(2) <= 4.0
+
+    def test_post_not_retried_unless_connect_failed(self) -> None:
+        policy = RetryPolicy(jitter=0.0)
+        assert policy.next_delay("POST", 0, status=503) is None
+        assert policy.next_delay("POST", 0) is None
+        assert policy.next_delay("POST", 0, connect_failed=True) == 0.5
+
+    def test_status_and_attempt_limits(self) -> None:
+        policy = RetryPolicy(total=2, jitter=0.0)
+        assert policy.next_delay("GET", 0, status=500) is None
+        assert policy.next_delay("GET", 1, status=502) == 1.0
+        assert policy.next_delay("GET", 2, status=502) is None
+
+    def test_retry_after_header(self) -> None:
+        policy = RetryPolicy(retry_after_max=10.0)
+        assert policy.next_delay("GET", 0, status=429, headers={"Retry-After": "7"}) == 7.0
+        assert policy.next_delay("GET", 0, status=503, headers={"Retry-After": "600"}) == 10.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+
+
+class TestClientRetries:
+    def test_get_retried_until_success(self, base_url: str, sleeps: list[float]) -> None:
+        c = PinergyClient(base_url=base_url, auth_token="t", retry=RetryPolicy(jitter=0.0))
+        with Mocker() as m:
+            m.get(
+                f"{base_url}/balance",
+                [
+                    {"status_code": 502, "json": {}},
+                    {"status_code": 429, "json": {}, "headers": {"Retry-After": "3"}},
+                    {"json": {"success": True, "balance": 4.0}},
+                ],
+            )
+            assert c.balance().balance == 4.0
+            assert m.call_count == 3
+        assert sleeps == [0.5, 3.0]
+
+    def test_connection_error_retried(self, base_url: str, sleeps: list[float]) -> None:
+        c = PinergyClient(base_url=base_url, auth_token="t", retry=RetryPolicy(total=1))
+        with Mocker() as m:
+            m.get(
+                f"{base_url}/usage",
+                [{"exc": requests.ConnectionError}, {"json": {"success": True}}],
+            )
+            assert c.get_usage().success is True
+        assert len(sleeps) == 1
+
+    def test_top_up_never_retried(self, base_url: str, sleeps: list[float]) -> None:
+        c = PinergyClient(base_url=base_url, auth_token="t", retry=RetryPolicy())
+        with Mocker() as m:
+            m.post(f"{base_url}/topup", status_code=503, json={"message": "Unavailable"})
+            with pytest.raises(PinergyAPIError):
+                c.top_up(TopUpRequest(pinergy_id="p", cc_token="cc", amount=10.0))
+            assert m.call_count == 1
+        assert sleeps == []
+
+    def test_no_retry_by_default(self, base_url: str, sleeps: list[float]) -> None:
+        c = PinergyClient(base_url=base_url, auth_token="t")
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", status_code=502, json={})
+            with pytest.raises(PinergyAPIError):
+                c.balance()
+            assert m.call_count == 1
+
+    def test_pool_and_keep_alive_options(self, base_url: str) -> None:
+        c = PinergyClient(base_url=base_url, pool_maxsize=32, pool_block=True, keep_alive=False)
+        adapter = c._session.get_adapter(base_url)
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is True
+        assert c._session.headers["Connection"] == "close"
+
+
+class TestTimeoutsAndDeadlines:
+    def test_per_endpoint_timeouts(self, base_url: str) -> None:
+        c = PinergyClient(base_url=base_url, auth_token="t", timeouts={"levelPayUsage": (10, 120), "/balance": 5})
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", json={"success": True})
+            m.get(f"{base_url}/levelPayUsage", json={"success": True})
+            m.get(f"{base_url}/usage", json={"success": True})
+            c.balance()
+            assert m.last_request.timeout == (5.0, 5.0)
+            c.get_level_pay_usage()
+            assert m.last_request.timeout == (10.0, 120.0)
+            c.get_usage()
+            assert m.last_request.timeout == (90, 90)
+
+    def test_deadline_caps_attempt_timeout(self, base_url: str) -> None:
+        c = PinergyClient(base_url=base_url, auth_token="t")
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", json={"success": True})
+            c.balance(deadline=2.0)
+            connect, read = m.last_request.timeout
+        assert 1.5 < connect <= 2.0 and 1.5 < read <= 2.0
+
+    def test_deadline_stops_retries(self, base_url: str, sleeps: list[float]) -> None:
+        c = PinergyClient(base_url=base_url, auth_token="t", retry=RetryPolicy(backoff_factor=5.0, jitter=0.0))
+        with Mocker() as m:
+            m.get(f"{base_url}/usage", exc=requests.ConnectionError)
+            with pytest.raises(PinergyDeadlineExceeded):
+                c.get_usage(deadline=1.0)
+            assert m.call_count == 1
+        assert sleeps == []
+
+    def test_last_response_surfaces_when_no_time_to_retry(self, base_url: str, sleeps: list[float]) -> None:
+        c = PinergyClient(base_url=base_url, auth_token="t", retry=RetryPolicy(jitter=0.0))
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", status_code=429, json={}, headers={"Retry-After": "30"})
+            with pytest.raises(PinergyAPIError) as exc:
+                c.balance(deadline=1.0)
+            assert exc.value.status_code == 429
+            assert m.call_count == 1
+        assert sleeps == []
+
+    def test_timeout_after_deadline_is_deadline_exceeded(
+        self, base_url: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        now = [0.0]
+        monkeypatch.setattr("pinergy_client.transport.time.monotonic", lambda: now[0])
+
+        def slow(request, context):
+            now[0] += 3.0
+            raise requests.ReadTimeout
+
+        c = PinergyClient(base_url=base_url, auth_token="t")
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", json=slow)
+            with pytest.raises(PinergyDeadlineExceeded) as exc:
+                c.balance(deadline=2.0)
+        assert isinstance(exc.value, TimeoutError)
+
+    def test_deadline_must_be_positive(self, base_url: str) -> None:
+        with pytest.raises(ValueError):
+            PinergyClient(base_url=base_url, auth_token="t").balance(deadline=0)
+
+    def test_deadline_covers_lazy_login_and_relogin(self) -> None:
+        slow_login = {"/login": Faults(latency=1.5)}
+        with MockPinergyServer(MockPinergyAPI(accounts=1, days=1), path_faults=slow_login) as server:
+            c = PinergyClient(base_url=server.url, credentials=("user0@example.com", "password0"))
+            start = time.perf_counter()
+            with pytest.raises(PinergyDeadlineExceeded):
+                c.balance(deadline=0.3)
+            assert time.perf_counter() - start < 1.0
+            c.set_auth_token("expired")  # 401 -> re-login, bounded by the same deadline
+            start = time.perf_counter()
+            with pytest.raises(PinergyDeadlineExceeded):
+                c.balance(deadline=0.3)
+            assert time.perf_counter() - start < 1.0
+            c.close()
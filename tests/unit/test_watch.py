@@ -0,0 +1,78 @@
+"""Unit tests for the adaptive balance watcher (mocked HTTP, fake clock)."""
+
+from requests_mock import Mocker
+
+from pinergy_client.exceptions import PinergyAPIError
+from pinergy_client.models import BalanceResponse
+from pinergy_client.watch import BalanceWatcher, WatchPolicy, WatchState, next_interval
+
+POLICY = WatchPolicy(min_interval=60, max_interval=1800, initial_interval=300, backoff=2, urgent_interval=120, grace=30)
+
+
+class TestNextInterval:
+    def test_backs_off_while_static(self) -> None:
+        state = WatchState(interval=300)
+        resp = BalanceResponse(last_reading=1000)
+        assert next_interval(POLICY, state, resp, 2000) == (300, False)
+        assert next_interval(POLICY, state, resp, 2300) == (600, False)
+        assert next_interval(POLICY, state, resp, 2900) == (1200, False)
+        assert next_interval(POLICY, state, resp, 4100) == (1800, False)  # capped
+
+    def test_change_schedules_after_next_expected_reading(self) -> None:
+        state = WatchState(interval=300)
+        next_interval(POLICY, state, BalanceResponse(last_reading=10_000), 10_100)
+        interval, changed = next_interval(POLICY, state, BalanceResponse(last_reading=10_900), 11_000)
+        assert changed
+        assert state.cadence == 900
+        assert interval == 10_900 + 900 + 30 - 11_000  # 830s
+
+    def test_urgent_flags_cap_interval(self) -> None:
+        state = WatchState(interval=1800, last_reading=1000)
+        interval, _ = next_interval(POLICY, state, BalanceResponse(last_reading=1000, credit_low=True), 5000)
+        assert interval == 120
+        assert state.interval == 1800  # backoff state kept for when the flag clears
+
+
+class TestBalanceWatcher:
+    def test_polls_each_account_on_its_own_schedule(self, base_url: str, clock) -> None:
+        with Mocker() as m:
+            m.get(
+                f"{base_url}/balance",
+                [
+                    {"json": {"success": True, "balance": 5.0, "last_reading": 100}},
+                    {"json": {"success": True, "balance": 5.0, "last_reading": 100}},
+                    {"json": {"success": True, "balance": 4.0, "last_reading": 100, "credit_low": True}},
+                ],
+            )
+            with BalanceWatcher(["t1"], base_url=base_url, policy=POLICY, clock=clock, sleep=clock.sleep) as w:
+                events = list(w.run(max_polls=3))
+        assert [e.next_poll_in for e in events] == [300, 600, 120]
+        assert clock.now == 1_000_000 + 300 + 600
+        assert events[2].balance.credit_low
+        assert all(r.headers["auth_token"] == "t1" for r in m.request_history)
+
+    def test_error_backs_off_and_continues(self, base_url: str, clock) -> None:
+        with Mocker() as m:
+            m.get(
+                f"{base_url}/balance",
+                [
+                    {"status_code": 503, "json": {"message": "down"}},
+                    {"json": {"success": True, "balance": 1.0, "last_reading": 50}},
+                ],
+            )
+            with BalanceWatcher(["t1"], base_url=base_url, policy=POLICY, clock=clock, sleep=clock.sleep) as w:
+                first, second = list(w.run(max_polls=2))
+        assert isinstance(first.error, PinergyAPIError)
+        assert first.next_poll_in == 600
+        assert second.balance.balance == 1.0
+
+    def test_stop_ends_run(self, base_url: str, clock) -> None:
+        with Mocker() as m:
+            m.get(f"{base_url}/balance", json={"success": True, "last_reading": 1})
+            w = BalanceWatcher(["t1", "t2"], base_url=base_url, clock=clock, sleep=clock.sleep)
+            seen = []
+            for event in w.run():
+                seen.append(event.account.name)
+                w.stop()
+            w.close()
+        assert seen == ["account-0"]